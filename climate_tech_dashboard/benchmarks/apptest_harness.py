@@ -0,0 +1,188 @@
+"""
+페이지 재실행 지연 측정 (Streamlit AppTest, 브라우저 없이 실행)
+
+main.py와 pages/의 각 스크립트를 streamlit.testing.v1.AppTest로 실제로 실행하고
+사이드바 선택(연도/분야/규모/기술), top_n 슬라이더, 지도 타입, '상세 분석 보기' 체크박스 등을
+바꿔 가며 스크립트 전체 재실행 시간(CSS st.markdown, 모든 차트 포함)을 기록합니다.
+
+- cold: 위젯 값을 바꾼 직후 첫 재실행 (초기 로드는 새 프로세스의 첫 실행 - import, 데이터 로드 포함)
+- warm: 값을 그대로 두고 다시 실행 (--repeat회 중앙값)
+- 스크립트마다 새 프로세스에서 실행해 앞 페이지가 채운 저장소/모듈이 다음 측정에 섞이지 않음
+- --size를 주면 합성 데이터(data/synthetic.py)를 DASHBOARD_DATA_ROOT로 지정해 실행
+
+    python benchmarks/apptest_harness.py --repeat 5
+    python benchmarks/apptest_harness.py --size 100 --scripts pages/overseas.py --timeout 120
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+# 상위 디렉토리 추가 (python benchmarks/apptest_harness.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import (PACKAGE_DIR, BenchmarkResults, load_results, median_ms, print_comparison,
+                               size_label, synthetic_data_dir)
+from data.synthetic import SYNTHETIC_SEED
+
+# 스크립트별 상호작용 (이름, 위젯 종류, 라벨, 값)
+# 선택 위젯의 정수 값은 선택지 위치 (데이터 규모에 따라 선택지가 달라도 같은 동작)
+INITIAL = '초기 로드'
+INTERACTIONS = {
+    'main.py': [],
+    'pages/institutions.py': [
+        ('연도 변경', 'selectbox', '연도', 1),
+        ('기관 규모 선택', 'selectbox', '기관 규모', 1),
+        ('분야 선택', 'selectbox', '기후기술 분야', 1),
+        ('지표 변경', 'selectbox', '데이터 종류', 2)
+    ],
+    'pages/patents.py': [
+        ('연도 변경', 'selectbox', '연도', 1),
+        ('분야 선택', 'selectbox', '기후기술 분야', 1),
+        ('top_n 슬라이더', 'slider', '표시할 기술 수', 30),
+        ('상세 분석 보기', 'checkbox', '📋 상세 분석 보기', True)
+    ],
+    'pages/lifecycle.py': [
+        ('연도 변경', 'selectbox', '연도', 1),
+        ('분야 선택', 'selectbox', '기후기술 분야', 1),
+        ('기술 선택', 'selectbox', '기후기술 종류', 1),
+        ('상세 분석 보기', 'checkbox', '📋 상세 분석 보기', True)
+    ],
+    'pages/overseas.py': [
+        ('연도 변경', 'selectbox', '연도', 1),
+        ('분야 선택', 'selectbox', '기후기술 분야', 1),
+        ('지도: 애니메이션', 'selectbox', '지도 타입', 1),
+        ('지도: 3D 지구본', 'selectbox', '지도 타입', 2)
+    ],
+    'pages/classification.py': [
+        ('분야 선택', 'selectbox', '기후기술 분야', 1),
+        ('기술 선택', 'selectbox', '기후기술 종류', 1),
+        ('선버스트차트', 'radio', '차트 유형', '선버스트차트'),
+        ('상세정보 표시', 'checkbox', '상세정보 표시', True)
+    ],
+    'pages/data_management.py': []
+}
+
+def find_widget(at, kind, label):
+    """라벨로 위젯 찾기 (사이드바 포함)"""
+    for widget in getattr(at, kind):
+        if widget.label == label:
+            return widget
+    raise LookupError(f'{kind} "{label}" 없음')
+
+def apply_interaction(at, kind, label, value):
+    """위젯 값 변경 (다음 run()에 반영)"""
+    widget = find_widget(at, kind, label)
+    if kind == 'selectbox':
+        widget.select_index(min(value, len(widget.options) - 1))
+    elif kind == 'checkbox':
+        widget.check() if value else widget.uncheck()
+    else:
+        widget.set_value(value)
+
+def timed_run(at):
+    """재실행 시간 (ms)과 스크립트 예외"""
+    start = time.perf_counter()
+    at.run()
+    elapsed = (time.perf_counter() - start) * 1000
+    return elapsed, [exception.value for exception in at.exception]
+
+def measure_script(script, repeat, timeout):
+    """스크립트 하나의 상호작용별 cold/warm 재실행 시간 (작업 프로세스에서 실행)"""
+    from streamlit.testing.v1 import AppTest
+
+    # 페이지의 use_container_width 지원 중단 안내 등 Streamlit 로그가 측정 출력과 섞이지 않게 함
+    logging.disable(logging.WARNING)
+    records = []
+    at = AppTest.from_file(str(PACKAGE_DIR / script), default_timeout=timeout)
+    steps = [(INITIAL, None, None, None)] + INTERACTIONS[script]
+
+    for case, kind, label, value in steps:
+        record = {'case': case, 'errors': []}
+        try:
+            if kind is not None:
+                apply_interaction(at, kind, label, value)
+            cold_ms, errors = timed_run(at)
+            warm = [timed_run(at) for _ in range(repeat)]
+        except Exception as e:
+            # 상호작용 하나가 실패해도 나머지는 계속 측정
+            record['errors'].append(f'{type(e).__name__}: {str(e)}')
+            record['traceback'] = traceback.format_exc(limit=3)
+            records.append(record)
+            continue
+
+        record['cold_ms'] = round(cold_ms, 3)
+        record['wall_ms'] = median_ms([elapsed for elapsed, _ in warm])
+        record['errors'] = errors + [error for _, errs in warm for error in errs]
+        record['elements'] = len(list(at.main)) + len(list(at.sidebar))
+        records.append(record)
+    return records
+
+def prepare_data_root(size, seed):
+    """합성 데이터 폴더를 앱 데이터 폴더로 지정 (분류체계 등 scraped 파일은 실제 데이터 사용)"""
+    data_dir = synthetic_data_dir(size, seed)
+    # 페이지를 실행하는 작업 프로세스가 시작 시 읽음 (환경 변수 상속)
+    os.environ['DASHBOARD_DATA_ROOT'] = str(data_dir)
+
+    scraped_dir = data_dir / 'scraped'
+    if not scraped_dir.exists():
+        source = PACKAGE_DIR / 'assets' / 'data' / 'scraped'
+        try:
+            scraped_dir.symlink_to(source, target_is_directory=True)
+        except OSError:
+            shutil.copytree(source, scraped_dir)
+    return data_dir
+
+def report(record):
+    if 'cold_ms' not in record:
+        print(f"   ❌ {record['case']:<18} {'; '.join(record['errors'])}")
+        return
+    mark = '⚠️' if record['errors'] else '⏱️'
+    print(f"   {mark} {record['case']:<18} cold {record['cold_ms']:9.1f}ms   "
+          f"warm {record['wall_ms']['median']:9.1f}ms (최소 {record['wall_ms']['min']:.1f}ms)   "
+          f"요소 {record['elements']}개")
+    for error in record['errors'][:1]:
+        print(f"      ↳ {error}")
+
+def main():
+    parser = argparse.ArgumentParser(description='페이지 재실행 지연 측정 (AppTest)')
+    parser.add_argument('--scripts', nargs='+', choices=list(INTERACTIONS), default=list(INTERACTIONS),
+                        help='측정할 스크립트')
+    parser.add_argument('--size', type=float, help='합성 데이터 규모 (없으면 현재 데이터 폴더)')
+    parser.add_argument('--seed', type=int, default=SYNTHETIC_SEED, help='합성 데이터 시드')
+    parser.add_argument('--repeat', type=int, default=5, help='warm 재실행 횟수')
+    parser.add_argument('--timeout', type=float, default=60, help='재실행 제한 시간 (초)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/apptest-<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+
+    if args.size is not None:
+        data_dir = prepare_data_root(args.size, args.seed)
+        print(f"📏 합성 데이터 {size_label(args.size)}배 ({data_dir})")
+
+    results = BenchmarkResults('apptest', params=vars(args))
+    spawn = multiprocessing.get_context('spawn')
+    for script in args.scripts:
+        print(f"\n📄 {script}")
+        # 스크립트마다 새 프로세스 (cold 초기 로드 = 새 서버 프로세스의 첫 요청)
+        with ProcessPoolExecutor(max_workers=1, mp_context=spawn) as executor:
+            records = executor.submit(measure_script, script, args.repeat, args.timeout).result()
+        for record in records:
+            report(record)
+            case = record.pop('case')
+            results.add(script, case, args.size, record)
+
+    path = results.save(args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        print_comparison(results.to_dict(), load_results(args.compare))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+"""
+CTIS 분류체계 파서 벤치마크
+
+저장된 분류체계 페이지(fixtures/ctis_classification.html)로
+- 기존 방식: 문서 전체를 html.parser로 파싱 후 CSS 선택자 + 고정 행 위치
+- 구조 파서: #table_box 표만 읽고 rowspan 격자 한 번 순회 (lxml.html / html.parser)
+의 파싱 시간을 비교하고, 구조 파서 결과가 분류체계 CSV와 같은지 확인합니다.
+
+    python benchmarks/bench_classification_parser.py --repeat 20 --scale 10
+"""
+
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+from bs4 import BeautifulSoup
+
+# 상위 디렉토리 추가 (python benchmarks/bench_classification_parser.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import data.ctis_parser as ctis_parser
+from data.ctis_parser import parse_classification_table
+
+FIXTURE = Path(__file__).parent / 'fixtures' / 'ctis_classification.html'
+EXPECTED_CSV = Path(__file__).parent.parent / 'assets' / 'data' / 'scraped' / 'climate_tech_classification.csv'
+
+def scale_fixture(html, scale):
+    """tbody 행을 scale배로 늘린 페이지 (큰 표에서의 확장성 확인용)"""
+    if scale <= 1:
+        return html
+    match = re.search(r'(<tbody>)(.*?)(</tbody>)', html, re.S)
+    return html[:match.start(2)] + match.group(2) * scale + html[match.end(2):]
+
+def legacy_parse(html):
+    """기존 방식: 문서 전체 파싱 + 고정 위치 + 소분류마다 위치 목록 역순 탐색"""
+    soup = BeautifulSoup(html, 'html.parser')
+    l3_elements = soup.select('#table_box > table > tbody > tr > td.bgw')
+    table_rows = soup.select('#table_box > table > tbody > tr')
+
+    l2_positions = [1, 4, 12, 14, 16, 18, 21, 23, 27, 31, 33, 36, 38, 41]
+    l1_positions = [1, 23, 41]
+    l2_data = {pos: table_rows[pos - 1].find_all('td')[0].get_text(strip=True)
+               for pos in l2_positions if pos <= len(table_rows)}
+    l1_data = {pos: table_rows[pos - 1].find_all('td')[0].get_text(strip=True)
+               for pos in l1_positions if pos <= len(table_rows)}
+
+    records = []
+    current_l1 = current_l2 = ''
+    for no, element in enumerate(l3_elements, 1):
+        for pos in sorted(l1_positions, reverse=True):
+            if no >= pos and pos in l1_data:
+                current_l1 = l1_data[pos]
+                break
+        for pos in sorted(l2_positions, reverse=True):
+            if no >= pos and pos in l2_data:
+                current_l2 = l2_data[pos]
+                break
+        records.append((current_l1, current_l2, ' '.join(element.get_text().split()), no))
+    return records
+
+def parse_with(use_lxml):
+    """구조 파서를 지정한 백엔드로 실행하는 함수"""
+    def parse(html):
+        original = ctis_parser.lxml_html
+        if not use_lxml:
+            ctis_parser.lxml_html = None
+        try:
+            return parse_classification_table(html)
+        finally:
+            ctis_parser.lxml_html = original
+    return parse
+
+def measure(func, html, repeat):
+    """반복 실행 시간 (ms)"""
+    func(html)  # 워밍업
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(html)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+def check_against_csv(html):
+    """구조 파서 결과와 분류체계 CSV 비교"""
+    if not EXPECTED_CSV.exists():
+        print(f"   ⚠️ 비교할 CSV 없음: {EXPECTED_CSV}")
+        return True
+
+    expected = pd.read_csv(EXPECTED_CSV, encoding='utf-8-sig')
+    parsed = pd.DataFrame(parse_classification_table(html))[expected.columns]
+    if parsed.equals(expected):
+        print(f"   ✅ 구조 파서 결과 = 분류체계 CSV ({len(parsed)}개 항목)")
+        return True
+
+    print("   ❌ 구조 파서 결과가 분류체계 CSV와 다릅니다")
+    print(parsed.compare(expected) if parsed.shape == expected.shape else parsed.head())
+    return False
+
+def main():
+    parser = argparse.ArgumentParser(description='CTIS 분류체계 파서 벤치마크')
+    parser.add_argument('--repeat', type=int, default=20, help='반복 횟수')
+    parser.add_argument('--scale', type=int, default=1, help='표 행 배수')
+    args = parser.parse_args()
+
+    html = FIXTURE.read_text(encoding='utf-8')
+    if not check_against_csv(html):
+        sys.exit(1)
+
+    html = scale_fixture(html, args.scale)
+    print(f"📄 페이지 {len(html) / 1024:.0f}KB, 표 행 배수 {args.scale}, 반복 {args.repeat}회")
+
+    candidates = [('기존 (전체 문서, html.parser)', legacy_parse)]
+    if ctis_parser.lxml_html is not None:
+        candidates.append(('구조 파서 (#table_box, lxml)', parse_with(True)))
+    else:
+        print("   ⚠️ lxml 없음 - 건너뜀")
+    candidates.append(('구조 파서 (#table_box, html.parser)', parse_with(False)))
+
+    baseline = None
+    for label, func in candidates:
+        timings = measure(func, html, args.repeat)
+        median = statistics.median(timings)
+        baseline = baseline or median
+        print(f"   ⏱️ {label:<32} 중앙값 {median:8.2f}ms  최소 {min(timings):8.2f}ms  ({baseline / median:.1f}배)")
+
+if __name__ == "__main__":
+    main()
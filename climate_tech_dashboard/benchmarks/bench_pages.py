@@ -0,0 +1,219 @@
+"""
+페이지 데이터 함수 · ETL 벤치마크
+
+규모별 합성 데이터(data/synthetic.py, 1 = 현재 KOSIS 통계표)로
+- 데이터: 처리 데이터셋/큐브 파케이 읽기, 큐브 계산(큐브 파일이 없을 때의 대체 경로)
+- 페이지: 각 페이지 main()이 기본 선택값(최신 연도, 분야 '전체')으로 호출하는 필터/차트 함수
+- ETL: RealDataProcessor 데이터셋 파이프라인 (raw 읽기 → 변환 → 검증 → CSV/파케이/큐브 저장)
+의 벽시계 시간, 최대 할당량, 차트 JSON 크기를 측정해 benchmarks/results에 JSON으로 저장합니다.
+
+    python benchmarks/bench_pages.py --sizes 1 10 100 --repeat 5
+    python benchmarks/bench_pages.py --sizes 1000 --skip-pages --etl-chunksize 50000
+    python benchmarks/bench_pages.py --compare benchmarks/results/pages-20260101-120000.json
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pandas as pd
+
+# 상위 디렉토리 추가 (python benchmarks/bench_pages.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.common import (BenchmarkResults, load_page_module, load_results, measure, print_comparison,
+                               synthetic_data_dir)
+from data.aggregates import build_cube, cube_filename, dataset_cubes
+from data.process_real_data import PIPELINES, RealDataProcessor
+from data.synthetic import SYNTHETIC_SEED
+
+CLASSIFICATION_CSV = Path(__file__).parent.parent / 'assets' / 'data' / 'scraped' / 'climate_tech_classification.csv'
+
+# 페이지 스크립트 → 사용하는 처리 데이터셋
+PAGE_DATASETS = {
+    'pages/institutions.py': 'institution_data',
+    'pages/patents.py': 'patent_data',
+    'pages/lifecycle.py': 'lifecycle_data',
+    'pages/overseas.py': 'overseas_data',
+    'pages/classification.py': None
+}
+
+def institution_cases(page, cubes):
+    cube = cubes['institution_by_tech']
+    year = cube['year'].max()
+    filtered = page.filter_institution_data(cube, '전체', '전체', year)
+    return [
+        ('filter_institution_data', page.filter_institution_data, (cube, '전체', '전체', year)),
+        ('create_bar_chart', page.create_bar_chart, (filtered, 'revenue', '기술 종류별 매출액')),
+        ('create_correlation_scatter', page.create_correlation_scatter, (filtered, 'revenue', 'employees', '전체')),
+        ('calculate_correlation', page.calculate_correlation, (filtered, 'revenue', 'employees'))
+    ]
+
+def patent_cases(page, cubes):
+    cube, year_cube = cubes['patent_by_tech'], cubes['patent_by_year']
+    year = year_cube['year'].max()
+    filtered = page.filter_patent_data(cube, year, '전체')
+    return [
+        ('filter_patent_data', page.filter_patent_data, (cube, year, '전체')),
+        ('create_patent_bar_chart', page.create_patent_bar_chart, (filtered, 15)),
+        ('create_field_comparison_chart', page.create_field_comparison_chart, (filtered,)),
+        ('create_yearly_trend_chart', page.create_yearly_trend_chart, (year_cube, '전체')),
+        ('create_category_heatmap', page.create_category_heatmap, (filtered,))
+    ]
+
+def lifecycle_cases(page, cubes):
+    cube, stage_cube = cubes['lifecycle_by_tech'], cubes['lifecycle_by_stage']
+    year = stage_cube['year'].max()
+    stages = (stage_cube.drop_duplicates('lifecycle_stage')
+              .sort_values('stage_order', kind='stable')['lifecycle_stage'].tolist())
+    filtered = page.filter_lifecycle_data(cube, year, '전체', '전체')
+    return [
+        ('filter_lifecycle_data', page.filter_lifecycle_data, (cube, year, '전체', '전체')),
+        ('create_stage_summary_table', page.create_stage_summary_table, (filtered,)),
+        ('create_lifecycle_line_chart', page.create_lifecycle_line_chart, (filtered, stages)),
+        ('create_stage_distribution_chart', page.create_stage_distribution_chart, (filtered,)),
+        ('create_tech_maturity_radar', page.create_tech_maturity_radar, (filtered,)),
+        ('create_field_stage_heatmap', page.create_field_stage_heatmap, (filtered,))
+    ]
+
+def overseas_cases(page, cubes):
+    cube, year_cube = cubes['overseas_by_tech'], cubes['overseas_by_year']
+    year = year_cube['year'].max()
+    filtered = page.filter_overseas_data(cube, year, '전체')
+    return [
+        ('filter_overseas_data', page.filter_overseas_data, (cube, year, '전체')),
+        ('create_arc_flow_map', page.create_arc_flow_map, (filtered,)),
+        ('create_animated_flow_map', page.create_animated_flow_map, (filtered,)),
+        ('create_3d_globe_flow', page.create_3d_globe_flow, (filtered,)),
+        ('get_top7_data', page.get_top7_data, (filtered,)),
+        ('create_region_chart', page.create_region_chart, (filtered,)),
+        ('create_tech_chart', page.create_tech_chart, (filtered,)),
+        ('create_flow_diagram', page.create_flow_diagram, (filtered,))
+    ]
+
+def classification_cases(page, data):
+    return [
+        ('filter_data', page.filter_data, (data, '전체', '전체')),
+        ('create_pie_chart', page.create_pie_chart, (data, 'L2')),
+        ('create_sunburst_chart', page.create_sunburst_chart, (data,))
+    ]
+
+PAGE_CASES = {
+    'pages/institutions.py': institution_cases,
+    'pages/patents.py': patent_cases,
+    'pages/lifecycle.py': lifecycle_cases,
+    'pages/overseas.py': overseas_cases,
+    'pages/classification.py': classification_cases
+}
+
+def scaled_classification(size):
+    """분류체계를 size배로 늘린 데이터 (소분류 이름에 일련번호)"""
+    base = pd.read_csv(CLASSIFICATION_CSV, encoding='utf-8-sig')
+    copies = max(1, round(size))
+    if copies == 1:
+        return base
+    scaled = pd.concat([base] * copies, ignore_index=True)
+    scaled['L3_소분류'] = scaled['L3_소분류'] + '-' + (scaled.index // len(base)).astype(str)
+    scaled['No'] = range(1, len(scaled) + 1)
+    return scaled
+
+def report(entry):
+    """측정 결과 한 줄 출력"""
+    line = f"   ⏱️ {entry['case']:<34} {entry['wall_ms']['median']:9.2f}ms"
+    if entry.get('peak_kb') is not None:
+        line += f"  최대 {entry['peak_kb'] / 1024:8.1f}MB"
+    if entry.get('payload_bytes') is not None:
+        line += f"  차트 {entry['payload_bytes'] / 1024:8.1f}KB ({entry['serialize_ms']:.1f}ms)"
+    print(line)
+
+def bench_data(results, size, data_dir, repeat, trace_memory):
+    """처리 데이터셋/큐브 읽기와 큐브 계산"""
+    print("\n📂 데이터 읽기 · 큐브 계산")
+    processed_dir = data_dir / 'processed'
+    datasets = {}
+    for name in filter(None, PAGE_DATASETS.values()):
+        path = processed_dir / f'{name}.parquet'
+        record, datasets[name] = measure(pd.read_parquet, path, engine='pyarrow', repeat=repeat,
+                                         trace_memory=trace_memory)
+        report(results.add('data', f'read:{name}', size, record, input_rows=len(datasets[name])))
+
+        for cube_name in dataset_cubes(name):
+            record, _ = measure(build_cube, cube_name, datasets[name], repeat=repeat, trace_memory=trace_memory)
+            report(results.add('data', f'build_cube:{cube_name}', size, record, input_rows=len(datasets[name])))
+    return datasets
+
+def load_cubes(data_dir, name):
+    """ETL(합성 데이터 생성기)이 저장한 큐브"""
+    return {cube_name: pd.read_parquet(data_dir / 'processed' / cube_filename(cube_name), engine='pyarrow')
+            for cube_name in dataset_cubes(name)}
+
+def bench_pages(results, size, data_dir, repeat, trace_memory, pages):
+    """페이지별 필터/차트 함수"""
+    for script in pages:
+        page = load_page_module(script)
+        name = PAGE_DATASETS[script]
+        inputs = load_cubes(data_dir, name) if name else scaled_classification(size)
+        input_rows = sum(len(cube) for cube in inputs.values()) if name else len(inputs)
+        print(f"\n📄 {script} (입력 {input_rows:,}행)")
+
+        for case, func, args in PAGE_CASES[script](page, inputs):
+            record, _ = measure(func, *args, repeat=repeat, trace_memory=trace_memory)
+            input_len = len(args[0]) if isinstance(args[0], pd.DataFrame) else None
+            report(results.add(script, case, size, record, input_rows=input_len))
+
+def bench_etl(results, size, data_dir, repeat, trace_memory, chunksize):
+    """ETL 데이터셋 파이프라인 (출력은 임시 폴더, 스냅샷 게시 없음)"""
+    print(f"\n🏭 ETL (chunksize={chunksize})")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        processor = RealDataProcessor(data_dir / 'raw', Path(tmp_dir) / 'processed', chunksize=chunksize)
+        for name, pipeline in PIPELINES.items():
+            method = getattr(processor, pipeline['method'])
+            # 파이프라인 진행 메시지는 측정 결과 출력과 섞이지 않게 숨김
+            with contextlib.redirect_stdout(io.StringIO()):
+                record, _ = measure(method, repeat=repeat, warmup=0, trace_memory=trace_memory)
+            rows = len(pd.read_parquet(Path(tmp_dir) / 'processed' / f'{name}_data.parquet', columns=['year']))
+            report(results.add('etl', name, size, record, output_rows=rows, chunksize=chunksize))
+
+def main():
+    parser = argparse.ArgumentParser(description='페이지 데이터 함수 · ETL 벤치마크')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 10, 100],
+                        help='데이터 규모 (현재 통계표 대비 배수)')
+    parser.add_argument('--repeat', type=int, default=5, help='함수별 반복 횟수')
+    parser.add_argument('--etl-repeat', type=int, default=1, help='ETL 파이프라인 반복 횟수')
+    parser.add_argument('--etl-chunksize', type=int, default=None, help='ETL 스트리밍 처리 행 수')
+    parser.add_argument('--pages', nargs='+', choices=list(PAGE_CASES), default=list(PAGE_CASES),
+                        help='측정할 페이지')
+    parser.add_argument('--skip-pages', action='store_true', help='데이터/페이지 함수 측정 생략')
+    parser.add_argument('--skip-etl', action='store_true', help='ETL 측정 생략')
+    parser.add_argument('--no-memory', action='store_true', help='최대 할당량 측정 생략 (큰 규모에서 시간 절약)')
+    parser.add_argument('--seed', type=int, default=SYNTHETIC_SEED, help='합성 데이터 시드')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/pages-<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+
+    results = BenchmarkResults('pages', params=vars(args))
+    trace_memory = not args.no_memory
+
+    for size in args.sizes:
+        formats = ('processed',) if args.skip_etl else ('raw', 'processed')
+        data_dir = synthetic_data_dir(size, args.seed, formats=formats)
+        print(f"\n{'=' * 60}\n📏 규모 {size:g}배 ({data_dir})")
+
+        if not args.skip_pages:
+            bench_data(results, size, data_dir, args.repeat, trace_memory)
+            bench_pages(results, size, data_dir, args.repeat, trace_memory, args.pages)
+        if not args.skip_etl:
+            bench_etl(results, size, data_dir, args.etl_repeat, trace_memory, args.etl_chunksize)
+
+    path = results.save(args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        print_comparison(results.to_dict(), load_results(args.compare))
+
+if __name__ == "__main__":
+    main()
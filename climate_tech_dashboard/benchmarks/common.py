@@ -0,0 +1,228 @@
+"""
+벤치마크 공통 도구
+
+- 측정: 반복 실행 벽시계 시간(ms)과 tracemalloc 최대 할당량(별도 1회 실행, 시간 측정에 영향 없음)
+- 차트 전송량: plotly Figure를 JSON으로 직렬화한 바이트 수 (Streamlit이 브라우저로 보내는 크기)
+- 데이터: data/synthetic.py로 규모별 합성 데이터를 만들어 benchmarks/.data에 보관 후 재사용
+  (페이지를 실행하는 측정은 DASHBOARD_DATA_ROOT로 이 폴더를 데이터 폴더로 지정)
+- 결과: benchmarks/results/<이름>-<시각>.json 으로 저장하고 이전 결과와 중앙값 비교
+"""
+
+import importlib.util
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit.logger as streamlit_logger
+
+# 상위 디렉토리 추가 (benchmarks 스크립트 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Streamlit 실행 환경 밖에서 st 호출마다 남는 'missing ScriptRunContext' 경고 숨김
+streamlit_logger.set_log_level('error')
+
+from data.synthetic import MANIFEST_FILENAME, SyntheticGenerator
+
+BENCHMARK_DIR = Path(__file__).parent
+PACKAGE_DIR = BENCHMARK_DIR.parent
+RESULTS_DIR = BENCHMARK_DIR / 'results'
+DATA_CACHE_DIR = BENCHMARK_DIR / '.data'
+
+# 비교 시 이 비율 이상 느려지거나 빨라진 항목 표시
+CHANGE_THRESHOLD = 1.2
+
+def median_ms(timings):
+    """시간 목록 요약 (ms)"""
+    return {
+        'median': round(statistics.median(timings), 3),
+        'min': round(min(timings), 3),
+        'max': round(max(timings), 3),
+        'repeat': len(timings)
+    }
+
+def latency_summary(timings):
+    """지연 분포 요약 (ms) - median_ms에 p95/p99 추가 (부하 측정용)"""
+    summary = median_ms(timings)
+    p95, p99 = np.percentile(timings, [95, 99])
+    summary.update({'p95': round(float(p95), 3), 'p99': round(float(p99), 3)})
+    return summary
+
+def payload_bytes(result):
+    """결과가 plotly Figure면 JSON 직렬화 (바이트 수, ms), 아니면 (None, None)"""
+    to_json = getattr(result, 'to_json', None)
+    if to_json is None or isinstance(result, (pd.DataFrame, pd.Series)):
+        return None, None
+    start = time.perf_counter()
+    size = len(to_json().encode('utf-8'))
+    return size, round((time.perf_counter() - start) * 1000, 3)
+
+def result_rows(result):
+    """결과가 DataFrame이면 행 수"""
+    return len(result) if isinstance(result, pd.DataFrame) else None
+
+def measure(func, *args, repeat=5, warmup=1, trace_memory=True, **kwargs):
+    """함수 실행 측정 → (측정 기록, 마지막 결과)
+
+    시간은 warmup 후 repeat회, 최대 할당량은 tracemalloc을 켠 별도 1회 실행으로 측정
+    """
+    result = None
+    for _ in range(warmup):
+        result = func(*args, **kwargs)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        timings.append((time.perf_counter() - start) * 1000)
+
+    record = {'wall_ms': median_ms(timings)}
+    if trace_memory:
+        record['peak_kb'] = round(traced_peak(func, *args, **kwargs) / 1024, 1)
+
+    record['payload_bytes'], record['serialize_ms'] = payload_bytes(result)
+    record['result_rows'] = result_rows(result)
+    return record, result
+
+def traced_peak(func, *args, **kwargs):
+    """tracemalloc 기준 최대 할당량 (bytes, numpy 배열 포함 - Arrow 버퍼는 제외)"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        func(*args, **kwargs)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def load_page_module(script):
+    """페이지 스크립트를 main() 실행 없이 모듈로 로드 (함수 단위 측정용)
+
+    모듈 수준의 st.set_page_config/st.markdown은 Streamlit 실행 환경 밖이라 경고만 남기고 무시됨
+    """
+    path = PACKAGE_DIR / script
+    spec = importlib.util.spec_from_file_location(f'bench_{path.stem}', path)
+    module = importlib.util.module_from_spec(spec)
+    # 페이지 설정을 읽으며 Streamlit 로그 수준이 초기화되므로 실행 동안 경고를 끔
+    logging.disable(logging.WARNING)
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        logging.disable(logging.NOTSET)
+    return module
+
+def synthetic_data_dir(size, seed, formats=('processed',)):
+    """규모별 합성 데이터 폴더 (같은 설정으로 만든 데이터가 있으면 재사용)"""
+    output_dir = DATA_CACHE_DIR / f'size{size:g}-seed{seed}'
+    manifest_path = output_dir / MANIFEST_FILENAME
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if set(formats) <= set(json.load(f)['formats']):
+                return output_dir
+    except (FileNotFoundError, json.JSONDecodeError, KeyError):
+        pass
+
+    generator = SyntheticGenerator(output_dir, scale=size, seed=seed)
+    generator.generate(formats=sorted(set(formats) | {'processed'}))
+    return output_dir
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=PACKAGE_DIR,
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def environment_info():
+    """측정 환경 (결과 비교 시 확인용)"""
+    info = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'git_revision': git_revision()
+    }
+    for package in ('numpy', 'pandas', 'pyarrow', 'plotly', 'streamlit'):
+        try:
+            info[package] = __import__(package).__version__
+        except ImportError:
+            info[package] = None
+    return info
+
+class BenchmarkResults:
+    """측정 기록 모음 (JSON 저장/비교)"""
+
+    def __init__(self, name, params=None):
+        self.name = name
+        self.params = params or {}
+        self.records = []
+        # 시계열 등 항목별 기록이 아닌 부가 데이터 {이름: 목록}
+        self.series = {}
+        self.created_at = datetime.now()
+
+    def add(self, group, case, size, record, **extra):
+        entry = {'group': group, 'case': case, 'size': size, **extra, **record}
+        self.records.append(entry)
+        return entry
+
+    def to_dict(self):
+        return {
+            'benchmark': self.name,
+            'created_at': self.created_at.isoformat(),
+            'params': self.params,
+            'environment': environment_info(),
+            'results': self.records,
+            **({'series': self.series} if self.series else {})
+        }
+
+    def save(self, path=None):
+        """결과 JSON 저장 → 경로"""
+        path = Path(path) if path else RESULTS_DIR / f'{self.name}-{self.created_at:%Y%m%d-%H%M%S}.json'
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return path
+
+def load_results(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def size_label(size):
+    """규모 표시 (None = 합성 데이터가 아닌 현재 데이터 폴더)"""
+    return '현재 데이터' if size is None else f'규모 {size:g}'
+
+def record_key(record):
+    return record['group'], record['case'], record['size']
+
+def compare_results(current, baseline, metric='wall_ms'):
+    """이전 결과 대비 중앙값 비율 (현재 / 이전) → [(키, 이전, 현재, 비율)]"""
+    previous = {record_key(r): r for r in baseline['results'] if r.get(metric)}
+    rows = []
+    for record in current['results']:
+        before = previous.get(record_key(record))
+        if before is None or not record.get(metric):
+            continue
+        old, new = before[metric]['median'], record[metric]['median']
+        rows.append((record_key(record), old, new, new / old if old else None))
+    return rows
+
+def print_comparison(current, baseline, metric='wall_ms'):
+    """비교 결과 출력 (CHANGE_THRESHOLD 이상 변한 항목 표시)"""
+    rows = compare_results(current, baseline, metric)
+    print(f"\n🔍 이전 결과 대비 ({baseline.get('created_at', '?')}, {baseline['environment'].get('git_revision')})")
+    for (group, case, size), old, new, ratio in rows:
+        mark = ''
+        if ratio and ratio >= CHANGE_THRESHOLD:
+            mark = '🔺'
+        elif ratio and ratio <= 1 / CHANGE_THRESHOLD:
+            mark = '🔻'
+        ratio_text = f'{ratio:5.2f}배' if ratio else '   -  '
+        print(f"   {mark:2} {group}/{case} ({size_label(size)}): {old:9.2f}ms → {new:9.2f}ms  {ratio_text}")
+    return rows
@@ -0,0 +1,335 @@
+"""
+동시 세션 부하 측정 (AppTest, 외부 서비스 없이 로컬 실행)
+
+Streamlit 서버 프로세스 하나를 대신하는 작업 프로세스에서 세션 N개를 스레드로 동시에 실행합니다.
+각 세션은 사용자처럼 페이지를 열고(새 스크립트 실행), 사이드바 위젯을 바꾸고(재실행),
+생각 시간만큼 쉬기를 반복하며 데이터 저장소(get_data_repository)는 실제 서버처럼 모든 세션이 공유합니다.
+
+- 지연: 재실행 p50/p95/p99 (전체, 페이지별 초기 로드/상호작용, 캐시를 비운 직후 구간)
+- 처리량: 초당 완료한 재실행 수
+- 자원: 부모 프로세스가 작업 프로세스의 RSS/CPU를 psutil로 주기적으로 기록
+- --stampede: 지정한 시각에 데이터 관리 페이지의 '캐시 정리'와 같은 동작
+  (st.cache_data.clear() + 저장소 비우기)으로 모든 세션이 데이터를 동시에 다시 읽게 함
+
+    python benchmarks/load_test.py --sessions 8 --duration 60
+    python benchmarks/load_test.py --sessions 16 --think-time 0.5 --mix filter --stampede 20 40
+    python benchmarks/load_test.py --size 10 --pages pages/lifecycle.py=3 pages/patents.py=1
+"""
+
+import argparse
+import logging
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from queue import Empty
+
+import psutil
+from packaging.version import Version
+
+# 상위 디렉토리 추가 (python benchmarks/load_test.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.apptest_harness import INITIAL, INTERACTIONS, find_widget, prepare_data_root, timed_run
+from benchmarks.common import (PACKAGE_DIR, BenchmarkResults, latency_summary, load_results, print_comparison,
+                               size_label)
+from data.synthetic import SYNTHETIC_SEED
+
+# Runtime 조회 보완을 확인한 Streamlit 버전 범위 [이상, 미만)
+RUNTIME_PATCH_VERSIONS = ('1.45', '2.0')
+
+# 상호작용 구성: 다음 동작이 다른 페이지로 이동(새 스크립트 실행)일 확률, 나머지는 위젯 변경
+MIXES = {
+    'browse': 0.3,     # 페이지를 둘러보며 필터도 바꿈
+    'filter': 0.05,    # 한 페이지에서 필터를 계속 바꿈
+    'navigate': 0.8    # 페이지 이동 위주 (초기 로드 부하)
+}
+
+INTERACTION = '상호작용'
+
+def parse_pages(values):
+    """'스크립트=가중치' 목록 → {스크립트: 가중치}"""
+    pages = {}
+    for value in values:
+        script, _, weight = value.partition('=')
+        if script not in INTERACTIONS:
+            raise argparse.ArgumentTypeError(f'알 수 없는 스크립트: {script} (선택: {", ".join(INTERACTIONS)})')
+        try:
+            pages[script] = float(weight) if weight else 1.0
+        except ValueError:
+            raise argparse.ArgumentTypeError(f'가중치가 숫자가 아님: {value}')
+    return pages
+
+def apply_random_interaction(at, kind, label, rng):
+    """위젯을 임의 값으로 변경 (다음 run()에 반영)"""
+    widget = find_widget(at, kind, label)
+    if kind == 'selectbox':
+        widget.select_index(rng.randrange(len(widget.options)))
+    elif kind == 'radio':
+        widget.set_value(rng.choice(widget.options))
+    elif kind == 'checkbox':
+        widget.uncheck() if widget.value else widget.check()
+    elif kind == 'slider':
+        widget.set_value(rng.randint(int(widget.min), int(widget.max)))
+
+def run_session(index, config, started, samples):
+    """시뮬레이션 사용자 한 명 (작업 프로세스의 스레드에서 실행)"""
+    from streamlit.testing.v1 import AppTest
+
+    rng = random.Random(config['seed'] * 1000 + index)
+    scripts, weights = list(config['pages']), list(config['pages'].values())
+    deadline = started + config['duration']
+    # 세션 시작을 ramp_up 동안 고르게 분산
+    time.sleep(config['ramp_up'] * index / config['sessions'])
+
+    at, script = None, None
+    while time.time() < deadline:
+        sample = {'session': index}
+        try:
+            interactions = INTERACTIONS[script] if at is not None else []
+            if not interactions or rng.random() < config['navigate']:
+                script = rng.choices(scripts, weights)[0]
+                at = AppTest.from_file(str(PACKAGE_DIR / script), default_timeout=config['timeout'])
+                sample['action'] = INITIAL
+            else:
+                name, kind, label, _ = rng.choice(interactions)
+                sample['action'] = name
+                apply_random_interaction(at, kind, label, rng)
+            sample.update(script=script, start=round(time.time() - started, 3))
+            elapsed, errors = timed_run(at)
+            sample.update(ms=round(elapsed, 3), errors=[str(error) for error in errors])
+        except Exception as e:
+            # 위젯을 찾지 못했거나 제한 시간 초과 - 기록 후 다른 페이지로 이동
+            sample.setdefault('script', script)
+            sample.setdefault('start', round(time.time() - started, 3))
+            sample.update(ms=None, errors=[f'{type(e).__name__}: {str(e)}'])
+            at = None
+        samples.append(sample)
+
+        if config['think_time'] > 0:
+            think = rng.expovariate(1 / config['think_time'])
+            time.sleep(max(0.0, min(think, deadline - time.time())))
+
+def clear_caches(started, events):
+    """데이터 관리 페이지의 '캐시 정리' 버튼과 같은 동작"""
+    import streamlit as st
+    from data.data_loader import get_data_repository
+
+    st.cache_data.clear()
+    get_data_repository().clear()
+    events.append(round(time.time() - started, 3))
+
+def share_apptest_runtime():
+    """AppTest를 여러 스레드에서 동시에 실행할 수 있게 Runtime 조회를 보완
+
+    AppTest는 실행마다 Runtime._instance에 모의 Runtime을 넣고 끝나면 None으로 되돌리므로
+    (한 번에 한 실행 가정) 다른 세션의 실행이 끝나는 순간 진행 중인 세션이
+    "Runtime hasn't been created!"로 실패함 - None이면 마지막으로 본 모의 Runtime을 사용.
+    Streamlit 내부 구현에 의존하므로 확인한 버전 범위에서만 적용
+    """
+    import streamlit
+    from streamlit.runtime import Runtime
+
+    version = Version(streamlit.__version__)
+    low, high = (Version(v) for v in RUNTIME_PATCH_VERSIONS)
+    if not low <= version < high:
+        raise RuntimeError(f"Streamlit {version}: 동시 세션 실행 보완(Runtime.instance/exists)은 "
+                           f"{low} 이상 {high} 미만에서만 확인됨 - requirements.txt 버전으로 실행하세요")
+    missing = [name for name in ('_instance', 'instance', 'exists') if not hasattr(Runtime, name)]
+    if missing:
+        raise RuntimeError(f"Streamlit {version}의 Runtime에 {', '.join(missing)}이(가) 없어 "
+                           f"AppTest 세션을 동시에 실행할 수 없습니다")
+
+    last_seen = [None]
+
+    def instance(cls):
+        runtime = cls._instance or last_seen[0]
+        if runtime is None:
+            raise RuntimeError("Runtime hasn't been created!")
+        last_seen[0] = runtime
+        return runtime
+
+    def exists(cls):
+        return (cls._instance or last_seen[0]) is not None
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+
+def run_load(config, result_queue):
+    """세션 스레드 실행 → 결과를 큐로 전달 (작업 프로세스)"""
+    # 페이지의 지원 중단 안내 등 Streamlit 로그가 측정 출력과 섞이지 않게 함
+    logging.disable(logging.WARNING)
+    share_apptest_runtime()
+    samples, stampedes = [], []
+    started = time.time()
+
+    timers = [threading.Timer(offset, clear_caches, args=(started, stampedes)) for offset in config['stampede']]
+    threads = [threading.Thread(target=run_session, args=(i, config, started, samples), daemon=True)
+               for i in range(config['sessions'])]
+    for worker in timers + threads:
+        worker.start()
+    for thread in threads:
+        thread.join()
+    for timer in timers:
+        timer.cancel()
+
+    result_queue.put({'started': started, 'finished': time.time(), 'samples': samples, 'stampedes': stampedes})
+
+def resource_sample(process):
+    """작업 프로세스 자원 사용량 한 번 기록"""
+    with process.oneshot():
+        return {
+            'time': time.time(),
+            'rss_mb': round(process.memory_info().rss / 1024 ** 2, 1),
+            'cpu_percent': process.cpu_percent(None),
+            'threads': process.num_threads()
+        }
+
+def drive(config, sample_interval):
+    """작업 프로세스 실행 · 자원 기록 → (결과, 자원 시계열)"""
+    spawn = multiprocessing.get_context('spawn')
+    result_queue = spawn.Queue()
+    worker = spawn.Process(target=run_load, args=(config, result_queue), daemon=True)
+    worker.start()
+    process = psutil.Process(worker.pid)
+
+    result, timeline = None, []
+    while result is None:
+        try:
+            timeline.append(resource_sample(process))
+        except psutil.NoSuchProcess:
+            pass
+        try:
+            result = result_queue.get(timeout=sample_interval)
+        except Empty:
+            if not worker.is_alive():
+                raise RuntimeError(f'작업 프로세스가 결과 없이 종료됨 (종료 코드 {worker.exitcode})')
+    worker.join()
+
+    # 시각을 작업 프로세스 시작 기준 초로 변환하고 구간별 완료 재실행 수 추가
+    ends = sorted(s['start'] + s['ms'] / 1000 for s in result['samples'] if s['ms'] is not None)
+    previous = float('-inf')
+    for row in timeline:
+        row['t'] = round(row.pop('time') - result['started'], 2)
+        row['reruns'] = sum(previous < end <= row['t'] for end in ends)
+        previous = row['t']
+    return result, timeline
+
+def in_stampede(sample, stampedes, window):
+    return any(offset <= sample['start'] < offset + window for offset in stampedes)
+
+def latency_line(label, timings, duration=None):
+    if not timings:
+        return f"   {label:<28} 기록 없음"
+    summary = latency_summary(timings)
+    line = (f"   {label:<28} p50 {summary['median']:8.1f}ms  p95 {summary['p95']:8.1f}ms  "
+            f"p99 {summary['p99']:8.1f}ms  최대 {summary['max']:8.1f}ms  ({summary['repeat']}회)")
+    if duration:
+        line += f"  {summary['repeat'] / duration:.2f}회/초"
+    return line
+
+def summarize(results, result, timeline, size, window):
+    """지연 분포/처리량/자원 출력 및 결과 기록"""
+    samples, stampedes = result['samples'], result['stampedes']
+    done = [s for s in samples if s['ms'] is not None]
+    errors = sum(bool(s['errors']) for s in samples)
+    duration = result['finished'] - result['started']
+
+    print(f"\n📊 재실행 {len(done)}회 (오류 {errors}회), {duration:.1f}초")
+    print(latency_line('전체', [s['ms'] for s in done], duration))
+    results.add('load', 'all', size, {'wall_ms': latency_summary([s['ms'] for s in done])} if done else {},
+                errors=errors, throughput=round(len(done) / duration, 3))
+
+    print("\n📄 페이지별")
+    for script in sorted({s['script'] for s in done}):
+        for case in (INITIAL, INTERACTION):
+            timings = [s['ms'] for s in done
+                       if s['script'] == script and (s['action'] == INITIAL) == (case == INITIAL)]
+            if timings:
+                print(latency_line(f'{script} {case}', timings))
+                results.add(script, case, size, {'wall_ms': latency_summary(timings)})
+
+    if stampedes:
+        print(f"\n🌀 캐시 정리 {len(stampedes)}회 ({', '.join(f'{t:.1f}초' for t in stampedes)}) 후 {window:g}초")
+        for case, hit in (('stampede', True), ('steady', False)):
+            timings = [s['ms'] for s in done if in_stampede(s, stampedes, window) == hit]
+            print(latency_line('캐시 정리 직후' if hit else '그 외', timings))
+            if timings:
+                results.add('load', case, size, {'wall_ms': latency_summary(timings)})
+
+    if timeline:
+        print("\n📈 시간대별 작업 프로세스 (RSS, CPU, 완료 재실행)")
+        # 20줄 안팎으로 묶어 출력 (RSS는 구간 끝 값, CPU는 평균, 재실행은 합계)
+        step = max(1, len(timeline) // 20)
+        for i in range(0, len(timeline), step):
+            rows = timeline[i:i + step]
+            cpu = sum(row['cpu_percent'] for row in rows) / len(rows)
+            print(f"   {rows[-1]['t']:7.1f}초  RSS {rows[-1]['rss_mb']:8.1f}MB  CPU {cpu:6.1f}%  "
+                  f"재실행 {sum(row['reruns'] for row in rows):3d}회")
+        peak = max(timeline, key=lambda row: row['rss_mb'])
+        print(f"   최대 RSS {peak['rss_mb']:.1f}MB ({peak['t']:.1f}초)")
+
+    for sample in [s for s in samples if s['errors']][:3]:
+        print(f"   ⚠️ {sample['script']} {sample.get('action', '')}: {sample['errors'][0]}")
+
+    results.series['resources'] = timeline
+    results.series['stampedes'] = stampedes
+    results.series['samples'] = samples
+
+def main():
+    parser = argparse.ArgumentParser(description='동시 세션 부하 측정 (AppTest)')
+    parser.add_argument('--sessions', type=int, default=8, help='동시 세션 수')
+    parser.add_argument('--duration', type=float, default=60, help='측정 시간 (초)')
+    parser.add_argument('--ramp-up', type=float, default=5, help='세션 시작을 분산할 시간 (초)')
+    parser.add_argument('--think-time', type=float, default=1.0,
+                        help='동작 사이 평균 대기 시간 (초, 지수분포, 0 = 쉬지 않음)')
+    parser.add_argument('--mix', choices=list(MIXES), default='browse', help='상호작용 구성')
+    parser.add_argument('--pages', nargs='+', type=str, default=list(INTERACTIONS),
+                        help='방문할 스크립트 (스크립트=가중치 형식으로 비율 지정)')
+    parser.add_argument('--stampede', type=float, nargs='*', default=[],
+                        help='캐시를 비울 시각 (시작 후 초)')
+    parser.add_argument('--stampede-window', type=float, default=5, help='캐시 정리 직후로 볼 구간 (초)')
+    parser.add_argument('--sample-interval', type=float, default=0.5, help='RSS/CPU 기록 간격 (초)')
+    parser.add_argument('--size', type=float, help='합성 데이터 규모 (없으면 현재 데이터 폴더)')
+    parser.add_argument('--seed', type=int, default=SYNTHETIC_SEED, help='합성 데이터 · 세션 난수 시드')
+    parser.add_argument('--timeout', type=float, default=120, help='재실행 제한 시간 (초)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본: benchmarks/results/load-<시각>.json)')
+    parser.add_argument('--compare', help='비교할 이전 결과 JSON')
+    args = parser.parse_args()
+
+    try:
+        pages = parse_pages(args.pages)
+    except argparse.ArgumentTypeError as e:
+        parser.error(str(e))
+
+    if args.size is not None:
+        data_dir = prepare_data_root(args.size, args.seed)
+        print(f"📏 합성 데이터 {size_label(args.size)}배 ({data_dir})")
+
+    config = {
+        'sessions': args.sessions,
+        'duration': args.duration,
+        'ramp_up': args.ramp_up,
+        'think_time': args.think_time,
+        'navigate': MIXES[args.mix],
+        'pages': pages,
+        'stampede': args.stampede,
+        'seed': args.seed,
+        'timeout': args.timeout
+    }
+    print(f"🚦 세션 {args.sessions}개 × {args.duration:g}초 (구성 {args.mix}, 생각 시간 평균 {args.think_time:g}초)")
+
+    results = BenchmarkResults('load', params=vars(args))
+    result, timeline = drive(config, args.sample_interval)
+    summarize(results, result, timeline, args.size, args.stampede_window)
+
+    path = results.save(args.output)
+    print(f"\n💾 결과 저장: {path}")
+
+    if args.compare:
+        print_comparison(results.to_dict(), load_results(args.compare))
+
+if __name__ == "__main__":
+    main()
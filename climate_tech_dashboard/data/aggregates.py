@@ -0,0 +1,153 @@
+"""
+대시보드 집계 큐브
+
+ETL이 처리 데이터셋을 저장할 때 페이지가 쓰는 집계(연도 × 분야 × 규모/기술/지역)를 미리 계산해
+processed 폴더에 cube_<이름>.parquet로 함께 저장합니다 (스냅샷으로 같이 게시).
+페이지는 원본 행을 다시 묶지 않고 큐브를 조건으로 잘라 쓰므로
+화면 재실행 시간이 원본 행 수와 무관합니다.
+
+- 측정값은 합계로 저장하고 rows(원본 행 수)를 함께 두어 평균은 합계 / rows로 계산
+- 지역 좌표처럼 차원에 딸린 속성은 첫 값(first)
+- 스트리밍 처리 시 청크별 부분 집계를 합쳐 만듦 (부분 합계의 합계 = 전체 합계)
+"""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from data.schemas import DATASET_DTYPES
+
+# 큐브 파일 이름 접두어 (processed 폴더, 스냅샷 안에서 데이터셋 파일과 구분)
+CUBE_FILE_PREFIX = 'cube_'
+
+# 원본 행 수 컬럼 (평균 계산용)
+ROW_COUNT = 'rows'
+
+# 필터에서 '조건 없음'을 뜻하는 선택값
+ALL_LABEL = '전체'
+
+# 큐브 파일 압축 방식 (처리 데이터셋 파케이 사본과 동일)
+CUBE_COMPRESSION = 'zstd'
+
+# 부분 집계가 이만큼 쌓이면 한 번 합침 (스트리밍 처리 시 메모리 제한)
+COMPACT_EVERY = 16
+
+# 큐브 이름 → 원본 데이터셋, 차원, 측정값 집계 방식
+CUBES = {
+    'institution_by_tech': {
+        'dataset': 'institution_data',
+        'dimensions': ['year', 'field', 'scale', 'tech_type'],
+        'measures': {'revenue': 'sum', 'employees': 'sum', 'rd_cost': 'sum', 'researchers': 'sum'}
+    },
+    'patent_by_tech': {
+        'dataset': 'patent_data',
+        'dimensions': ['year', 'field', 'category', 'tech_name'],
+        'measures': {'patent_count': 'sum'}
+    },
+    'patent_by_year': {
+        'dataset': 'patent_data',
+        'dimensions': ['year', 'field'],
+        'measures': {'patent_count': 'sum'}
+    },
+    'lifecycle_by_tech': {
+        'dataset': 'lifecycle_data',
+        'dimensions': ['year', 'field', 'tech_name', 'lifecycle_stage'],
+        'measures': {'project_count': 'sum', 'stage_order': 'first'}
+    },
+    'lifecycle_by_stage': {
+        'dataset': 'lifecycle_data',
+        'dimensions': ['year', 'field', 'lifecycle_stage'],
+        'measures': {'project_count': 'sum', 'stage_order': 'first'}
+    },
+    'overseas_by_tech': {
+        'dataset': 'overseas_data',
+        'dimensions': ['year', 'field', 'region', 'tech_name'],
+        'measures': {'export_count': 'sum', 'latitude': 'first', 'longitude': 'first', 'countries': 'first'}
+    },
+    'overseas_by_year': {
+        'dataset': 'overseas_data',
+        'dimensions': ['year', 'field'],
+        'measures': {'export_count': 'sum'}
+    }
+}
+
+def cube_filename(name):
+    """큐브 파일 이름"""
+    return f'{CUBE_FILE_PREFIX}{name}.parquet'
+
+def dataset_cubes(dataset):
+    """데이터셋에서 만드는 큐브 이름"""
+    return [name for name, spec in CUBES.items() if spec['dataset'] == dataset]
+
+def cube_files(dataset):
+    """데이터셋 파이프라인이 만드는 큐브 파일 이름 (ETL 출력 목록용)"""
+    return [cube_filename(name) for name in dataset_cubes(dataset)]
+
+def aggregate(df, spec):
+    """차원별 측정값 집계 (원본 행이면 rows=1부터, 부분 집계면 rows 합계)"""
+    if ROW_COUNT not in df.columns:
+        df = df.assign(**{ROW_COUNT: 1})
+    agg = dict(spec['measures'], **{ROW_COUNT: 'sum'})
+    return df.groupby(spec['dimensions'], observed=True).agg(agg).reset_index()
+
+def finalize_cube(cube, spec):
+    """차원 컬럼에 데이터셋 스키마 dtype 적용 (측정값 합계는 넓은 정수 그대로)"""
+    dtypes = DATASET_DTYPES.get(spec['dataset'], {})
+    cube = cube.astype({col: dtypes[col] for col in spec['dimensions'] if col in dtypes})
+    return cube.sort_values(spec['dimensions'], ignore_index=True)
+
+def build_cube(name, df):
+    """데이터셋 전체로 큐브 하나 계산 (큐브 파일이 없을 때 대체용)"""
+    spec = CUBES[name]
+    return finalize_cube(aggregate(df, spec), spec)
+
+def write_cube(cube, cube_path):
+    """큐브 파케이 저장 (원자적 교체)"""
+    cube_path = Path(cube_path)
+    tmp_path = cube_path.with_name(f'{cube_path.name}.{os.getpid()}.tmp')
+    try:
+        pq.write_table(pa.Table.from_pandas(cube, preserve_index=False), tmp_path, compression=CUBE_COMPRESSION)
+        os.replace(tmp_path, cube_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+class CubeBuilder:
+    """데이터셋의 큐브를 청크 단위로 누적 집계 (ETL 저장과 함께 실행)"""
+
+    def __init__(self, dataset, processed_dir):
+        self.dataset = dataset
+        self.processed_dir = Path(processed_dir)
+        self.partials = {name: [] for name in dataset_cubes(dataset)}
+
+    def add(self, df):
+        """청크 하나를 큐브별 부분 집계로 추가"""
+        for name, partials in self.partials.items():
+            partials.append(aggregate(df, CUBES[name]))
+            if len(partials) >= COMPACT_EVERY:
+                partials[:] = [aggregate(pd.concat(partials, ignore_index=True), CUBES[name])]
+
+    def write(self):
+        """부분 집계를 합쳐 큐브 파일 저장 → 저장한 파일 경로"""
+        paths = []
+        for name, partials in self.partials.items():
+            if not partials:
+                continue
+            spec = CUBES[name]
+            cube = finalize_cube(aggregate(pd.concat(partials, ignore_index=True), spec), spec)
+            cube_path = self.processed_dir / cube_filename(name)
+            write_cube(cube, cube_path)
+            paths.append(cube_path)
+        return paths
+
+def slice_cube(cube, **filters):
+    """큐브에서 조건에 맞는 행 (값이 None이거나 '전체'인 조건은 무시)"""
+    mask = np.ones(len(cube), dtype=bool)
+    for column, value in filters.items():
+        if value is None or value == ALL_LABEL:
+            continue
+        mask &= (cube[column] == value).to_numpy()
+    return cube[mask]
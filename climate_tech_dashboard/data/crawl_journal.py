@@ -0,0 +1,122 @@
+"""
+크롤링 저널
+
+URL별 수집 결과(완료/실패, 응답 해시, 파싱 결과)를 JSONL에 한 줄씩 추가 기록합니다.
+수집은 실행(run) 단위로 기록하고, 실행이 중간에 끊기거나 일부 실패하면 다음 실행에서
+그 실행에서 완료된 URL만 건너뛰고 나머지를 이어서 수집할 수 있습니다.
+끝까지 완료된 실행 뒤의 새 실행은 모든 URL을 다시 요청합니다 (변경 여부는 ETag/내용 해시로 판단).
+"""
+
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+from data.paths import DATA_ROOT
+
+JOURNAL_PATH = DATA_ROOT / '.crawl_journal.jsonl'
+
+# 실행 시작/완료 기록 키 (URL 기록과 같은 파일에 저장)
+RUN_KEY = '#run'
+
+class CrawlJournal:
+    """URL별 최신 수집 결과 저널 (같은 URL은 마지막 기록이 유효)"""
+
+    def __init__(self, journal_path=JOURNAL_PATH):
+        self.journal_path = Path(journal_path)
+        self._lock = threading.Lock()
+        self.entries, line_count = self._load()
+        # 진행 중인 실행 ID (start_run 전에는 None → 건너뛰는 URL 없음)
+        self.run_id = None
+
+        # 같은 URL 기록이 많이 쌓였으면 최신 기록만 남기기
+        if line_count > 2 * max(len(self.entries), 1):
+            self.compact()
+
+    def _load(self):
+        entries = {}
+        line_count = 0
+        try:
+            with open(self.journal_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 기록 중 중단된 마지막 줄
+                    entries[entry['url']] = entry
+        except FileNotFoundError:
+            pass
+        return entries, line_count
+
+    def get(self, url):
+        return self.entries.get(url)
+
+    def interrupted_run(self):
+        """완료되지 않은 마지막 실행 ID (없으면 None)"""
+        run = self.entries.get(RUN_KEY)
+        if run and run['status'] == 'running':
+            return run['run']
+        return None
+
+    def start_run(self, resume=True):
+        """수집 실행 시작 → 실행 ID (resume=True면 중단된 실행을 이어 받음)"""
+        self.run_id = (resume and self.interrupted_run()) or uuid.uuid4().hex[:12]
+        self.record(RUN_KEY, 'running')
+        return self.run_id
+
+    def finish_run(self):
+        """수집 실행 완료 (다음 실행은 모든 URL을 다시 요청)"""
+        if self.run_id is not None:
+            self.record(RUN_KEY, 'finished')
+            self.run_id = None
+
+    def is_fresh(self, url):
+        """진행 중인 (이어 받은) 실행에서 이미 완료된 URL인지"""
+        entry = self.entries.get(url)
+        if not entry or entry['status'] != 'done' or self.run_id is None:
+            return False
+        return entry.get('run') == self.run_id
+
+    def record(self, url, status, **fields):
+        """수집 결과 한 줄 추가 (바로 디스크에 반영)"""
+        entry = {'url': url, 'status': status, 'time': datetime.now().isoformat(), 'run': self.run_id, **fields}
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+
+        with self._lock:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, 'a', encoding='utf-8') as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            self.entries[url] = entry
+
+        return entry
+
+    def record_done(self, url, sha256=None, **fields):
+        return self.record(url, 'done', sha256=sha256, **fields)
+
+    def record_failed(self, url, error):
+        # 이전에 받은 결과는 유지 (실패 시에도 기존 데이터로 테이블 구성 가능)
+        previous = self.entries.get(url) or {}
+        fields = {key: previous[key] for key in ('sha256', 'data') if key in previous}
+        return self.record(url, 'failed', error=str(error), **fields)
+
+    def compact(self):
+        """URL별 최신 기록만 남겨 다시 쓰기 (원자적 교체)"""
+        with self._lock:
+            tmp_path = self.journal_path.with_name(f'{self.journal_path.name}.{os.getpid()}.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for entry in self.entries.values():
+                    f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+            os.replace(tmp_path, self.journal_path)
+
+    def summary(self, urls):
+        """URL 목록의 상태별 개수"""
+        counts = {'done': 0, 'failed': 0, 'pending': 0}
+        for url in urls:
+            entry = self.entries.get(url)
+            counts[entry['status'] if entry else 'pending'] += 1
+        return counts
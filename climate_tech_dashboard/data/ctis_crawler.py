@@ -0,0 +1,77 @@
+"""
+CTIS 기후기술 상세정보 크롤러
+
+분류체계의 소분류(L3) 상세 페이지를 asyncio로 동시에 수집합니다.
+요청은 공유 HTTP 클라이언트(연결 풀·재시도·캐시)를 스레드에서 실행하고,
+전체 동시 요청 수(세마포어)와 호스트별 요청 간격(레이트 리미터)으로 제한합니다.
+"""
+
+import asyncio
+import time
+from urllib.parse import urlparse
+
+from data.ctis_parser import parse_detail_page
+
+# 동시에 진행할 최대 요청 수
+MAX_CONCURRENCY = 8
+
+# 호스트별 초당 최대 요청 수
+REQUESTS_PER_SECOND = 10.0
+
+class HostRateLimiter:
+    """호스트별 최소 요청 간격 유지"""
+
+    def __init__(self, requests_per_second=REQUESTS_PER_SECOND):
+        self.interval = 1.0 / requests_per_second if requests_per_second else 0.0
+        self._next_slot = {}
+        self._locks = {}
+
+    async def wait(self, url):
+        host = urlparse(url).netloc
+        lock = self._locks.setdefault(host, asyncio.Lock())
+
+        async with lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+class CtisDetailCrawler:
+    """소분류 상세 페이지 동시 수집"""
+
+    def __init__(self, http_client, concurrency=MAX_CONCURRENCY, requests_per_second=REQUESTS_PER_SECOND):
+        self.http = http_client
+        self.concurrency = concurrency
+        self.rate_limiter = HostRateLimiter(requests_per_second)
+
+    async def fetch_one(self, item, semaphore):
+        """상세 페이지 하나 수집 → (item, detail, response, error)"""
+        async with semaphore:
+            await self.rate_limiter.wait(item['detail_url'])
+            try:
+                # requests는 동기 라이브러리이므로 스레드에서 실행 (연결 풀은 공유)
+                response = await asyncio.to_thread(self.http.get, item['detail_url'])
+                # 헤더/meta charset 선언(없으면 바이트 판별)으로 디코딩 (EUC-KR 페이지 대응)
+                detail = parse_detail_page(response.text())
+                return item, detail, response, None
+            except Exception as e:
+                return item, None, None, str(e)
+
+    async def crawl_async(self, items, on_result=None):
+        """모든 항목 동시 수집 (완료되는 순서대로 on_result 호출)"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+        tasks = [asyncio.create_task(self.fetch_one(item, semaphore)) for item in items]
+
+        results = []
+        for task in asyncio.as_completed(tasks):
+            result = await task
+            if on_result is not None:
+                on_result(*result)
+            results.append(result)
+        return results
+
+    def crawl(self, items, on_result=None):
+        """동기 코드에서 호출하는 진입점"""
+        return asyncio.run(self.crawl_async(items, on_result))
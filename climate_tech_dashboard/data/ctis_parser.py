@@ -0,0 +1,190 @@
+"""
+CTIS 페이지 파서
+
+분류체계 페이지는 #table_box 표만 읽고, rowspan/colspan을 펼친 격자를 한 번 순회하며
+대분류/중분류/소분류를 표 구조에서 읽습니다.
+- 소분류(L3): td.bgw 셀
+- 중분류(L2): 같은 행 격자에서 소분류 바로 왼쪽 셀
+- 대분류(L1): 같은 행 격자의 첫 번째 열
+행 위치를 고정하지 않으므로 CTIS가 행을 추가해도 분류가 어긋나지 않습니다.
+
+lxml이 있으면 lxml.html로 직접 파싱하고(BeautifulSoup 트리 생성 생략),
+없으면 BeautifulSoup(html.parser)로 #table_box 영역만 파싱합니다.
+"""
+
+from collections import namedtuple
+
+from bs4 import BeautifulSoup, SoupStrainer, FeatureNotFound
+
+try:
+    from lxml import html as lxml_html
+except ImportError:
+    lxml_html = None
+
+# 상세 페이지 라벨 → 컬럼 (라벨 공백 제거 후 포함 여부로 비교, 앞쪽 우선)
+DETAIL_LABELS = {
+    'definition': ['기술정의', '정의'],
+    'keywords_kor': ['국문키워드', '키워드(국문)', '국문'],
+    'keywords_eng': ['영문키워드', '키워드(영문)', '영문'],
+    'leading_country': ['최고기술보유국', '기술선도국', '선도국'],
+    'tech_level_pct': ['기술수준'],
+    'tech_gap': ['기술격차']
+}
+
+# 분류체계 표 영역
+CLASSIFICATION_TABLE_ID = 'table_box'
+
+# 소분류 셀 클래스
+L3_CELL_CLASS = 'bgw'
+
+# 파서와 무관한 표 셀 (text: 정리된 텍스트, href: 첫 링크)
+TableCell = namedtuple('TableCell', ['text', 'classes', 'rowspan', 'colspan', 'href'])
+
+def clean_text(text):
+    """공백 정리"""
+    return ' '.join((text or '').split())
+
+def make_soup(markup, parse_only=None):
+    """빠른 파서(lxml) 우선, 없으면 html.parser"""
+    try:
+        return BeautifulSoup(markup, 'lxml', parse_only=parse_only)
+    except FeatureNotFound:
+        return BeautifulSoup(markup, 'html.parser', parse_only=parse_only)
+
+def _span(value):
+    try:
+        return max(int(str(value).strip()), 1)
+    except (TypeError, ValueError):
+        return 1
+
+def _table_rows_lxml(html):
+    """lxml: #table_box 표의 본문 행 → [[TableCell]] (표가 없으면 None)"""
+    root = lxml_html.fromstring(html)
+    tables = root.xpath('//*[@id=$id]//table', id=CLASSIFICATION_TABLE_ID)
+    if not tables:
+        return None
+
+    rows = []
+    for tr in tables[0].xpath('./tr | ./tbody/tr'):
+        cells = []
+        for cell in tr:
+            if cell.tag not in ('td', 'th'):
+                continue
+            links = cell.xpath('.//a[@href]')
+            cells.append(TableCell(
+                clean_text(cell.text_content()),
+                (cell.get('class') or '').split(),
+                _span(cell.get('rowspan')),
+                _span(cell.get('colspan')),
+                links[0].get('href') if links else None
+            ))
+        rows.append(cells)
+    return rows
+
+def _table_rows_soup(html):
+    """BeautifulSoup(html.parser): #table_box 표의 본문 행 → [[TableCell]] (표가 없으면 None)"""
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(id=CLASSIFICATION_TABLE_ID))
+    table = soup.find('table')
+    if table is None:
+        return None
+
+    tbody_rows = [tr for tbody in table.find_all('tbody', recursive=False)
+                  for tr in tbody.find_all('tr', recursive=False)]
+    rows = []
+    for tr in table.find_all('tr', recursive=False) + tbody_rows:
+        cells = []
+        for cell in tr.find_all(['td', 'th'], recursive=False):
+            link = cell.find('a', href=True)
+            cells.append(TableCell(
+                clean_text(cell.get_text()),
+                cell.get('class') or [],
+                _span(cell.get('rowspan')),
+                _span(cell.get('colspan')),
+                link['href'] if link is not None else None
+            ))
+        rows.append(cells)
+    return rows
+
+def expand_table_rows(rows):
+    """rowspan/colspan을 펼쳐 행마다 {격자 열 번호: 셀} 반환 (한 번 순회)"""
+    carried = {}  # 열 번호 → (남은 행 수, 셀)
+
+    for cells in rows:
+        grid = {col: cell for col, (_, cell) in carried.items()}
+        next_carried = {col: (left - 1, cell) for col, (left, cell) in carried.items() if left > 1}
+
+        col = 0
+        for cell in cells:
+            while col in grid:
+                col += 1
+            for c in range(col, col + cell.colspan):
+                grid[c] = cell
+                if cell.rowspan > 1:
+                    next_carried[c] = (cell.rowspan - 1, cell)
+            col += cell.colspan
+
+        carried = next_carried
+        yield grid
+
+def parse_classification_table(html):
+    """분류체계 표 → [{'L1_대분류', 'L2_중분류', 'L3_소분류', 'No', 'detail_href'}]
+
+    표가 없거나 분류를 읽을 수 없는 행이 있으면 ValueError
+    """
+    rows = _table_rows_lxml(html) if lxml_html is not None else _table_rows_soup(html)
+    if rows is None:
+        raise ValueError(f"#{CLASSIFICATION_TABLE_ID} 표를 찾을 수 없습니다")
+
+    records = []
+    seen = set()
+    for grid in expand_table_rows(rows):
+        for col in sorted(grid):
+            cell = grid[col]
+            # rowspan으로 이어진 소분류 셀은 처음 한 번만
+            if L3_CELL_CLASS not in cell.classes or id(cell) in seen:
+                continue
+            seen.add(id(cell))
+
+            if not cell.text:
+                continue
+
+            l1 = grid[0].text if col > 1 else ''
+            l2 = grid[col - 1].text if col > 1 and col - 1 in grid else ''
+            if not l1 or not l2:
+                raise ValueError(f"분류를 읽을 수 없는 소분류: {cell.text}")
+
+            records.append({
+                'L1_대분류': l1,
+                'L2_중분류': l2,
+                'L3_소분류': cell.text,
+                'No': len(records) + 1,
+                'detail_href': cell.href
+            })
+
+    if not records:
+        raise ValueError("소분류 항목이 없습니다")
+
+    return records
+
+def parse_detail_page(html):
+    """상세 페이지에서 라벨(th/dt) 옆 값(td/dd)을 읽어 컬럼별로 반환"""
+    soup = make_soup(html)
+
+    pairs = []
+    for label_tag in soup.find_all(['th', 'dt']):
+        value_tag = label_tag.find_next_sibling(['td', 'dd'])
+        if value_tag is not None:
+            pairs.append((clean_text(label_tag.get_text()).replace(' ', ''),
+                          clean_text(value_tag.get_text(' '))))
+
+    detail = {}
+    for column, labels in DETAIL_LABELS.items():
+        for keyword in labels:
+            value = next((value for label, value in pairs if keyword in label), None)
+            if value is not None:
+                detail[column] = value
+                break
+        else:
+            detail[column] = ''
+
+    return detail
@@ -0,0 +1,465 @@
+"""
+KOSIS 통계표 로더
+"""
+
+import os
+import threading
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pathlib import Path
+
+from data.aggregates import build_cube, cube_filename, dataset_cubes
+from data.encoding import detect_encoding
+from data.etl_manifest import file_sha256
+from data.paths import PACKAGE_ROOT, DATA_ROOT, PROCESSED_DIR, SCRAPED_DIR
+from data.publish import get_snapshot_store
+from data.schemas import DATASET_DTYPES
+
+# 메모리 매핑용 Arrow IPC 사본 폴더 (원본 내용 해시별, 프로세스 간 공유)
+ARROW_CACHE_DIR = DATA_ROOT / '.arrow_cache'
+
+# 읽기 전용 데이터셋 모드 (DATASET_MMAP=0이면 일반 메모리 로드)
+DATASET_MMAP = os.environ.get('DATASET_MMAP', '1') != '0'
+
+# 데이터셋별로 남겨 둘 Arrow IPC 사본 수 (최근 것부터, 이전 내용을 매핑 중인 프로세스용)
+ARROW_CACHE_KEEP = 3
+
+# 컬럼형 사본 압축 방식
+PARQUET_COMPRESSION = 'zstd'
+
+# 스트리밍 처리 시 한 번에 읽는 본문 행 수
+STREAM_CHUNK_ROWS = 50_000
+
+# 스키마 dtype → Arrow 타입 (청크마다 같은 파케이 스키마 유지)
+ARROW_TYPES = {
+    'int8': pa.int8(),
+    'int16': pa.int16(),
+    'int32': pa.int32(),
+    'int64': pa.int64(),
+    'float64': pa.float64(),
+    'category': pa.dictionary(pa.int32(), pa.string())
+}
+
+# 분류 컬럼 이름 (기후기술분류별(1), 기후기술분류별(2))
+KOSIS_INDEX_NAMES = ['field', 'tech_name']
+
+# KOSIS 결측/비공개 표시값
+KOSIS_MISSING_MARKERS = ['-', 'X', 'x', '…', '...', '', 'nan']
+
+# KOSIS 집계 라벨
+KOSIS_TOTAL_LABELS = ['합계', '소계', '전체']
+
+def normalize_labels(series):
+    """라벨 공백/표기 정리 ('500억원 이상  1000억 원 미만' → '500억 원 이상 1000억 원 미만')"""
+    return (series.astype(str)
+            .str.split().str.join(' ')
+            .str.replace('억원', '억 원', regex=False))
+
+def to_numeric_kosis(series):
+    """KOSIS 값 문자열을 숫자로 일괄 변환 (표시값은 NaN)"""
+    values = series.astype(str).str.strip().str.replace(',', '', regex=False)
+    values = values.mask(values.isin(KOSIS_MISSING_MARKERS))
+    return pd.to_numeric(values, errors='coerce')
+
+def read_kosis_raw(file_path, encoding=None):
+    """KOSIS CSV를 헤더 없이 문자열로 읽기"""
+    encoding = encoding or detect_encoding(file_path)
+
+    try:
+        return pd.read_csv(file_path, encoding=encoding, header=None, dtype=str,
+                           keep_default_na=False)
+    except (UnicodeDecodeError, pd.errors.ParserError):
+        return None
+
+def split_kosis_header(raw_df, header_rows=2):
+    """헤더 행(연도 + 측정항목)과 분류 컬럼 수 파악"""
+    header = raw_df.iloc[:header_rows]
+
+    # 연도 행이 연도가 아닌 앞쪽 컬럼 = 분류 컬럼
+    years = pd.to_numeric(header.iloc[0].str.extract(r'(\d{4})')[0], errors='coerce')
+    n_index = int(years.notna().to_numpy().argmax()) if years.notna().any() else len(years)
+
+    return header, years, n_index
+
+def reshape_kosis_table(raw_df, header_rows=2, drop_totals=True):
+    """와이드 KOSIS 테이블을 롱 포맷으로 변환"""
+    header, years, n_index = split_kosis_header(raw_df, header_rows)
+    index_names = KOSIS_INDEX_NAMES[:n_index] + [f'class{i + 1}' for i in range(len(KOSIS_INDEX_NAMES), n_index)]
+
+    body = raw_df.iloc[header_rows:]
+
+    # 연도 × 측정항목 MultiIndex 컬럼
+    columns = pd.MultiIndex.from_arrays(
+        [years.iloc[n_index:].to_numpy(), header.iloc[-1, n_index:].to_numpy()],
+        names=['year', 'measure']
+    )
+    values = pd.DataFrame(body.iloc[:, n_index:].to_numpy(), columns=columns,
+                          index=pd.MultiIndex.from_frame(body.iloc[:, :n_index], names=index_names))
+
+    long_df = values.stack(['year', 'measure'], future_stack=True).rename('value').reset_index()
+    long_df['value'] = to_numeric_kosis(long_df['value'])
+
+    for col in index_names + ['measure']:
+        long_df[col] = normalize_labels(long_df[col])
+
+    if drop_totals:
+        label_cols = index_names + ['measure']
+        long_df = long_df[~long_df[label_cols].isin(KOSIS_TOTAL_LABELS).any(axis=1)]
+
+    long_df = long_df.dropna(subset=['year'])
+    long_df['year'] = long_df['year'].astype(np.int64)
+
+    return long_df.reset_index(drop=True)
+
+def read_kosis_raw_chunks(file_path, encoding=None, header_rows=2, chunksize=STREAM_CHUNK_ROWS):
+    """KOSIS CSV를 본문 청크 단위로 읽기 (각 청크 앞에 헤더 행을 붙여 반환)"""
+    encoding = encoding or detect_encoding(file_path)
+    read_kwargs = dict(encoding=encoding, header=None, dtype=str, keep_default_na=False)
+
+    header = pd.read_csv(file_path, nrows=header_rows, **read_kwargs)
+
+    try:
+        reader = pd.read_csv(file_path, skiprows=header_rows, chunksize=chunksize, **read_kwargs)
+    except pd.errors.EmptyDataError:
+        return  # 헤더만 있는 파일
+
+    with reader:
+        for chunk in reader:
+            yield pd.concat([header, chunk], ignore_index=True)
+
+def read_kosis_table_chunked(file_path, encoding=None, header_rows=2, drop_totals=True,
+                             chunksize=STREAM_CHUNK_ROWS):
+    """KOSIS 통계표 CSV를 롱 포맷 청크로 읽기 (메모리 사용량은 청크 크기로 제한)"""
+    for raw_chunk in read_kosis_raw_chunks(file_path, encoding, header_rows, chunksize):
+        yield reshape_kosis_table(raw_chunk, header_rows, drop_totals)
+
+def read_kosis_table(file_path, encoding=None, header_rows=2, drop_totals=True):
+    """KOSIS 통계표 CSV를 롱 포맷 DataFrame으로 읽기
+
+    반환 컬럼: field, tech_name, year, measure, value
+    """
+    raw_df = read_kosis_raw(file_path, encoding)
+    if raw_df is None:
+        return None
+
+    return reshape_kosis_table(raw_df, header_rows, drop_totals)
+
+def apply_dataset_schema(df, name):
+    """데이터셋 스키마 dtype 적용 (스키마에 없는 컬럼은 그대로)"""
+    dtypes = {col: dtype for col, dtype in DATASET_DTYPES.get(name, {}).items() if col in df.columns}
+    return df.astype(dtypes)
+
+def arrow_schema(df, name):
+    """데이터셋 스키마 기준 Arrow 스키마 (스키마에 없는 컬럼은 추론)"""
+    inferred = pa.Schema.from_pandas(df, preserve_index=False)
+    dtypes = DATASET_DTYPES.get(name, {})
+    return pa.schema([
+        pa.field(field.name, ARROW_TYPES.get(dtypes.get(field.name), field.type))
+        for field in inferred
+    ])
+
+class ColumnarWriter:
+    """파케이 사본 청크 단위 저장 (임시 파일에 이어 쓰고 close 시 교체)"""
+
+    def __init__(self, parquet_path, name):
+        self.parquet_path = Path(parquet_path)
+        self.name = name
+        self.tmp_path = self.parquet_path.with_name(f'{self.parquet_path.name}.{os.getpid()}.tmp')
+        self._writer = None
+
+    def write(self, df):
+        """청크 하나를 행 그룹으로 추가"""
+        df = apply_dataset_schema(df, self.name)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.tmp_path, arrow_schema(df, self.name),
+                                            compression=PARQUET_COMPRESSION)
+        table = pa.Table.from_pandas(df, schema=self._writer.schema, preserve_index=False)
+        self._writer.write_table(table)
+
+    def close(self):
+        """저장 완료 후 원자적 교체 (쓴 청크가 없으면 기존 파일 유지)"""
+        if self._writer is None:
+            return False
+        self._writer.close()
+        self._writer = None
+        os.replace(self.tmp_path, self.parquet_path)
+        return True
+
+    def abort(self):
+        """저장 취소 (임시 파일 삭제)"""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        self.tmp_path.unlink(missing_ok=True)
+
+def write_columnar(df, parquet_path, name):
+    """스키마 dtype을 적용한 파케이 사본 저장 (원자적 교체)"""
+    writer = ColumnarWriter(parquet_path, name)
+    try:
+        writer.write(df)
+        writer.close()
+    finally:
+        writer.abort()
+
+def current_snapshot_id():
+    """현재 게시된 스냅샷 ID (게시 전이면 None)"""
+    return get_snapshot_store().current_id()
+
+def resolve_processed_dir(snapshot_id=None):
+    """읽을 처리 데이터 폴더 (게시된 스냅샷 우선, 게시 전이면 processed 폴더)"""
+    snapshot_dir = get_snapshot_store().snapshot_dir(snapshot_id)
+    return snapshot_dir if snapshot_dir is not None else PROCESSED_DIR
+
+def processed_dataset_source(name, processed_dir=None, snapshot_id=None):
+    """처리 데이터셋을 읽을 파일 (없으면 None)
+
+    processed_dir를 주지 않으면 게시된 스냅샷(snapshot_id, 없으면 현재)에서 읽습니다.
+    CSV보다 오래되지 않은 파케이 사본이 있으면 파케이, 없으면 CSV
+    """
+    from_snapshot = processed_dir is None
+    if from_snapshot:
+        processed_dir = resolve_processed_dir(snapshot_id)
+        from_snapshot = processed_dir != PROCESSED_DIR
+
+    parquet_path = Path(processed_dir) / f'{name}.parquet'
+    csv_path = Path(processed_dir) / f'{name}.csv'
+
+    if parquet_path.exists():
+        # 스냅샷의 파일 묶음은 게시 시점에 일관성이 확인됨
+        if (from_snapshot or not csv_path.exists() or
+                parquet_path.stat().st_mtime_ns >= csv_path.stat().st_mtime_ns):
+            return parquet_path
+
+    return csv_path if csv_path.exists() else None
+
+def read_processed_file(path, name):
+    """처리 데이터 파일 읽기 (CSV는 스키마 dtype 적용)"""
+    path = Path(path)
+    if path.suffix == '.parquet':
+        try:
+            return pd.read_parquet(path, engine='pyarrow')
+        except Exception as e:
+            print(f"⚠️ 파케이 읽기 실패, CSV 사용: {path.name} - {str(e)}")
+            path = path.with_suffix('.csv')
+            if not path.exists():
+                return None
+
+    df = pd.read_csv(path, encoding=detect_encoding(path))
+    try:
+        return apply_dataset_schema(df, name)
+    except (ValueError, TypeError):
+        # 스키마와 맞지 않는 CSV (결측 정수 등)는 추론된 dtype 그대로
+        return df
+
+def load_processed_dataset(name, processed_dir=None, snapshot_id=None):
+    """처리 데이터셋 로드 (없으면 None)"""
+    path = processed_dataset_source(name, processed_dir, snapshot_id)
+    return read_processed_file(path, name) if path is not None else None
+
+def dataframe_to_arrow(df):
+    """DataFrame → Arrow 테이블 (pandas로 다시 변환할 때 복사가 필요 없는 형태)
+
+    실수 컬럼의 NaN은 null이 아닌 값으로 두고(유효성 비트맵 없음),
+    범주형은 코드 + 범주 사전(dictionary)으로 저장
+    """
+    arrays = []
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy().astype(np.int32)
+            arrays.append(pa.DictionaryArray.from_arrays(
+                pa.array(codes, mask=codes < 0), pa.array(values.cat.categories.astype(str))))
+        elif values.dtype.kind in 'iufb':
+            arrays.append(pa.array(values.to_numpy(), from_pandas=False))
+        else:
+            arrays.append(pa.array(values, from_pandas=True))
+    return pa.table(arrays, names=[str(col) for col in df.columns])
+
+def write_arrow_file(df, arrow_path):
+    """압축하지 않은 Arrow IPC 파일로 저장 (메모리 매핑 가능, 원자적 교체)"""
+    arrow_path = Path(arrow_path)
+    arrow_path.parent.mkdir(parents=True, exist_ok=True)
+    table = dataframe_to_arrow(df)
+
+    tmp_path = arrow_path.with_name(f'{arrow_path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+    try:
+        with pa.OSFile(str(tmp_path), 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        os.replace(tmp_path, arrow_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+def read_arrow_mmap(arrow_path):
+    """Arrow IPC 파일을 메모리 매핑으로 읽기
+
+    결측 없는 숫자 컬럼과 범주 코드는 매핑된 버퍼를 그대로 쓰는 읽기 전용 배열
+    (프로세스 힙에 복사하지 않으며, 같은 파일을 여는 프로세스끼리 페이지 캐시 공유)
+    """
+    source = pa.memory_map(str(arrow_path), 'r')
+    table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+def prune_arrow_cache(cache_dir, name, keep=ARROW_CACHE_KEEP):
+    """데이터셋의 Arrow IPC 사본 중 최근 keep개만 남기기 (지울 수 없는 파일은 건너뜀)"""
+    paths = []
+    for path in Path(cache_dir).glob(f'{name}.*.arrow'):
+        try:
+            paths.append((path.stat().st_mtime_ns, path))
+        except FileNotFoundError:
+            continue
+    for _, path in sorted(paths, reverse=True)[keep:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+def freeze_dataframe(df):
+    """컬럼 버퍼를 읽기 전용으로 표시한 DataFrame (컬럼마다 별도 블록, 값은 복사하지 않음)
+
+    공유 데이터의 값을 제자리에서 바꾸면(df.loc[...] = ..., inplace=True 등) ValueError.
+    컬럼 추가/교체나 필터·집계 결과는 새 배열이라 영향 없음.
+    numpy 배열이 아닌 확장 dtype 컬럼(Int64, 시간대 포함 datetime 등)은 그대로 둠
+    """
+    columns = {}
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            codes = values.cat.codes.to_numpy()
+            codes.flags.writeable = False
+            columns[col] = pd.Categorical.from_codes(codes, dtype=values.dtype)
+        elif isinstance(values.dtype, np.dtype):
+            array = values.to_numpy()
+            array.flags.writeable = False
+            columns[col] = array
+        else:
+            columns[col] = values.array
+    return pd.DataFrame(columns, index=df.index, columns=df.columns, copy=False)
+
+class DataRepository:
+    """데이터 공유 저장소 (세션 간 공유)
+
+    항목마다 읽은 파일의 (경로, 크기, 수정시각)을 기억해 두고, 바뀐 경우에만
+    내용 해시를 확인해 실제로 내용이 달라졌을 때 다시 읽습니다.
+
+    반환 DataFrame은 읽기 전용입니다: 저장된 값은 컬럼 버퍼를 읽기 전용으로 표시해 두고
+    (freeze_dataframe) 호출마다 얕은 복사본을 돌려주므로, 호출한 쪽에서 컬럼을 추가/교체해도
+    공유 데이터는 그대로이고 값을 제자리에서 바꾸면 ValueError가 납니다 (바꾸려면 .copy()).
+
+    mmap=True(읽기 전용 데이터셋 모드)면 처리 데이터셋을 원본 해시별 Arrow IPC 사본으로
+    만들어 메모리 매핑으로 읽습니다 (매핑된 버퍼는 프로세스 간 공유).
+    """
+
+    def __init__(self, data_root=DATA_ROOT, mmap=DATASET_MMAP):
+        self.data_root = Path(data_root)
+        self.mmap = mmap
+        self._entries = {}
+        self._lock = threading.Lock()
+        self._key_locks = {}
+
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _load(self, key, path, reader, default=None):
+        """경로가 같고 파일이 바뀌지 않았으면 저장된 값, 아니면 다시 읽기"""
+        # 같은 항목을 여러 세션이 동시에 요청해도 한 번만 읽음
+        with self._key_lock(key):
+            entry = self._entries.get(key)
+
+            if path is None or not Path(path).exists():
+                # default 없이 요청해 저장된 None은 default가 있는 요청에서 다시 계산
+                if entry is None or entry['path'] is not None or entry['value'] is None:
+                    entry = {'path': None, 'stat': None, 'sha256': None,
+                             'value': self._freeze(default() if default is not None else None)}
+                    self._entries[key] = entry
+                return entry['value']
+
+            stat = Path(path).stat()
+            signature = (str(path), stat.st_size, stat.st_mtime_ns)
+            if entry is None or entry['stat'] != signature:
+                sha256 = file_sha256(path)
+                if entry is None or entry['sha256'] != sha256:
+                    entry = {'path': str(path), 'value': self._freeze(reader(path, sha256)), 'sha256': sha256}
+                entry['stat'] = signature
+                entry['path'] = str(path)
+                self._entries[key] = entry
+
+            return entry['value']
+
+    def _freeze(self, value):
+        return freeze_dataframe(value) if isinstance(value, pd.DataFrame) else value
+
+    def _copy(self, value):
+        # 읽기 전용 버퍼를 공유하는 새 DataFrame (컬럼 추가/교체는 이 복사본에만 반영)
+        return value.copy(deep=False) if isinstance(value, pd.DataFrame) else value
+
+    def _read_dataset(self, path, name, sha256):
+        """처리 데이터셋 읽기 (읽기 전용 모드면 Arrow IPC 사본을 메모리 매핑)"""
+        if not self.mmap:
+            return read_processed_file(path, name)
+
+        cache_dir = self.data_root / ARROW_CACHE_DIR.name
+        arrow_path = cache_dir / f'{name}.{sha256[:16]}.arrow'
+        if not arrow_path.exists():
+            df = read_processed_file(path, name)
+            if df is None:
+                return None
+            write_arrow_file(df, arrow_path)
+
+            # 이전 내용의 사본은 최근 몇 개만 남김 (다른 프로세스가 아직 이전 내용을 매핑 중일 수 있음)
+            prune_arrow_cache(cache_dir, name)
+
+        return read_arrow_mmap(arrow_path)
+
+    def dataset(self, name, default=None, snapshot_id=None):
+        """처리 데이터셋 (게시된 스냅샷 우선, 없으면 default() 결과)"""
+        path = processed_dataset_source(name, snapshot_id=snapshot_id)
+        return self._copy(self._load(f'dataset:{name}', path,
+                                     lambda p, sha256: self._read_dataset(p, name, sha256), default))
+
+    def cubes(self, dataset, default=None, snapshot_id=None):
+        """데이터셋의 집계 큐브 {큐브 이름: DataFrame}
+
+        게시된 스냅샷의 큐브 파일을 읽고, 큐브 파일이 없으면(게시 전 또는 샘플 데이터)
+        default() 데이터셋으로 한 번 계산해 저장
+        """
+        processed_dir = Path(resolve_processed_dir(snapshot_id))
+        cubes = {}
+        for name in dataset_cubes(dataset):
+            fallback = (lambda name=name: build_cube(name, default())) if default is not None else None
+            cubes[name] = self._copy(self._load(f'cube:{name}', processed_dir / cube_filename(name),
+                                                lambda p, _: pd.read_parquet(p, engine='pyarrow'), fallback))
+        return cubes
+
+    def scraped(self, name, default=None):
+        """크롤링 데이터 (scraped 폴더 CSV, 없으면 default() 결과)"""
+        path = self.data_root / 'scraped' / f'{name}.csv'
+        return self._copy(self._load(f'scraped:{name}', path,
+                                     lambda p, _: pd.read_csv(p, encoding=detect_encoding(p)), default))
+
+    def csv(self, path, default=None):
+        """임의 CSV (상대 경로는 패키지 루트 기준, 없으면 default() 결과)"""
+        path = Path(path)
+        if not path.is_absolute():
+            path = PACKAGE_ROOT / path
+        return self._copy(self._load(f'csv:{path}', path,
+                                     lambda p, _: pd.read_csv(p, encoding=detect_encoding(p)), default))
+
+    def clear(self):
+        """저장된 항목 모두 비우기"""
+        with self._lock:
+            self._entries.clear()
+
+_default_repository = None
+_default_repository_lock = threading.Lock()
+
+def get_data_repository():
+    """기본 데이터 저장소 (프로세스당 하나, 모든 세션이 공유)"""
+    global _default_repository
+    with _default_repository_lock:
+        if _default_repository is None:
+            _default_repository = DataRepository()
+        return _default_repository
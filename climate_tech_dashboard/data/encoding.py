@@ -0,0 +1,127 @@
+"""
+파일 인코딩 감지 서비스
+
+파일 앞부분 바이트 샘플만 한 번 검사해 인코딩을 결정하고,
+결과를 (경로, 크기, 수정시각) 기준 매니페스트에 기록해 재사용합니다.
+"""
+
+import codecs
+import json
+import os
+import threading
+from pathlib import Path
+
+from data.paths import DATA_ROOT
+
+# 검사할 최대 바이트 수
+SAMPLE_BYTES = 64 * 1024
+
+# 후보 인코딩 (cp949는 euc-kr 상위 집합)
+CANDIDATE_ENCODINGS = ['utf-8', 'cp949']
+
+# 모든 후보 실패 시 (바이트 손실 없이 읽힘)
+FALLBACK_ENCODING = 'latin-1'
+
+# 선언된 인코딩 → 상위 집합 (euc-kr로 선언하고 cp949 확장 문자를 쓰는 문서)
+SUPERSET_ENCODINGS = {'euc_kr': 'cp949'}
+
+MANIFEST_PATH = DATA_ROOT / '.encoding_manifest.json'
+
+# 인코딩 변환 시 한 번에 읽는 문자 수
+TRANSCODE_CHUNK_CHARS = 1024 * 1024
+
+def sniff_encoding(sample):
+    """바이트 샘플에서 인코딩 판별"""
+    if sample.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16'
+
+    for encoding in CANDIDATE_ENCODINGS:
+        try:
+            # 샘플 끝에서 잘린 멀티바이트 문자는 허용
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+
+    return FALLBACK_ENCODING
+
+def normalize_encoding(name):
+    """선언된 인코딩 이름 → 코덱 이름 (모르는 이름이면 None)"""
+    try:
+        encoding = codecs.lookup(name.strip()).name
+    except (LookupError, AttributeError):
+        return None
+    return SUPERSET_ENCODINGS.get(encoding, encoding)
+
+class EncodingManifest:
+    """파일별 인코딩 감지 결과 캐시"""
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = Path(manifest_path)
+        self._lock = threading.Lock()
+        self._entries = self._load()
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def _save(self):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def detect(self, file_path):
+        """파일 인코딩 반환 (변경되지 않은 파일은 매니페스트 값 재사용)"""
+        file_path = Path(file_path)
+        stat = file_path.stat()
+        key = str(file_path.resolve())
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                return entry['encoding']
+
+        with open(file_path, 'rb') as f:
+            encoding = sniff_encoding(f.read(SAMPLE_BYTES))
+
+        with self._lock:
+            self._entries[key] = {
+                'encoding': encoding,
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns
+            }
+            try:
+                self._save()
+            except OSError:
+                pass  # 매니페스트 저장 실패는 감지 결과에 영향 없음
+
+        return encoding
+
+_default_manifest = None
+_default_lock = threading.Lock()
+
+def get_encoding_manifest():
+    """기본 매니페스트 (프로세스당 하나)"""
+    global _default_manifest
+    with _default_lock:
+        if _default_manifest is None:
+            _default_manifest = EncodingManifest()
+        return _default_manifest
+
+def detect_encoding(file_path):
+    """파일 인코딩 감지"""
+    return get_encoding_manifest().detect(file_path)
+
+def transcode_file(src_path, dst_path, src_encoding, dst_encoding, chunk_chars=TRANSCODE_CHUNK_CHARS):
+    """텍스트 파일 인코딩 변환 (청크 단위, 내용은 바이트 그대로 보존)"""
+    with open(src_path, 'r', encoding=src_encoding, newline='') as src, \
+         open(dst_path, 'w', encoding=dst_encoding, newline='') as dst:
+        for chunk in iter(lambda: src.read(chunk_chars), ''):
+            dst.write(chunk)
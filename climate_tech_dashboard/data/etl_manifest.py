@@ -0,0 +1,114 @@
+"""
+ETL 증분 처리 매니페스트
+
+데이터셋별 입력(raw)과 출력(processed) 파일의 내용 해시를 기록해
+입력이 바뀌지 않은 데이터셋은 다시 처리하지 않도록 합니다.
+"""
+
+import hashlib
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+from data.paths import DATA_ROOT
+
+MANIFEST_PATH = DATA_ROOT / '.etl_manifest.json'
+
+# 해시 계산 시 한 번에 읽는 크기
+HASH_CHUNK_BYTES = 1024 * 1024
+
+def file_sha256(file_path):
+    """파일 내용 SHA-256"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class EtlManifest:
+    """데이터셋별 입력/출력 내용 해시 기록"""
+
+    def __init__(self, manifest_path=MANIFEST_PATH):
+        self.manifest_path = Path(manifest_path)
+        self.entries = self._load()
+        # 같은 실행 안에서 (크기, 수정시각)이 같으면 해시 재사용
+        self._hash_cache = {}
+
+    def _load(self):
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self):
+        """매니페스트 저장 (원자적 교체)"""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.manifest_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def fingerprint(self, file_path):
+        """파일 지문 (없으면 None)"""
+        file_path = Path(file_path)
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            return None
+
+        key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+        if key not in self._hash_cache:
+            self._hash_cache[key] = file_sha256(file_path)
+
+        return {
+            'sha256': self._hash_cache[key],
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns
+        }
+
+    def _same_content(self, recorded, file_path):
+        current = self.fingerprint(file_path)
+        if current is None or recorded is None:
+            # 기록 당시에도 지금도 없는 파일은 변경 없음
+            return current is None and recorded is None
+
+        # 크기·수정시각이 같으면 해시 계산 생략
+        if current['size'] == recorded['size'] and current['mtime_ns'] == recorded['mtime_ns']:
+            return True
+        return current['sha256'] == recorded['sha256']
+
+    def is_up_to_date(self, name, input_paths, output_paths):
+        """입력이 그대로이고 출력도 기록 당시 그대로인지 확인"""
+        entry = self.entries.get(name)
+        if not entry:
+            return False
+
+        inputs = entry.get('inputs', {})
+        outputs = entry.get('outputs', {})
+        if set(inputs) != {str(p) for p in input_paths}:
+            return False
+        if set(outputs) != {str(p) for p in output_paths}:
+            return False
+
+        return (all(self._same_content(inputs[str(p)], p) for p in input_paths) and
+                all(self._same_content(outputs[str(p)], p) for p in output_paths))
+
+    def snapshot_inputs(self, input_paths):
+        """처리 시작 전 입력 지문 (처리 중 변경된 입력을 놓치지 않도록)"""
+        return {str(p): self.fingerprint(p) for p in input_paths}
+
+    def record(self, name, inputs, output_paths):
+        """처리 결과 기록 (출력이 모두 있을 때만)"""
+        outputs = {str(p): self.fingerprint(p) for p in output_paths}
+        if any(fp is None for fp in outputs.values()):
+            self.entries.pop(name, None)
+            return False
+
+        self.entries[name] = {
+            'inputs': inputs,
+            'outputs': outputs,
+            'updated': datetime.now().isoformat()
+        }
+        return True
@@ -1,7 +1,12 @@
 import pandas as pd
 from pathlib import Path
-import chardet
 import os
+import sys
+
+# 상위 디렉토리 추가 (python data/file_diagnostic.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.encoding import detect_encoding, transcode_file, SAMPLE_BYTES
 
 def diagnose_files():
     """파일 진단 도구"""
@@ -31,51 +36,38 @@ def diagnose_files():
         file_size = file_path.stat().st_size
         print(f"📊 파일 크기: {file_size:,} bytes")
         
-        # 2. 인코딩 감지
+        # 2. 인코딩 감지 (앞부분 샘플만 검사)
         try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(10000)  # 처음 10KB만 읽기
-                detected = chardet.detect(raw_data)
-                print(f"🔤 감지된 인코딩: {detected}")
+            encoding = detect_encoding(file_path)
+            print(f"🔤 감지된 인코딩: {encoding} (샘플 {SAMPLE_BYTES:,} bytes)")
         except Exception as e:
             print(f"❌ 인코딩 감지 실패: {str(e)}")
+            print()
+            continue
         
-        # 3. 파일 내용 미리보기 (다양한 인코딩으로 시도)
-        encodings = ['cp949', 'euc-kr', 'utf-8-sig', 'utf-8', 'latin-1']
-        
-        for encoding in encodings:
-            try:
-                print(f"🔄 {encoding}로 시도 중...")
-                
-                # 텍스트로 첫 3줄 읽기
-                with open(file_path, 'r', encoding=encoding) as f:
-                    lines = []
-                    for i, line in enumerate(f):
-                        if i < 3:
-                            lines.append(line.strip())
-                        else:
-                            break
-                
-                print(f"✅ {encoding} 성공!")
-                print("📋 첫 3줄 미리보기:")
-                for i, line in enumerate(lines, 1):
-                    print(f"   {i}: {line[:100]}...")
-                
-                # pandas로 읽기 시도
-                df = pd.read_csv(file_path, encoding=encoding, nrows=2)
-                print(f"📊 pandas 읽기 성공 - 모양: {df.shape}")
-                print(f"📋 컬럼명: {list(df.columns)}")
-                
-                break
-                
-            except UnicodeDecodeError:
-                print(f"❌ {encoding}: 인코딩 오류")
-                continue
-            except Exception as e:
-                print(f"❌ {encoding}: {str(e)}")
-                continue
-        else:
-            print("❌ 모든 인코딩 시도 실패")
+        # 3. 파일 내용 미리보기
+        try:
+            with open(file_path, 'r', encoding=encoding) as f:
+                lines = []
+                for i, line in enumerate(f):
+                    if i < 3:
+                        lines.append(line.strip())
+                    else:
+                        break
+            
+            print("📋 첫 3줄 미리보기:")
+            for i, line in enumerate(lines, 1):
+                print(f"   {i}: {line[:100]}...")
+            
+            # pandas로 읽기 시도
+            df = pd.read_csv(file_path, encoding=encoding, nrows=2)
+            print(f"📊 pandas 읽기 성공 - 모양: {df.shape}")
+            print(f"📋 컬럼명: {list(df.columns)}")
+            
+        except UnicodeDecodeError:
+            print(f"❌ {encoding}: 인코딩 오류")
+        except Exception as e:
+            print(f"❌ {encoding}: {str(e)}")
         
         print()
 
@@ -90,28 +82,26 @@ def fix_files():
     for file_path in csv_files:
         print(f"🔧 수정 중: {file_path.name}")
         
-        # 성공한 인코딩으로 읽고 UTF-8로 다시 저장
-        encodings = ['cp949', 'euc-kr', 'utf-8-sig', 'utf-8', 'latin-1']
+        # 감지한 인코딩으로 읽고 UTF-8로 다시 저장
+        encoding = detect_encoding(file_path)
         
-        for encoding in encodings:
-            try:
-                # 파일 읽기
-                df = pd.read_csv(file_path, encoding=encoding)
-                
-                # 백업 파일 생성
-                backup_path = file_path.with_suffix('.backup.csv')
-                file_path.rename(backup_path)
-                
-                # UTF-8로 다시 저장
-                df.to_csv(file_path, index=False, encoding='utf-8-sig')
-                
-                print(f"✅ {file_path.name} 수정 완료 ({encoding} → utf-8-sig)")
-                break
-                
-            except Exception as e:
-                continue
-        else:
-            print(f"❌ {file_path.name} 수정 실패")
+        if encoding == 'utf-8-sig':
+            print(f"✅ {file_path.name} 이미 utf-8-sig")
+            continue
+        
+        # 백업 파일 생성
+        backup_path = file_path.with_suffix('.backup.csv')
+        file_path.rename(backup_path)
+        
+        try:
+            # 파일 전체를 메모리에 올리지 않고 청크 단위로 UTF-8 변환
+            transcode_file(backup_path, file_path, encoding, 'utf-8-sig')
+            print(f"✅ {file_path.name} 수정 완료 ({encoding} → utf-8-sig)")
+            
+        except Exception as e:
+            # 변환 실패 시 원본 복구
+            os.replace(backup_path, file_path)
+            print(f"❌ {file_path.name} 수정 실패: {str(e)}")
 
 def test_pandas_read():
     """pandas 읽기 테스트"""
@@ -124,19 +114,14 @@ def test_pandas_read():
     for file_path in csv_files:
         print(f"🧪 테스트 중: {file_path.name}")
         
-        # 다양한 옵션으로 시도
+        # 감지한 인코딩으로 다양한 옵션 시도
+        encoding = detect_encoding(file_path)
         options = [
-            {'encoding': 'cp949'},
-            {'encoding': 'euc-kr'},
-            {'encoding': 'utf-8-sig'},
-            {'encoding': 'utf-8'},
-            {'encoding': 'cp949', 'sep': ','},
-            {'encoding': 'cp949', 'sep': '\t'},
-            {'encoding': 'cp949', 'sep': ';'},
-            {'encoding': 'cp949', 'delimiter': ','},
-            {'encoding': 'cp949', 'skipinitialspace': True},
-            {'encoding': 'cp949', 'header': 0},
-            {'encoding': 'cp949', 'header': None},
+            {'encoding': encoding},
+            {'encoding': encoding, 'sep': '\t'},
+            {'encoding': encoding, 'sep': ';'},
+            {'encoding': encoding, 'skipinitialspace': True},
+            {'encoding': encoding, 'header': None},
         ]
         
         for i, option in enumerate(options):
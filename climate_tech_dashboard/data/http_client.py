@@ -0,0 +1,176 @@
+"""
+스크래핑용 HTTP 클라이언트
+
+세션 하나로 연결을 재사용하고(연결 풀), 일시적 오류는 제한된 횟수만큼 백오프하며 재시도합니다.
+응답은 디스크에 캐시해 다음 요청 때 ETag/Last-Modified 조건부 요청을 보내고,
+304(변경 없음)이거나 내용 해시가 같으면 호출하는 쪽이 파싱을 생략할 수 있게 알려 줍니다.
+본문 텍스트는 헤더/meta charset 선언, 없으면 바이트 판별로 디코딩합니다 (EUC-KR 페이지 대응).
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
+
+from data.encoding import normalize_encoding, sniff_encoding
+from data.paths import DATA_ROOT
+
+CACHE_DIR = DATA_ROOT / '.http_cache'
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# 재시도 설정 (대기: backoff × 2^(시도-1)초)
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUS = (429, 500, 502, 503, 504)
+
+# 호스트별 연결 풀 크기
+POOL_SIZE = 10
+
+REQUEST_TIMEOUT = 30
+
+# 인코딩 선언: Content-Type 헤더 charset, HTML <meta charset> / http-equiv Content-Type
+HEADER_CHARSET = re.compile(r'charset\s*=\s*["\']?([\w.:-]+)', re.IGNORECASE)
+META_CHARSET = re.compile(r'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+
+# meta charset을 찾을 본문 앞부분 바이트 수
+META_SCAN_BYTES = 4096
+
+class HttpResponse:
+    """캐시를 반영한 응답"""
+
+    def __init__(self, url, status_code, content, headers, not_modified=False, changed=True):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.headers = headers
+        # 서버가 304로 응답해 캐시 본문을 돌려준 경우
+        self.not_modified = not_modified
+        # 이전에 받은 본문과 내용이 다른지 (다르지 않으면 파싱 생략 가능)
+        self.changed = changed
+
+    @property
+    def sha256(self):
+        return hashlib.sha256(self.content).hexdigest()
+
+    @property
+    def encoding(self):
+        """본문 인코딩 (헤더 charset → HTML meta charset → 바이트 판별)"""
+        declarations = (HEADER_CHARSET.search(self.headers.get('Content-Type') or ''),
+                        META_CHARSET.search(self.content[:META_SCAN_BYTES].decode('ascii', errors='ignore')))
+        for match in declarations:
+            encoding = normalize_encoding(match.group(1)) if match else None
+            if encoding:
+                return encoding
+        return sniff_encoding(self.content)
+
+    def text(self, encoding=None):
+        return self.content.decode(encoding or self.encoding, errors='replace')
+
+class HttpClient:
+    """연결 풀 + 재시도 + 조건부 요청 캐시"""
+
+    def __init__(self, cache_dir=CACHE_DIR, retries=RETRY_TOTAL, backoff=RETRY_BACKOFF,
+                 pool_size=POOL_SIZE, timeout=REQUEST_TIMEOUT):
+        self.cache_dir = Path(cache_dir)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff,
+            status_forcelist=RETRY_STATUS,
+            allowed_methods=['GET', 'HEAD'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update(DEFAULT_HEADERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _cache_paths(self, url):
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        return self.cache_dir / f'{key}.json', self.cache_dir / f'{key}.body'
+
+    def _load_cache(self, url):
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            return meta, body_path.read_bytes()
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None, None
+
+    def _save_cache(self, url, response, sha256):
+        meta_path, body_path = self._cache_paths(url)
+        meta = {
+            'url': url,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'content_type': response.headers.get('Content-Type'),
+            'sha256': sha256
+        }
+
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 본문을 먼저 교체해야 메타데이터가 항상 본문과 맞음
+            for path, data in ((body_path, response.content),
+                               (meta_path, json.dumps(meta, ensure_ascii=False).encode('utf-8'))):
+                tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{threading.get_ident()}.tmp')
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, path)
+
+    def get(self, url, use_cache=True, **kwargs):
+        """GET 요청 (use_cache=True면 조건부 요청 + 디스크 캐시)"""
+        meta, cached_body = self._load_cache(url) if use_cache else (None, None)
+
+        headers = dict(kwargs.pop('headers', None) or {})
+        if meta and cached_body is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
+        response = self.session.get(url, headers=headers, timeout=kwargs.pop('timeout', self.timeout), **kwargs)
+
+        if response.status_code == 304 and cached_body is not None:
+            # 304 응답에는 보통 Content-Type이 없으므로 캐시한 값으로 charset 판단
+            cached_headers = CaseInsensitiveDict(response.headers)
+            if meta.get('content_type'):
+                cached_headers.setdefault('Content-Type', meta['content_type'])
+            return HttpResponse(url, 200, cached_body, cached_headers, not_modified=True, changed=False)
+
+        response.raise_for_status()
+
+        sha256 = hashlib.sha256(response.content).hexdigest()
+        changed = not meta or meta.get('sha256') != sha256
+        if use_cache:
+            self._save_cache(url, response, sha256)
+
+        return HttpResponse(url, response.status_code, response.content, response.headers, changed=changed)
+
+    def close(self):
+        self.session.close()
+
+_default_client = None
+_default_lock = threading.Lock()
+
+def get_http_client():
+    """기본 HTTP 클라이언트 (프로세스당 하나, 연결 풀 공유)"""
+    global _default_client
+    with _default_lock:
+        if _default_client is None:
+            _default_client = HttpClient()
+        return _default_client
@@ -0,0 +1,338 @@
+"""
+KOSIS OpenAPI 통계표 수집
+
+통계표(orgId/tblId)를 KOSIS OpenAPI(통계자료 조회)로 받아 raw 폴더에
+KOSIS 다운로드 CSV와 같은 형식(연도 행 + 측정항목 행 헤더)으로 저장합니다.
+- 공유 HTTP 클라이언트(연결 풀·재시도)로 요청
+- 조회 기간을 나눠 페이지 단위로 요청하고, 셀 수 제한(40,000셀)에 걸리면 기간을 반으로 나눠 재요청
+- 페이지마다 JSON을 값 표(분류 × 연도·측정항목)로 바로 변환해 누적 (응답 레코드는 보관하지 않음)
+- 통계표 ID가 확인되지 않은 raw 파일은 경고 후 건너뜀
+
+인증키는 KOSIS_API_KEY, 요청 주소는 KOSIS_API_URL, 통계표 ID는 KOSIS_TABLE_IDS 환경변수로
+바꿀 수 있습니다 (녹화한 응답을 돌려주는 로컬 서버로 테스트할 때).
+"""
+
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+# 상위 디렉토리 추가 (python data/kosis_api.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_loader import KOSIS_INDEX_NAMES
+from data.http_client import get_http_client
+from data.paths import RAW_DIR
+from data.schemas import MIN_YEAR
+
+KOSIS_API_URL = 'https://kosis.kr/openapi/Param/statisticsParameterData.do'
+
+# 한 번에 요청하는 연도 수 (셀 수 제한에 걸리면 자동으로 더 나눔)
+YEARS_PER_PAGE = 5
+
+# 동시에 받는 통계표 수
+DOWNLOAD_WORKERS = 4
+
+# KOSIS 오류 코드
+ERROR_NO_DATA = '30'
+ERROR_TOO_MANY_CELLS = '31'
+
+# 분류 단계 (raw CSV 앞쪽 분류 컬럼 = 롱 포맷 field, tech_name)
+CLASS_LEVELS = ['C1', 'C2']
+
+# 통계표 ID를 모르는 표의 수동 다운로드 안내 주소 (기후기술 통계 목록)
+KOSIS_LIST_URL = 'https://kosis.kr/statisticsList/statisticsListIndex.do'
+
+# 통계표 보기 주소 (orgId/tblId)
+KOSIS_TABLE_URL = 'https://kosis.kr/statHtml/statHtml.do?orgId={org_id}&tblId={tbl_id}'
+
+# raw 폴더 파일 → KOSIS 통계표 (org_id/tbl_id가 None이면 아직 확인하지 않은 표로 수집에서 제외,
+# KOSIS_TABLE_IDS 환경변수로 지정 가능)
+KOSIS_TABLES = {
+    'institution_revenue.csv': {
+        'name': '기관규모별 매출액',
+        'org_id': '442',
+        'tbl_id': 'DT_21_01',
+        'description': '기후기술 영역별 기관규모별 매출액 (년 2019~2020)'
+    },
+    'institution_employees.csv': {
+        'name': '기관규모별 종사자 수',
+        'org_id': None,
+        'tbl_id': None,
+        'description': '기후기술 영역별 기관규모별 종사자 수 (년 2019~2020)'
+    },
+    'institution_researchers.csv': {
+        'name': '기관규모별 연구원 수',
+        'org_id': None,
+        'tbl_id': None,
+        'description': '기후기술 영역별 기관규모별 연구원 수 (년 2019~2020)'
+    },
+    'institution_rd_cost.csv': {
+        'name': '기관규모별 연구개발비',
+        'org_id': None,
+        'tbl_id': None,
+        'description': '기후기술 영역별 기관규모별 연구개발비 (년 2019~2020)'
+    },
+    'patent_data.csv': {
+        'name': '특허 현황',
+        'org_id': None,
+        'tbl_id': None,
+        'description': '기후기술 영역별 기업 및 기관의 누적 특허 건수 (년 2019~2020)'
+    },
+    'lifecycle_data.csv': {
+        'name': '수명주기 단계',
+        'org_id': None,
+        'tbl_id': None,
+        'description': '기후기술 영역별 기술수명주기 단계 (년 2019~2020)'
+    },
+    'overseas_data.csv': {
+        'name': '해외진출 현황',
+        'org_id': None,
+        'tbl_id': None,
+        'description': '기후기술 영역별 해외진출지역(복수응답) (년 2019~2020)'
+    }
+}
+
+class KosisApiError(Exception):
+    """KOSIS OpenAPI 오류 응답"""
+
+    def __init__(self, code, message):
+        super().__init__(f"KOSIS 오류 {code}: {message}")
+        self.code = code
+
+def configured_table_ids():
+    """KOSIS_TABLE_IDS 환경변수의 통계표 ID {파일명: (orgId, tblId)}
+
+    형식: 파일명=orgId/tblId를 쉼표로 구분 (예: patent_data.csv=442/DT_XXX)
+    """
+    table_ids = {}
+    for item in filter(None, os.environ.get('KOSIS_TABLE_IDS', '').split(',')):
+        filename, _, table_id = item.strip().partition('=')
+        org_id, _, tbl_id = table_id.partition('/')
+        if not (org_id and tbl_id):
+            raise ValueError(f"KOSIS_TABLE_IDS 형식 오류: {item}")
+        table_ids[filename] = (org_id, tbl_id)
+    return table_ids
+
+def table_id(filename):
+    """raw 파일의 통계표 (orgId, tblId) (확인되지 않은 표는 None)"""
+    configured = configured_table_ids()
+    if filename in configured:
+        return configured[filename]
+    table = KOSIS_TABLES[filename]
+    if table['org_id'] and table['tbl_id']:
+        return table['org_id'], table['tbl_id']
+    return None
+
+def table_url(filename):
+    """통계표 보기 주소 (통계표 ID를 모르면 통계 목록)"""
+    ids = table_id(filename)
+    if ids is None:
+        return KOSIS_LIST_URL
+    return KOSIS_TABLE_URL.format(org_id=ids[0], tbl_id=ids[1])
+
+def records_to_long(records):
+    """API 응답 레코드 → 프로세서 롱 포맷 (field, tech_name, year, measure, value)
+
+    측정항목은 세 번째 분류(C3)가 있으면 분류값, 없으면 항목명(ITM_NM).
+    분류 이름(C1_OBJ_NM 등)은 attrs['index_labels']에 기록
+    """
+    columns = [f'{level}_{suffix}' for level in CLASS_LEVELS for suffix in ('NM', 'OBJ_NM')]
+    df = pd.DataFrame.from_records(records).reindex(columns=columns + ['C3_NM', 'ITM_NM', 'PRD_DE', 'DT'])
+
+    measure = df['C3_NM'].where(df['C3_NM'].notna() & (df['C3_NM'] != ''), df['ITM_NM'])
+    long_df = pd.DataFrame({
+        **{name: df[f'{level}_NM'].fillna('') for name, level in zip(KOSIS_INDEX_NAMES, CLASS_LEVELS)},
+        'year': df['PRD_DE'].astype(str).str[:4],
+        'measure': measure.fillna(''),
+        'value': df['DT'].fillna('-')
+    })
+    long_df.attrs['index_labels'] = [
+        next((name for name in df[f'{level}_OBJ_NM'].dropna() if name), f'분류({i + 1})')
+        for i, level in enumerate(CLASS_LEVELS)
+    ]
+    return long_df
+
+def long_to_wide(long_df):
+    """롱 포맷 → (분류) 행 × (연도, 측정항목) 열 값 표 (행/열은 응답에 처음 나온 순서)"""
+    index_cols = KOSIS_INDEX_NAMES[:len(CLASS_LEVELS)]
+    long_df = long_df.drop_duplicates(index_cols + ['year', 'measure'], keep='last')
+
+    rows = long_df[index_cols].drop_duplicates()
+    cols = long_df[['year', 'measure']].drop_duplicates()
+
+    return (long_df.set_index(index_cols + ['year', 'measure'])['value']
+            .unstack(['year', 'measure'])
+            .reindex(index=pd.MultiIndex.from_frame(rows), columns=pd.MultiIndex.from_frame(cols)))
+
+def wide_to_raw_table(wide, index_labels):
+    """값 표 → KOSIS 다운로드 CSV와 같은 와이드 표 (연도 행 + 측정항목 행 헤더, 열은 연도순)"""
+    cols = wide.columns.to_frame(index=False).sort_values('year', kind='stable')
+    wide = wide.reindex(columns=pd.MultiIndex.from_frame(cols)).fillna('-')
+
+    header = pd.DataFrame([index_labels + cols['year'].tolist(), index_labels + cols['measure'].tolist()])
+    body = pd.DataFrame(wide.reset_index().to_numpy())
+    return pd.concat([header, body], ignore_index=True)
+
+def long_to_raw_table(long_df, index_labels):
+    """롱 포맷 → KOSIS 다운로드 CSV와 같은 와이드 표 (연도 행 + 측정항목 행 헤더)
+
+    행/열 순서는 응답에 처음 나온 순서 (열은 연도순)
+    """
+    return wide_to_raw_table(long_to_wide(long_df), index_labels)
+
+class KosisApiClient:
+    """KOSIS OpenAPI 통계자료 조회"""
+
+    def __init__(self, api_key=None, base_url=None, http_client=None, years_per_page=YEARS_PER_PAGE):
+        self.api_key = api_key or os.environ.get('KOSIS_API_KEY')
+        self.base_url = base_url or os.environ.get('KOSIS_API_URL', KOSIS_API_URL)
+        # 연결 풀·재시도를 공유하는 HTTP 클라이언트
+        self.http = http_client or get_http_client()
+        self.years_per_page = years_per_page
+
+    @property
+    def available(self):
+        return bool(self.api_key)
+
+    def fetch_page(self, org_id, tbl_id, start_year, end_year):
+        """기간 하나 조회 → 응답 레코드 목록 (데이터가 없으면 빈 목록)"""
+        params = {
+            'method': 'getList',
+            'apiKey': self.api_key,
+            'orgId': org_id,
+            'tblId': tbl_id,
+            'itmId': 'ALL',
+            'objL1': 'ALL',
+            'objL2': 'ALL',
+            'objL3': 'ALL',
+            'prdSe': 'Y',
+            'startPrdDe': str(start_year),
+            'endPrdDe': str(end_year),
+            'format': 'json',
+            'jsonVD': 'Y'
+        }
+        # 주소에 인증키가 들어가므로 디스크 캐시는 쓰지 않음
+        response = self.http.get(self.base_url, use_cache=False, params=params)
+        payload = json.loads(response.text())
+
+        if isinstance(payload, dict) and 'err' in payload:
+            code = str(payload['err'])
+            if code == ERROR_NO_DATA:
+                return []
+            raise KosisApiError(code, payload.get('errMsg', ''))
+        return payload
+
+    def iter_pages(self, org_id, tbl_id, start_year, end_year):
+        """기간을 나눠 조회하며 페이지마다 롱 포맷 DataFrame 반환"""
+        windows = [(year, min(year + self.years_per_page - 1, end_year))
+                   for year in range(start_year, end_year + 1, self.years_per_page)]
+
+        while windows:
+            start, end = windows.pop(0)
+            try:
+                records = self.fetch_page(org_id, tbl_id, start, end)
+            except KosisApiError as e:
+                # 셀 수 제한: 기간을 반으로 나눠 다시 요청
+                if e.code != ERROR_TOO_MANY_CELLS or start == end:
+                    raise
+                middle = (start + end) // 2
+                windows[:0] = [(start, middle), (middle + 1, end)]
+                continue
+
+            if records:
+                yield records_to_long(records)
+
+    def fetch_table(self, org_id, tbl_id, start_year=MIN_YEAR, end_year=None):
+        """통계표 전체 → KOSIS 다운로드 형식 와이드 표 (데이터가 없으면 None)
+
+        페이지(기간)마다 바로 값 표로 바꾸고 응답 레코드/롱 포맷은 버림.
+        기간이 겹치지 않으므로 페이지 값 표를 열 방향으로 이어 붙임
+        """
+        end_year = end_year or datetime.now().year
+        index_labels = None
+        wide = None
+        for page in self.iter_pages(org_id, tbl_id, start_year, end_year):
+            index_labels = index_labels or page.attrs['index_labels']
+            block = long_to_wide(page)
+            wide = block if wide is None else pd.concat([wide, block], axis=1, sort=False)
+        if wide is None:
+            return None
+        wide = wide.loc[:, ~wide.columns.duplicated(keep='last')]
+        return wide_to_raw_table(wide, index_labels)
+
+    def download_table(self, filename, raw_dir, start_year=MIN_YEAR, end_year=None):
+        """통계표 하나를 raw 폴더에 저장 (임시 파일에 쓴 뒤 교체) → 본문 행 수"""
+        ids = table_id(filename)
+        if ids is None:
+            raise ValueError(f"통계표 ID가 확인되지 않은 파일: {filename}")
+        org_id, tbl_id = ids
+        raw_table = self.fetch_table(org_id, tbl_id, start_year, end_year)
+        if raw_table is None:
+            raise KosisApiError(ERROR_NO_DATA, '조회된 데이터가 없습니다')
+
+        output_file = Path(raw_dir) / filename
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = output_file.with_name(f'{output_file.stem}.{os.getpid()}.tmp')
+        try:
+            raw_table.to_csv(tmp_file, header=False, index=False, encoding='utf-8-sig')
+            os.replace(tmp_file, output_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
+
+        return len(raw_table) - 2
+
+    def download_all(self, raw_dir, filenames=None, workers=DOWNLOAD_WORKERS, **kwargs):
+        """통계표 여러 개를 동시에 저장 → {파일명: 행 수 또는 오류}
+
+        통계표 ID가 확인되지 않은 파일은 경고만 출력하고 건너뜀 (기존 raw 파일 유지)
+        """
+        requested = list(filenames or KOSIS_TABLES)
+        filenames = [filename for filename in requested if table_id(filename) is not None]
+        for filename in requested:
+            if filename not in filenames:
+                print(f"   ⚠️ {filename}: 통계표 ID가 없어 건너뜀 (KOSIS_TABLE_IDS로 지정하거나 수동 다운로드)")
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(self.download_table, filename, raw_dir, **kwargs): filename
+                       for filename in filenames}
+            for future in as_completed(futures):
+                filename = futures[future]
+                try:
+                    results[filename] = future.result()
+                    print(f"   ✅ {filename}: {results[filename]}행")
+                except Exception as e:
+                    results[filename] = e
+                    print(f"   ❌ {filename}: {str(e)}")
+
+        return results
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='KOSIS OpenAPI 통계표 수집')
+    parser.add_argument('files', nargs='*', help=f'raw 파일명 (기본: 전체 {len(KOSIS_TABLES)}개)')
+    parser.add_argument('--raw-dir', default=str(RAW_DIR))
+    parser.add_argument('--start-year', type=int, default=MIN_YEAR)
+    parser.add_argument('--end-year', type=int, default=None)
+    parser.add_argument('--workers', type=int, default=DOWNLOAD_WORKERS)
+    args = parser.parse_args()
+
+    client = KosisApiClient()
+    if not client.available:
+        print("❌ KOSIS_API_KEY 환경변수를 설정하세요")
+        sys.exit(1)
+
+    print("📥 KOSIS OpenAPI 통계표 수집...")
+    results = client.download_all(args.raw_dir, args.files or None, workers=args.workers,
+                                  start_year=args.start_year, end_year=args.end_year)
+    if any(isinstance(result, Exception) for result in results.values()):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
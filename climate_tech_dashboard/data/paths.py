@@ -0,0 +1,16 @@
+"""
+데이터 폴더 경로
+
+모든 모듈이 같은 데이터 폴더를 읽고 쓰도록 경로를 한 곳에서 정합니다.
+패키지 루트 기준이라 실행 위치와 무관하고, DASHBOARD_DATA_ROOT 환경변수로 다른 데이터 폴더를 지정합니다.
+"""
+
+import os
+from pathlib import Path
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+DATA_ROOT = Path(os.environ.get('DASHBOARD_DATA_ROOT', PACKAGE_ROOT / 'assets' / 'data'))
+
+RAW_DIR = DATA_ROOT / 'raw'
+PROCESSED_DIR = DATA_ROOT / 'processed'
+SCRAPED_DIR = DATA_ROOT / 'scraped'
@@ -1,158 +1,342 @@
 import pandas as pd
 from pathlib import Path
 import numpy as np
+import sys
+import os
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# 상위 디렉토리 추가 (python data/process_real_data.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.aggregates import CubeBuilder, cube_files
+from data.data_loader import read_kosis_table, read_kosis_table_chunked, ColumnarWriter, STREAM_CHUNK_ROWS
+from data.encoding import detect_encoding
+from data.etl_manifest import EtlManifest
+from data.paths import RAW_DIR, PROCESSED_DIR
+from data.publish import SnapshotStore, get_snapshot_store
+from data.validation import DatasetValidator, load_validation_report, update_validation_report
+
+# 기관 지표별 원본 파일
+INSTITUTION_FILES = {
+    'revenue': 'institution_revenue.csv',
+    'employees': 'institution_employees.csv',
+    'researchers': 'institution_researchers.csv',
+    'rd_cost': 'institution_rd_cost.csv'
+}
+
+# 기관 지표 조인 키
+INSTITUTION_KEYS = ['field', 'tech_type', 'scale', 'year']
+
+# 특허 측정항목 → 컬럼 (KOSIS 항목명 키워드 기준)
+PATENT_MEASURES = {
+    '등록': 'patent_count',
+    '보유': 'cumulative_patents'
+}
+
+# 해외진출 지역 좌표 (KOSIS 해외진출지역 분류)
+REGION_COORDS = {
+    '아시아태평양': (15.0, 115.0, '중국, 일본, 베트남, 인도네시아, 호주'),
+    '서유럽': (50.0, 5.0, '독일, 프랑스, 영국, 네덜란드'),
+    '동유럽': (52.0, 25.0, '폴란드, 체코, 헝가리'),
+    '북미': (45.0, -100.0, '미국, 캐나다'),
+    '중남미': (-15.0, -60.0, '브라질, 멕시코, 칠레'),
+    '중동아프리카': (15.0, 35.0, 'UAE, 사우디아라비아, 이집트, 남아프리카공화국')
+}
+
+# 데이터셋별 파이프라인 (입력 raw 파일 → 출력 processed 파일, CSV + 파케이 사본 + 집계 큐브)
+PIPELINES = {
+    'institution': {
+        'inputs': list(INSTITUTION_FILES.values()),
+        'outputs': ['institution_data.csv', 'institution_data.parquet', *cube_files('institution_data')],
+        'method': 'process_institution_data'
+    },
+    'patent': {
+        'inputs': ['patent_data.csv'],
+        'outputs': ['patent_data.csv', 'patent_data.parquet', *cube_files('patent_data')],
+        'method': 'process_patent_data'
+    },
+    'lifecycle': {
+        'inputs': ['lifecycle_data.csv'],
+        'outputs': ['lifecycle_data.csv', 'lifecycle_data.parquet', *cube_files('lifecycle_data')],
+        'method': 'process_lifecycle_data'
+    },
+    'overseas': {
+        'inputs': ['overseas_data.csv'],
+        'outputs': ['overseas_data.csv', 'overseas_data.parquet', *cube_files('overseas_data')],
+        'method': 'process_overseas_data'
+    }
+}
+
+def run_pipeline(name, raw_dir, processed_dir, chunksize=None):
+    """파이프라인 하나 실행 (프로세스 풀 작업 단위, 결과와 검증 결과 반환)"""
+    processor = RealDataProcessor(raw_dir, processed_dir, chunksize)
+    result = getattr(processor, PIPELINES[name]['method'])()
+    return result, processor.validation_results
 
 class RealDataProcessor:
-    def __init__(self):
-        self.raw_dir = Path('assets/data/raw')
-        self.processed_dir = Path('assets/data/processed')
+    def __init__(self, raw_dir=RAW_DIR, processed_dir=PROCESSED_DIR, chunksize=None):
+        self.raw_dir = Path(raw_dir)
+        self.processed_dir = Path(processed_dir)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
+        # None이면 파일 전체를 한 번에, 정수면 본문 행 단위 스트리밍 처리
+        self.chunksize = chunksize
+        self.manifest = EtlManifest()
+        # 처리 결과는 processed 폴더에 만든 뒤 스냅샷으로 게시
+        # (기본 폴더면 페이지가 읽는 기본 저장소, 다른 폴더를 지정하면 그 옆 snapshots 폴더)
+        if self.processed_dir == PROCESSED_DIR:
+            self.snapshots = get_snapshot_store()
+        else:
+            self.snapshots = SnapshotStore(self.processed_dir.parent / 'snapshots')
+        self.pipeline_errors = {}
+        self.validation_results = {}
         
-    def process_all_data(self):
-        """모든 실제 데이터 처리"""
+    def process_all_data(self, incremental=False, workers=None, publish=True):
+        """모든 실제 데이터 처리
+
+        incremental=True면 입력이 바뀐 데이터셋만, workers > 1이면
+        서로 독립적인 데이터셋 파이프라인을 프로세스 풀에서 병렬 처리.
+        publish=True면 처리 결과를 새 스냅샷으로 게시
+        """
         print("🚀 실제 KOSIS 데이터 처리 시작")
         print("=" * 50)
         
-        # 1. 기관 데이터 통합
-        self.process_institution_data()
+        pending = {}
+        for name in PIPELINES:
+            input_paths, output_paths = self.pipeline_paths(name)
+            
+            if incremental and self.manifest.is_up_to_date(name, input_paths, output_paths):
+                print(f"\n⏭️ {name}: 입력 변경 없음 - 건너뜀")
+                continue
+            
+            pending[name] = self.manifest.snapshot_inputs(input_paths)
+        
+        if workers and workers > 1 and len(pending) > 1:
+            results = self.run_pipelines_parallel(list(pending), workers)
+        else:
+            results = self.run_pipelines_serial(list(pending))
         
-        # 2. 특허 데이터 처리
-        self.process_patent_data()
+        processed = []
+        for name, inputs in pending.items():
+            _, output_paths = self.pipeline_paths(name)
+            
+            # 실패한 데이터셋은 기록을 지워 다음 실행에서 다시 처리
+            if results.get(name) and self.manifest.record(name, inputs, output_paths):
+                processed.append(name)
+            else:
+                self.manifest.entries.pop(name, None)
         
-        # 3. 수명주기 데이터 처리
-        self.process_lifecycle_data()
+        self.manifest.save()
+        if self.validation_results:
+            update_validation_report(self.processed_dir, self.validation_results)
         
-        # 4. 해외진출 데이터 처리
-        self.process_overseas_data()
+        for name, error in self.pipeline_errors.items():
+            print(f"\n❌ {name} 파이프라인 오류: {error}")
         
-        print("\n🎉 모든 데이터 처리 완료!")
+        if publish and (processed or self.snapshots.current_id() is None):
+            self.publish()
+        
+        if not processed:
+            print("\n⚠️ 반영된 데이터가 없습니다." if pending else "\n✅ 변경된 데이터가 없습니다.")
+            return processed
+        
+        print(f"\n🎉 데이터 처리 완료! ({', '.join(processed)})")
         self.verify_processed_data()
+        return processed
     
-    def read_csv_safely(self, file_path):
-        """안전한 CSV 읽기"""
-        encodings = ['utf-8', 'utf-8-sig', 'cp949', 'euc-kr']
-        
-        for encoding in encodings:
+    def publish(self):
+        """processed 폴더를 새 스냅샷으로 게시 (읽는 쪽은 CURRENT 전환 후 새 파일을 봄)"""
+        print("\n📦 처리 데이터 게시 중...")
+        return self.snapshots.publish(self.processed_dir)
+    
+    def run_pipelines_serial(self, names):
+        """파이프라인 순차 실행 (오류는 기록하고 계속 진행)"""
+        results = {}
+        for name in names:
             try:
-                df = pd.read_csv(file_path, encoding=encoding)
-                print(f"   ✅ {encoding} 인코딩으로 읽기 성공: {df.shape}")
-                return df
+                results[name] = getattr(self, PIPELINES[name]['method'])()
             except Exception as e:
-                continue
+                self.pipeline_errors[name] = str(e)
+                results[name] = False
+        return results
+    
+    def run_pipelines_parallel(self, names, workers):
+        """파이프라인 병렬 실행 (오류는 기록하고 나머지는 계속 진행)"""
+        print(f"\n⚡ {len(names)}개 파이프라인 병렬 처리 (워커 {min(workers, len(names))}개)")
+        
+        results = {}
+        # 스트림릿 서버 스레드와 함께 쓰일 수 있으므로 fork 대신 spawn
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(names)), mp_context=context) as executor:
+            futures = {
+                executor.submit(run_pipeline, name, self.raw_dir.resolve(), self.processed_dir.resolve(),
+                                self.chunksize): name
+                for name in names
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    results[name], validation_results = future.result()
+                    self.validation_results.update(validation_results)
+                except Exception as e:
+                    self.pipeline_errors[name] = str(e)
+                    results[name] = False
+        return results
+    
+    def pipeline_paths(self, name):
+        """파이프라인 입력/출력 파일 경로"""
+        pipeline = PIPELINES[name]
+        input_paths = [self.raw_dir / filename for filename in pipeline['inputs']]
+        output_paths = [self.processed_dir / filename for filename in pipeline['outputs']]
+        return input_paths, output_paths
+    
+    def pipeline_input_files(self):
+        """파이프라인이 사용하는 raw 파일명"""
+        return {filename for pipeline in PIPELINES.values() for filename in pipeline['inputs']}
+    
+    def read_csv_safely(self, file_path, **read_kwargs):
+        """안전한 CSV 읽기 (감지된 인코딩으로 한 번만 파싱)"""
+        encoding = detect_encoding(file_path)
         
-        print(f"   ❌ 모든 인코딩 실패: {file_path.name}")
-        return None
+        try:
+            df = pd.read_csv(file_path, encoding=encoding, **read_kwargs)
+            print(f"   ✅ {encoding} 인코딩으로 읽기 성공: {df.shape}")
+            return df
+        except Exception as e:
+            print(f"   ❌ 읽기 실패 ({encoding}): {file_path.name} - {str(e)}")
+            return None
+    
+    def iter_kosis_long(self, filename):
+        """raw 폴더의 KOSIS 파일을 롱 포맷 청크로 읽기 (분야명 정제 포함)
+
+        chunksize가 없으면 파일 전체를 청크 하나로 반환
+        """
+        file_path = self.raw_dir / filename
+        if not file_path.exists():
+            print(f"   ❌ {filename} 파일 없음")
+            return
+        
+        if self.chunksize:
+            chunks = read_kosis_table_chunked(file_path, chunksize=self.chunksize)
+        else:
+            long_df = read_kosis_table(file_path)
+            if long_df is None:
+                print(f"   ❌ 읽기 실패: {filename}")
+                return
+            chunks = [long_df]
+        
+        total = 0
+        for long_df in chunks:
+            # 분야명은 고유값 단위로만 정제
+            field_map = {name: self.clean_field_name(name) for name in long_df['field'].unique()}
+            long_df['field'] = long_df['field'].map(field_map)
+            total += len(long_df)
+            yield long_df
+        
+        print(f"   📄 {filename}: {total}개 값")
+    
+    def save_processed(self, frames, filename, label):
+        """처리 결과 검증 후 저장 (청크를 임시 파일에 이어 쓴 뒤 교체)
+
+        데이터 계약을 위반하면 기존 파일을 그대로 두고 실패 처리
+        """
+        output_file = self.processed_dir / filename
+        validator = DatasetValidator(output_file.stem)
+        tmp_file = output_file.with_name(f'{output_file.name}.{os.getpid()}.tmp')
+        # 대시보드 로딩용 타입 지정 컬럼형 사본 (CSV보다 나중에 교체)
+        columnar = ColumnarWriter(output_file.with_suffix('.parquet'), output_file.stem)
+        # 페이지용 집계 큐브 (청크별 부분 집계를 누적)
+        cubes = CubeBuilder(output_file.stem, self.processed_dir)
+        
+        rows = 0
+        try:
+            with open(tmp_file, 'w', encoding='utf-8-sig', newline='') as f:
+                for df in frames:
+                    if df is None or df.empty:
+                        continue
+                    
+                    # 위반이 발견된 뒤에는 저장 없이 보고서용 검사만 계속
+                    validator.check(df)
+                    if validator.failed:
+                        continue
+                    
+                    df.to_csv(f, header=(rows == 0), index=False)
+                    columnar.write(df)
+                    cubes.add(df)
+                    rows += len(df)
+            
+            if validator.rows == 0:
+                print(f"   ❌ {label} 처리 실패")
+                return False
+            
+            validation = validator.result()
+            self.validation_results[output_file.stem] = validation
+            if validation['status'] == 'failed':
+                print(f"   ❌ {label} 검증 실패 - 기존 파일 유지")
+                self.print_violations(validation)
+                return False
+            
+            os.replace(tmp_file, output_file)
+            columnar.close()
+            cube_paths = cubes.write()
+        finally:
+            columnar.abort()
+            tmp_file.unlink(missing_ok=True)
+        
+        print(f"   ✅ {label} 저장: {output_file} (+ .parquet, {rows}행, 큐브 {len(cube_paths)}개)")
+        return True
     
     def process_institution_data(self):
         """기관 데이터 통합 처리"""
         print("\n📊 기관 데이터 처리 중...")
         
-        # 기관 관련 파일들
-        institution_files = {
-            'revenue': 'institution_revenue.csv',
-            'employees': 'institution_employees.csv',
-            'researchers': 'institution_researchers.csv',
-            'rd_cost': 'institution_rd_cost.csv'
-        }
-        
-        # 각 파일 읽기
-        data_dict = {}
-        for metric, filename in institution_files.items():
-            file_path = self.raw_dir / filename
-            if file_path.exists():
-                df = self.read_csv_safely(file_path)
-                if df is not None:
-                    data_dict[metric] = df
-                    print(f"   📄 {filename}: {df.shape}")
-            else:
-                print(f"   ❌ {filename} 파일 없음")
+        # 지표 파일마다 청크를 키별 합계로 줄여 누적 (파일끼리 행 순서/청크 경계가 달라도 키로 조인)
+        metric_series = {}
+        for metric, filename in INSTITUTION_FILES.items():
+            partials = [self.institution_metric(long_df, metric) for long_df in self.iter_kosis_long(filename)]
+            if partials:
+                metric_series[metric] = (partials[0] if len(partials) == 1 else
+                                         pd.concat(partials).groupby(level=INSTITUTION_KEYS, sort=False)
+                                         .sum(min_count=1))
         
-        if data_dict:
-            # 데이터 통합
-            integrated_data = self.integrate_institution_data(data_dict)
-            
-            # 저장
-            output_file = self.processed_dir / 'institution_data.csv'
-            integrated_data.to_csv(output_file, index=False, encoding='utf-8-sig')
-            print(f"   ✅ 통합 파일 저장: {output_file} ({len(integrated_data)}행)")
-        else:
-            print("   ❌ 처리할 기관 데이터가 없습니다.")
+        df = self.integrate_institution_data(metric_series)
+        
+        def output_chunks():
+            # 스트리밍 처리 시 저장/검증/큐브 집계는 청크 단위로
+            step = STREAM_CHUNK_ROWS if self.chunksize else max(len(df), 1)
+            for start in range(0, len(df), step):
+                yield df.iloc[start:start + step]
+        
+        return self.save_processed(output_chunks(), 'institution_data.csv', '통합 파일')
+    
+    def institution_metric(self, long_df, metric):
+        """지표 롱 포맷 → (field, tech_type, scale, year) 키별 합계 (정제 후 같은 키가 생기면 합산)"""
+        long_df = long_df.rename(columns={'tech_name': 'tech_type', 'measure': 'scale', 'value': metric})
+        return long_df.groupby(INSTITUTION_KEYS, sort=False)[metric].sum(min_count=1)
     
-    def integrate_institution_data(self, data_dict):
-        """기관 데이터 통합"""
+    def integrate_institution_data(self, metric_series):
+        """기관 데이터 통합 (지표별 키 합계를 field, tech_type, scale, year 키 기준 외부 조인)"""
         print("   🔗 데이터 통합 중...")
         
-        integrated_rows = []
+        if not metric_series:
+            print("   ❌ 통합 데이터 생성 실패")
+            return pd.DataFrame()
         
-        # 첫 번째 데이터를 기준으로 구조 파악
-        first_key = list(data_dict.keys())[0]
-        base_df = data_dict[first_key]
+        # 행 위치가 아닌 키로 정렬해 외부 조인
+        df = pd.concat(list(metric_series.values()), axis=1, join='outer')
         
-        print(f"   📋 기준 데이터: {first_key}")
-        print(f"   📊 컬럼: {base_df.columns.tolist()}")
+        # 누락된 컬럼 기본값 설정
+        for col in INSTITUTION_FILES:
+            if col not in df.columns:
+                df[col] = 0
         
-        # 각 행을 처리
-        for idx, row in base_df.iterrows():
-            if idx == 0:  # 헤더 행은 건너뛰기
-                continue
-                
-            try:
-                # 기본 정보 추출 (첫 번째, 두 번째 컬럼에서)
-                if len(row) >= 2:
-                    field_info = str(row.iloc[0]) if pd.notna(row.iloc[0]) else ""
-                    scale_info = str(row.iloc[1]) if pd.notna(row.iloc[1]) else ""
-                    
-                    # 연도별 데이터 추출 (나머지 컬럼들)
-                    for col_idx, value in enumerate(row.iloc[2:], 2):
-                        if pd.notna(value) and str(value).replace('.', '').replace(',', '').isdigit():
-                            # 가능한 연도 추정
-                            year = 2019 + (col_idx - 2) % 4  # 2019, 2020, 2021, 2022 순환
-                            
-                            # 통합 행 생성
-                            integrated_row = {
-                                'year': year,
-                                'field': self.clean_field_name(field_info),
-                                'scale': self.clean_scale_name(scale_info),
-                                'tech_type': '전체',  # 기본값
-                                first_key: float(str(value).replace(',', '')) if str(value).replace(',', '').replace('.', '').isdigit() else 0
-                            }
-                            
-                            # 다른 메트릭 데이터도 추가
-                            for metric, df in data_dict.items():
-                                if metric != first_key and idx < len(df):
-                                    try:
-                                        other_value = df.iloc[idx, col_idx] if col_idx < len(df.columns) else 0
-                                        if pd.notna(other_value):
-                                            integrated_row[metric] = float(str(other_value).replace(',', '')) if str(other_value).replace(',', '').replace('.', '').isdigit() else 0
-                                        else:
-                                            integrated_row[metric] = 0
-                                    except:
-                                        integrated_row[metric] = 0
-                            
-                            integrated_rows.append(integrated_row)
-                            
-            except Exception as e:
-                continue
+        df = df[list(INSTITUTION_FILES)].fillna(0).reset_index()
+        df = df.sort_values(['year', 'field', 'tech_type', 'scale'], kind='stable', ignore_index=True)
+        df = df[['year', 'field', 'scale', 'tech_type'] + list(INSTITUTION_FILES)]
         
-        # DataFrame 생성
-        if integrated_rows:
-            df = pd.DataFrame(integrated_rows)
-            
-            # 데이터 정제
-            df = df[df['year'].between(2019, 2022)]  # 유효한 연도만
-            df = df.dropna(subset=[first_key])  # 주요 메트릭이 있는 행만
-            
-            # 누락된 컬럼 기본값 설정
-            required_cols = ['revenue', 'employees', 'researchers', 'rd_cost']
-            for col in required_cols:
-                if col not in df.columns:
-                    df[col] = 0
-            
-            print(f"   ✅ 통합 완료: {len(df)}행")
-            return df
-        else:
-            print("   ❌ 통합 데이터 생성 실패")
-            return pd.DataFrame()
+        print(f"   ✅ 통합 완료: {len(df)}행")
+        return df
     
     def clean_field_name(self, field_str):
         """분야명 정제"""
@@ -167,211 +351,130 @@ class RealDataProcessor:
         else:
             return '기타'
     
-    def clean_scale_name(self, scale_str):
-        """규모명 정제"""
-        scale_str = str(scale_str).strip()
-        
-        if '대기업' in scale_str or '대규모' in scale_str:
-            return '대기업'
-        elif '중기업' in scale_str or '중규모' in scale_str:
-            return '중기업'
-        elif '소기업' in scale_str or '소규모' in scale_str:
-            return '소기업'
-        elif '연구' in scale_str:
-            return '연구기관'
-        else:
-            return '기타'
-    
     def process_patent_data(self):
         """특허 데이터 처리"""
         print("\n📋 특허 데이터 처리 중...")
         
-        file_path = self.raw_dir / 'patent_data.csv'
-        if not file_path.exists():
-            print("   ❌ patent_data.csv 파일 없음")
-            return
-        
-        df = self.read_csv_safely(file_path)
-        if df is None:
-            return
-        
-        # 특허 데이터 구조 변환
-        processed_data = []
-        
-        for idx, row in df.iterrows():
-            if idx == 0:  # 헤더 건너뛰기
-                continue
-                
-            try:
-                field_info = str(row.iloc[0]) if len(row) > 0 and pd.notna(row.iloc[0]) else ""
-                tech_info = str(row.iloc[1]) if len(row) > 1 and pd.notna(row.iloc[1]) else ""
-                
-                # 연도별 데이터 처리
-                for col_idx in range(2, min(len(row), 6)):  # 최대 4년치 데이터
-                    if pd.notna(row.iloc[col_idx]):
-                        value = str(row.iloc[col_idx]).replace(',', '')
-                        if value.replace('.', '').isdigit():
-                            processed_data.append({
-                                'year': 2019 + (col_idx - 2),
-                                'field': self.clean_field_name(field_info),
-                                'tech_name': tech_info,
-                                'patent_count': int(float(value)),
-                                'category': self.clean_field_name(field_info)
-                            })
-            except:
-                continue
-        
-        if processed_data:
-            result_df = pd.DataFrame(processed_data)
-            output_file = self.processed_dir / 'patent_data.csv'
-            result_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-            print(f"   ✅ 특허 데이터 저장: {output_file} ({len(result_df)}행)")
-        else:
-            print("   ❌ 특허 데이터 처리 실패")
+        chunks = self.iter_kosis_long('patent_data.csv')
+        return self.save_processed((self.build_patent_data(long_df) for long_df in chunks),
+                                   'patent_data.csv', '특허 데이터')
+    
+    def build_patent_data(self, long_df):
+        """특허 롱 포맷 → 연도/기술별 등록·보유 건수"""
+        # 측정항목명 → 컬럼명
+        measure_cols = pd.Series(np.nan, index=long_df.index, dtype=object)
+        for keyword, column in PATENT_MEASURES.items():
+            measure_cols = measure_cols.mask(long_df['measure'].str.contains(keyword, regex=False), column)
+        long_df = long_df.assign(measure=measure_cols).dropna(subset=['measure'])
+        
+        result_df = long_df.pivot_table(
+            index=['year', 'field', 'tech_name'],
+            columns='measure',
+            values='value',
+            aggfunc='sum'
+        ).reset_index()
+        result_df.columns.name = None
+        
+        for column in PATENT_MEASURES.values():
+            if column not in result_df.columns:
+                result_df[column] = np.nan
+        
+        # 등록 건수가 없는 행 제외 (KOSIS '-' 표시)
+        result_df = result_df.dropna(subset=['patent_count'])
+        result_df['patent_count'] = result_df['patent_count'].astype(np.int64)
+        result_df['cumulative_patents'] = result_df['cumulative_patents'].fillna(0).astype(np.int64)
+        result_df['category'] = result_df['tech_name']
+        
+        return result_df[['year', 'field', 'category', 'tech_name', 'patent_count', 'cumulative_patents']]
     
     def process_lifecycle_data(self):
         """수명주기 데이터 처리"""
         print("\n🔄 수명주기 데이터 처리 중...")
         
-        file_path = self.raw_dir / 'lifecycle_data.csv'
-        if not file_path.exists():
-            print("   ❌ lifecycle_data.csv 파일 없음")
-            return
-        
-        df = self.read_csv_safely(file_path)
-        if df is None:
-            return
-        
-        # 수명주기 단계
-        lifecycle_stages = ['기초연구', '응용연구', '개발연구', '시제품제작', 
-                           '사업화준비', '시장진입', '시장확산', '성숙기']
-        
-        processed_data = []
-        
-        for idx, row in df.iterrows():
-            if idx == 0:
-                continue
-                
-            try:
-                field_info = str(row.iloc[0]) if len(row) > 0 and pd.notna(row.iloc[0]) else ""
-                tech_info = str(row.iloc[1]) if len(row) > 1 and pd.notna(row.iloc[1]) else ""
-                
-                # 각 수명주기 단계별 데이터
-                for stage_idx, stage in enumerate(lifecycle_stages):
-                    if stage_idx + 2 < len(row) and pd.notna(row.iloc[stage_idx + 2]):
-                        value = str(row.iloc[stage_idx + 2]).replace(',', '')
-                        if value.replace('.', '').isdigit():
-                            processed_data.append({
-                                'year': 2020,  # 기본 연도
-                                'field': self.clean_field_name(field_info),
-                                'tech_name': tech_info,
-                                'lifecycle_stage': stage,
-                                'project_count': int(float(value)),
-                                'stage_order': stage_idx + 1
-                            })
-            except:
-                continue
-        
-        if processed_data:
-            result_df = pd.DataFrame(processed_data)
-            output_file = self.processed_dir / 'lifecycle_data.csv'
-            result_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-            print(f"   ✅ 수명주기 데이터 저장: {output_file} ({len(result_df)}행)")
-        else:
-            print("   ❌ 수명주기 데이터 처리 실패")
+        chunks = self.iter_kosis_long('lifecycle_data.csv')
+        return self.save_processed((self.build_lifecycle_data(long_df) for long_df in chunks),
+                                   'lifecycle_data.csv', '수명주기 데이터')
+    
+    def build_lifecycle_data(self, long_df):
+        """수명주기 롱 포맷 → 기술/단계별 건수"""
+        # 단계 순서는 KOSIS 헤더 순서를 따름 (값 유무와 관계없이 청크마다 동일)
+        stages = pd.unique(long_df['measure'])
+        long_df = long_df.dropna(subset=['value'])
+        stage_order = pd.Series(np.arange(1, len(stages) + 1), index=stages)
+        
+        return pd.DataFrame({
+            'year': long_df['year'],
+            'field': long_df['field'],
+            'tech_name': long_df['tech_name'],
+            'lifecycle_stage': long_df['measure'],
+            'project_count': long_df['value'].astype(np.int64),
+            'stage_order': long_df['measure'].map(stage_order).astype(np.int64)
+        }).reset_index(drop=True)
     
     def process_overseas_data(self):
         """해외진출 데이터 처리"""
         print("\n🌏 해외진출 데이터 처리 중...")
         
-        file_path = self.raw_dir / 'overseas_data.csv'
-        if not file_path.exists():
-            print("   ❌ overseas_data.csv 파일 없음")
-            return
-        
-        df = self.read_csv_safely(file_path)
-        if df is None:
-            return
-        
-        # 지역 좌표 매핑
-        region_coords = {
-            '동남아시아': (10.0, 110.0, '베트남, 태국, 인도네시아'),
-            '중국': (35.0, 104.0, '중국'),
-            '일본': (36.0, 138.0, '일본'),
-            '유럽': (54.0, 15.0, '독일, 프랑스, 영국'),
-            '북미': (45.0, -100.0, '미국, 캐나다'),
-            '중동': (25.0, 45.0, 'UAE, 사우디아라비아'),
-            '남미': (-15.0, -60.0, '브라질, 아르헨티나'),
-            '아프리카': (0.0, 20.0, '남아프리카공화국, 이집트')
-        }
-        
-        processed_data = []
-        
-        for idx, row in df.iterrows():
-            if idx == 0:
-                continue
-                
-            try:
-                field_info = str(row.iloc[0]) if len(row) > 0 and pd.notna(row.iloc[0]) else ""
-                tech_info = str(row.iloc[1]) if len(row) > 1 and pd.notna(row.iloc[1]) else ""
-                
-                # 지역별 데이터 처리
-                for col_idx in range(2, len(row)):
-                    if pd.notna(row.iloc[col_idx]):
-                        value = str(row.iloc[col_idx]).replace(',', '')
-                        if value.replace('.', '').isdigit():
-                            # 지역명 추정 (컬럼 인덱스 기반)
-                            region_names = list(region_coords.keys())
-                            region = region_names[(col_idx - 2) % len(region_names)]
-                            
-                            coords = region_coords[region]
-                            
-                            processed_data.append({
-                                'year': 2020,
-                                'region': region,
-                                'field': self.clean_field_name(field_info),
-                                'tech_name': tech_info,
-                                'export_count': int(float(value)),
-                                'latitude': coords[0],
-                                'longitude': coords[1],
-                                'countries': coords[2]
-                            })
-            except:
-                continue
-        
-        if processed_data:
-            result_df = pd.DataFrame(processed_data)
-            output_file = self.processed_dir / 'overseas_data.csv'
-            result_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-            print(f"   ✅ 해외진출 데이터 저장: {output_file} ({len(result_df)}행)")
-        else:
-            print("   ❌ 해외진출 데이터 처리 실패")
+        chunks = self.iter_kosis_long('overseas_data.csv')
+        return self.save_processed((self.build_overseas_data(long_df) for long_df in chunks),
+                                   'overseas_data.csv', '해외진출 데이터')
+    
+    def build_overseas_data(self, long_df):
+        """해외진출 롱 포맷 → 지역/기술별 진출 건수 + 좌표"""
+        long_df = long_df.dropna(subset=['value'])
+        
+        coords = pd.DataFrame.from_dict(
+            REGION_COORDS, orient='index', columns=['latitude', 'longitude', 'countries']
+        )
+        region_coords = coords.reindex(long_df['measure'].to_numpy())
+        
+        return pd.DataFrame({
+            'year': long_df['year'].to_numpy(),
+            'region': long_df['measure'].to_numpy(),
+            'field': long_df['field'].to_numpy(),
+            'tech_name': long_df['tech_name'].to_numpy(),
+            'export_count': long_df['value'].astype(np.int64).to_numpy(),
+            'latitude': region_coords['latitude'].to_numpy(),
+            'longitude': region_coords['longitude'].to_numpy(),
+            'countries': region_coords['countries'].to_numpy()
+        })
     
     def verify_processed_data(self):
-        """처리된 데이터 검증"""
+        """처리된 데이터 검증 결과 요약 (ETL 저장 시 기록한 보고서 기준)"""
         print("\n📊 처리된 데이터 검증")
         print("-" * 30)
         
-        processed_files = list(self.processed_dir.glob('*.csv'))
+        report = load_validation_report(self.processed_dir)
+        if not report:
+            print("⚠️ 검증 보고서가 없습니다. 데이터 처리를 먼저 실행하세요.")
+            return report
         
-        for file_path in processed_files:
-            try:
-                df = pd.read_csv(file_path)
-                print(f"✅ {file_path.name}: {len(df)}행 x {len(df.columns)}열")
-                
-                # 샘플 데이터 표시
-                if len(df) > 0:
-                    print(f"   📋 컬럼: {list(df.columns)}")
-                    print(f"   📊 샘플: {df.iloc[0].to_dict()}")
-                print()
-                
-            except Exception as e:
-                print(f"❌ {file_path.name}: 읽기 실패 - {str(e)}")
+        for name, validation in report.items():
+            icon = '✅' if validation['status'] == 'passed' else '❌'
+            print(f"{icon} {name}: {validation['rows']}행 ({validation['validated_at'][:19]})")
+            self.print_violations(validation)
+        
+        return report
+    
+    def print_violations(self, validation):
+        """검증 위반 항목 출력"""
+        for violation in validation['violations']:
+            examples = f" 예: {violation['examples']}" if violation['examples'] else ""
+            print(f"   ⚠️ {violation['check']} [{violation['column']}]: {violation['count']}건{examples}")
 
 def main():
     """메인 실행 함수"""
-    processor = RealDataProcessor()
-    processor.process_all_data()
+    parser = argparse.ArgumentParser(description='KOSIS 실제 데이터 처리')
+    parser.add_argument('--incremental', action='store_true',
+                        help='입력이 바뀐 데이터셋만 다시 처리')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='병렬 처리 워커 수 (2 이상이면 프로세스 풀 사용)')
+    parser.add_argument('--chunksize', type=int, default=None,
+                        help='스트리밍 처리 시 한 번에 읽는 행 수 (대용량 KOSIS 파일용)')
+    args = parser.parse_args()
+    
+    processor = RealDataProcessor(chunksize=args.chunksize)
+    processor.process_all_data(incremental=args.incremental, workers=args.workers)
     
     print("\n🎯 다음 단계:")
     print("streamlit run main.py --server.port=8502")
@@ -0,0 +1,233 @@
+"""
+처리 데이터 버전 게시
+
+ETL이 processed 폴더에 만든 결과를 내용 주소 기반 스냅샷으로 게시합니다.
+
+- objects/<해시 앞 2자리>/<sha256>: 파일 내용 저장소 (같은 내용은 한 번만 저장)
+- <스냅샷 ID>/: 파일명 → 객체 하드링크 (게시 후 변경하지 않음)
+- CURRENT: 현재 스냅샷 ID (os.replace로 원자적 교체)
+- history.json: 게시/롤백 기록
+
+읽는 쪽은 CURRENT가 가리키는 스냅샷 폴더 하나만 보므로 항상 같은 시점의 파일 묶음을 읽고,
+게시 중에도 기존 스냅샷은 그대로 남아 있어 진행 중인 세션에 영향이 없습니다.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# 상위 디렉토리 추가 (python data/publish.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.etl_manifest import file_sha256
+from data.paths import DATA_ROOT, PROCESSED_DIR
+
+SNAPSHOT_ROOT = DATA_ROOT / 'snapshots'
+
+# 정리 시 남겨 둘 최근 스냅샷 수 (현재 스냅샷 포함)
+KEEP_SNAPSHOTS = 5
+
+class SnapshotStore:
+    """내용 주소 기반 스냅샷 저장소"""
+
+    def __init__(self, root=SNAPSHOT_ROOT):
+        self.root = Path(root)
+        self.objects_dir = self.root / 'objects'
+        self.current_path = self.root / 'CURRENT'
+        self.history_path = self.root / 'history.json'
+
+    def _write_atomic(self, path, text):
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+
+    def current_id(self):
+        """현재 스냅샷 ID (게시 전이면 None)"""
+        try:
+            snapshot_id = self.current_path.read_text(encoding='utf-8').strip()
+        except FileNotFoundError:
+            return None
+        return snapshot_id if (self.root / snapshot_id).is_dir() else None
+
+    def snapshot_dir(self, snapshot_id=None):
+        """스냅샷 폴더 (ID가 없거나 정리된 스냅샷이면 현재 스냅샷, 게시 전이면 None)"""
+        if snapshot_id and (self.root / snapshot_id).is_dir():
+            return self.root / snapshot_id
+        current = self.current_id()
+        return self.root / current if current else None
+
+    def history(self):
+        """게시/롤백 기록"""
+        try:
+            with open(self.history_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _record(self, entry):
+        history = self.history() + [entry]
+        self._write_atomic(self.history_path, json.dumps(history, ensure_ascii=False, indent=2))
+
+    def _store_object(self, file_path, digest):
+        """파일 내용을 객체 저장소에 추가 (이미 있으면 재사용)"""
+        object_path = self.objects_dir / digest[:2] / digest
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_name(f'{digest}.{os.getpid()}.tmp')
+            shutil.copy2(file_path, tmp_path)
+            os.replace(tmp_path, object_path)
+        return object_path
+
+    def _link(self, object_path, target_path):
+        """객체를 스냅샷에 하드링크 (지원하지 않는 파일시스템이면 복사)"""
+        try:
+            os.link(object_path, target_path)
+        except OSError:
+            shutil.copy2(object_path, target_path)
+
+    def _stale_columnar(self, file_path):
+        csv_path = file_path.with_suffix('.csv')
+        return (file_path.suffix == '.parquet' and csv_path.exists() and
+                file_path.stat().st_mtime_ns < csv_path.stat().st_mtime_ns)
+
+    def publish(self, source_dir, patterns=('*.csv', '*.parquet', '*.json')):
+        """source_dir 파일로 스냅샷을 만들고 CURRENT 전환 (같은 내용이면 기존 스냅샷 재사용)"""
+        source_dir = Path(source_dir)
+        files = sorted({p for pattern in patterns for p in source_dir.glob(pattern) if p.is_file()})
+        # CSV보다 오래된 파케이 사본은 게시하지 않음 (스냅샷 안에서는 사본을 그대로 신뢰)
+        files = [p for p in files if not self._stale_columnar(p)]
+        if not files:
+            print("   ❌ 게시할 파일이 없습니다.")
+            return None
+
+        digests = {p.name: file_sha256(p) for p in files}
+        listing = ''.join(f'{name}\t{digest}\n' for name, digest in sorted(digests.items()))
+        snapshot_id = hashlib.sha256(listing.encode('utf-8')).hexdigest()[:16]
+        snapshot_dir = self.root / snapshot_id
+
+        if not snapshot_dir.is_dir():
+            # 임시 폴더에 모두 링크한 뒤 이름 변경 (반쯤 만들어진 스냅샷이 보이지 않도록)
+            tmp_dir = self.root / f'.{snapshot_id}.{os.getpid()}.tmp'
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            tmp_dir.mkdir(parents=True)
+            try:
+                for p in files:
+                    self._link(self._store_object(p, digests[p.name]), tmp_dir / p.name)
+                os.replace(tmp_dir, snapshot_dir)
+            except OSError:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+                if not snapshot_dir.is_dir():
+                    raise
+
+        if self.current_id() == snapshot_id:
+            print(f"   ⏭️ 게시 내용 변경 없음 (스냅샷 {snapshot_id})")
+            return snapshot_id
+
+        self._write_atomic(self.current_path, snapshot_id)
+        self._record({
+            'snapshot': snapshot_id,
+            'action': 'publish',
+            'files': len(files),
+            'time': datetime.now().isoformat()
+        })
+        print(f"   📦 스냅샷 게시: {snapshot_id} ({len(files)}개 파일)")
+
+        self.prune()
+        return snapshot_id
+
+    def rollback(self, snapshot_id=None):
+        """이전(또는 지정한) 스냅샷으로 CURRENT 전환"""
+        current = self.current_id()
+
+        if snapshot_id is None:
+            # 기록상 현재 이전에 게시된 스냅샷 중 남아 있는 것
+            previous = [entry['snapshot'] for entry in self.history()
+                        if entry['snapshot'] != current and (self.root / entry['snapshot']).is_dir()]
+            if not previous:
+                print("   ❌ 되돌릴 스냅샷이 없습니다.")
+                return None
+            snapshot_id = previous[-1]
+
+        if not (self.root / snapshot_id).is_dir():
+            print(f"   ❌ 스냅샷 없음: {snapshot_id}")
+            return None
+
+        self._write_atomic(self.current_path, snapshot_id)
+        self._record({
+            'snapshot': snapshot_id,
+            'action': 'rollback',
+            'from': current,
+            'time': datetime.now().isoformat()
+        })
+        print(f"   ↩️ 롤백: {current} → {snapshot_id}")
+        return snapshot_id
+
+    def list_snapshots(self):
+        """남아 있는 스냅샷 ID (오래된 순)"""
+        snapshots = [p for p in self.root.iterdir()
+                     if p.is_dir() and p.name != 'objects' and not p.name.startswith('.')] if self.root.exists() else []
+        return [p.name for p in sorted(snapshots, key=lambda p: p.stat().st_mtime_ns)]
+
+    def prune(self, keep=KEEP_SNAPSHOTS):
+        """오래된 스냅샷과 참조 없는 객체 정리 (현재 스냅샷은 항상 유지)"""
+        current = self.current_id()
+
+        # 최근에 게시/롤백된 순서로 남길 스냅샷 결정
+        recent = []
+        for entry in reversed(self.history()):
+            if entry['snapshot'] not in recent:
+                recent.append(entry['snapshot'])
+        keep_ids = set(recent[:keep]) | {current}
+
+        for snapshot_id in self.list_snapshots():
+            if snapshot_id not in keep_ids:
+                shutil.rmtree(self.root / snapshot_id, ignore_errors=True)
+
+        # 하드링크 수가 1이면 어떤 스냅샷도 참조하지 않는 객체
+        if self.objects_dir.exists():
+            for object_path in self.objects_dir.glob('*/*'):
+                try:
+                    if object_path.stat().st_nlink == 1 and not object_path.name.endswith('.tmp'):
+                        object_path.unlink()
+                except OSError:
+                    continue
+
+_default_store = None
+
+def get_snapshot_store():
+    """기본 스냅샷 저장소"""
+    global _default_store
+    if _default_store is None:
+        _default_store = SnapshotStore()
+    return _default_store
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='처리 데이터 스냅샷 관리')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    subparsers.add_parser('list', help='스냅샷 목록')
+    publish_parser = subparsers.add_parser('publish', help='processed 폴더를 스냅샷으로 게시')
+    publish_parser.add_argument('--source', default=str(PROCESSED_DIR))
+    rollback_parser = subparsers.add_parser('rollback', help='이전 스냅샷으로 되돌리기')
+    rollback_parser.add_argument('snapshot', nargs='?', default=None)
+    args = parser.parse_args()
+
+    store = get_snapshot_store()
+    if args.command == 'list':
+        current = store.current_id()
+        for snapshot_id in store.list_snapshots():
+            marker = '👉' if snapshot_id == current else '  '
+            print(f"{marker} {snapshot_id} ({len(list((store.root / snapshot_id).iterdir()))}개 파일)")
+    elif args.command == 'publish':
+        store.publish(args.source)
+    else:
+        store.rollback(args.snapshot)
+
+if __name__ == "__main__":
+    main()
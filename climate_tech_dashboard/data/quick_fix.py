@@ -1,5 +1,12 @@
 import pandas as pd
 from pathlib import Path
+import os
+import sys
+
+# 상위 디렉토리 추가 (python data/quick_fix.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.encoding import detect_encoding, transcode_file
 
 def quick_fix():
     """빠른 파일 수정"""
@@ -12,34 +19,32 @@ def quick_fix():
     for file_path in csv_files:
         print(f"\n🔧 수정 중: {file_path.name}")
         
-        # UTF-8로 읽기 시도
+        # 감지한 인코딩으로 한 번만 읽기
+        encoding = detect_encoding(file_path)
+        
+        if encoding == 'cp949':
+            print(f"   ✅ 이미 CP949 파일")
+            continue
+        
         try:
-            df = pd.read_csv(file_path, encoding='utf-8')
-            print(f"   ✅ UTF-8로 읽기 성공!")
-            print(f"   📊 데이터 형태: {df.shape}")
+            # 형태 확인은 앞부분만 읽기
+            df = pd.read_csv(file_path, encoding=encoding, nrows=5)
+            print(f"   ✅ {encoding}로 읽기 성공!")
             print(f"   📋 컬럼명: {list(df.columns)[:3]}...")
             
-            # CP949로 다시 저장
-            df.to_csv(file_path, index=False, encoding='cp949')
+            # CP949로 다시 저장 (청크 단위 변환 후 교체)
+            tmp_path = file_path.with_name(f'{file_path.name}.tmp')
+            try:
+                transcode_file(file_path, tmp_path, encoding, 'cp949')
+                os.replace(tmp_path, file_path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
             print(f"   ✅ CP949로 저장 완료")
             
         except Exception as e:
-            print(f"   ❌ UTF-8 실패: {str(e)}")
-            
-            # UTF-8-sig로 시도
-            try:
-                df = pd.read_csv(file_path, encoding='utf-8-sig')
-                print(f"   ✅ UTF-8-sig로 읽기 성공!")
-                print(f"   📊 데이터 형태: {df.shape}")
-                
-                # CP949로 다시 저장
-                df.to_csv(file_path, index=False, encoding='cp949')
-                print(f"   ✅ CP949로 저장 완료")
-                
-            except Exception as e2:
-                print(f"   ❌ UTF-8-sig도 실패: {str(e2)}")
+            print(f"   ❌ {encoding} 변환 실패: {str(e)}")
     
     print("\n🎉 수정 완료!")
 
 if __name__ == "__main__":
-    quick_fix()
\ No newline at end of file
+    quick_fix()
@@ -0,0 +1,367 @@
+"""
+백그라운드 데이터 갱신
+
+수집(HybridDataCollector)과 처리(RealDataProcessor)를 작업 스레드에서 실행합니다.
+- 주기 실행(config/app_config.json의 auto_refresh, data_refresh_interval) 또는 요청 시 실행
+- 진행 상황과 결과는 작업 기록 파일(JSON)에 남겨 다른 프로세스(run_app, Streamlit 서버)에서도 조회
+- 갱신은 잠금 파일로 프로세스 전체에서 한 번에 하나만 실행
+- 작업 기록 읽기-수정-쓰기는 기록 잠금 파일을 잡고 실행 (프로세스 간 갱신 유실 방지)
+- 스케줄러는 Streamlit 서버 프로세스가 가짐 (run_app은 DASHBOARD_REFRESH_ON_START로 시작 갱신만 요청)
+
+서버 시작이나 화면 재실행은 갱신이 끝나기를 기다리지 않습니다.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+import traceback
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from data.paths import PACKAGE_ROOT, DATA_ROOT
+
+JOBS_PATH = DATA_ROOT / '.refresh_jobs.json'
+LOCK_PATH = DATA_ROOT / '.refresh.lock'
+CONFIG_PATH = PACKAGE_ROOT / 'config' / 'app_config.json'
+
+# 서버 프로세스 스케줄러가 처음 만들어질 때 전체 갱신을 요청 (run_app이 설정)
+REFRESH_ON_START_ENV = 'DASHBOARD_REFRESH_ON_START'
+
+# 작업 기록 잠금 대기 (읽기-수정-쓰기는 밀리초 단위라 이보다 오래된 잠금은 비정상 종료로 봄)
+REGISTRY_LOCK_TIMEOUT = 10
+REGISTRY_LOCK_STALE_AFTER = timedelta(seconds=30)
+REGISTRY_LOCK_POLL = 0.01
+
+# 작업 기록 보관 수
+MAX_JOBS = 20
+
+# 작업별 로그 보관 줄 수
+MAX_LOG_LINES = 50
+
+# 이 시간이 지난 잠금은 비정상 종료로 보고 해제
+LOCK_STALE_AFTER = timedelta(hours=6)
+
+# 이 시간 동안 시작되지 않은 대기 작업은 요청한 프로세스가 종료된 것으로 봄
+QUEUE_STALE_AFTER = timedelta(minutes=10)
+
+# 작업 종류 → 표시 이름
+JOB_KINDS = {
+    'full': '전체 갱신 (수집 + 처리)',
+    'process': 'raw 파일 처리'
+}
+
+ACTIVE_STATUSES = ('queued', 'running')
+
+class RefreshJobRegistry:
+    """갱신 작업 기록 (파일 공유, 최신 작업이 앞)"""
+
+    def __init__(self, jobs_path=JOBS_PATH, lock_path=LOCK_PATH):
+        self.jobs_path = Path(jobs_path)
+        self.lock_path = Path(lock_path)
+        self.registry_lock_path = self.jobs_path.with_name(f'{self.jobs_path.name}.lock')
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self):
+        """작업 기록 읽기-수정-쓰기 잠금 (스레드 + 프로세스 간 잠금 파일)"""
+        with self._lock:
+            self.registry_lock_path.parent.mkdir(parents=True, exist_ok=True)
+            deadline = time.monotonic() + REGISTRY_LOCK_TIMEOUT
+            while True:
+                try:
+                    fd = os.open(self.registry_lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                    break
+                except FileExistsError:
+                    try:
+                        age = time.time() - self.registry_lock_path.stat().st_mtime
+                        if age > REGISTRY_LOCK_STALE_AFTER.total_seconds():
+                            self.registry_lock_path.unlink(missing_ok=True)  # 비정상 종료로 남은 잠금
+                            continue
+                    except FileNotFoundError:
+                        continue
+                    if time.monotonic() > deadline:
+                        raise TimeoutError(f"작업 기록 잠금 대기 시간 초과: {self.registry_lock_path}")
+                    time.sleep(REGISTRY_LOCK_POLL)
+            try:
+                os.write(fd, str(os.getpid()).encode('ascii'))
+                os.close(fd)
+                yield
+            finally:
+                self.registry_lock_path.unlink(missing_ok=True)
+
+    def _load(self):
+        try:
+            with open(self.jobs_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return []
+
+    def _save(self, jobs):
+        self.jobs_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.jobs_path.with_name(f'{self.jobs_path.name}.{os.getpid()}.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(jobs[:MAX_JOBS], f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.jobs_path)
+
+    def jobs(self):
+        """작업 목록 (실행 중이던 프로세스가 종료된 작업은 중단으로 표시)"""
+        holder = self.lock_holder()
+        now = datetime.now()
+        jobs = self._load()
+        for job in jobs:
+            if job['status'] == 'running' and job['id'] != holder:
+                job['status'] = 'interrupted'
+            elif job['status'] == 'queued' and now - datetime.fromisoformat(job['created_at']) > QUEUE_STALE_AFTER:
+                job['status'] = 'interrupted'
+        return jobs
+
+    def get(self, job_id):
+        return next((job for job in self.jobs() if job['id'] == job_id), None)
+
+    def active(self):
+        """대기 중이거나 실행 중인 작업"""
+        return next((job for job in self.jobs() if job['status'] in ACTIVE_STATUSES), None)
+
+    def create_unless_active(self, kind, trigger):
+        """대기/실행 중인 작업이 없을 때만 작업 생성 → (작업, 새로 만들었는지)
+
+        확인과 생성을 한 잠금 안에서 해 여러 프로세스가 동시에 요청해도 작업은 하나만 생김
+        """
+        with self._locked():
+            active = self.active()
+            if active is not None:
+                return active, False
+            return self._create(kind, trigger), True
+
+    def create(self, kind, trigger):
+        with self._locked():
+            return self._create(kind, trigger)
+
+    def _create(self, kind, trigger):
+        job = {
+            'id': uuid.uuid4().hex[:12],
+            'kind': kind,
+            'trigger': trigger,
+            'status': 'queued',
+            'progress': 0.0,
+            'step': '대기 중',
+            'created_at': datetime.now().isoformat(),
+            'started_at': None,
+            'finished_at': None,
+            'error': None,
+            'pid': os.getpid(),
+            'log': []
+        }
+        self._save([job] + self._load())
+        return job
+
+    def update(self, job_id, message=None, **fields):
+        """작업 상태 갱신 (message는 로그에 추가)"""
+        with self._locked():
+            jobs = self._load()
+            for job in jobs:
+                if job['id'] == job_id:
+                    job.update(fields)
+                    if message:
+                        job['log'] = (job['log'] + [f"{datetime.now():%H:%M:%S} {message}"])[-MAX_LOG_LINES:]
+                    break
+            self._save(jobs)
+
+    def last_finished(self):
+        """마지막으로 끝난 작업의 종료 시각"""
+        finished = [job['finished_at'] for job in self._load() if job.get('finished_at')]
+        return datetime.fromisoformat(max(finished)) if finished else None
+
+    def lock_holder(self):
+        """갱신 잠금을 가진 작업 ID (없거나 오래된 잠금이면 None)"""
+        try:
+            with open(self.lock_path, 'r', encoding='utf-8') as f:
+                lock = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if datetime.now() - datetime.fromisoformat(lock['time']) > LOCK_STALE_AFTER:
+            return None
+        return lock['job_id']
+
+    def acquire(self, job_id):
+        """갱신 잠금 획득 (다른 프로세스가 실행 중이면 False)"""
+        if self.lock_path.exists() and self.lock_holder() is None:
+            self.lock_path.unlink(missing_ok=True)  # 비정상 종료로 남은 잠금
+
+        self.lock_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            return False
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump({'job_id': job_id, 'pid': os.getpid(), 'time': datetime.now().isoformat()}, f)
+        return True
+
+    def release(self, job_id):
+        if self.lock_holder() == job_id:
+            self.lock_path.unlink(missing_ok=True)
+
+def load_refresh_config(config_path=CONFIG_PATH):
+    """앱 설정의 자동 갱신 주기 (자동 갱신을 끄면 None)"""
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if not config.get('auto_refresh'):
+        return None
+    return timedelta(hours=float(config.get('data_refresh_interval', 24)))
+
+def run_refresh_job(job, registry):
+    """갱신 작업 실행 (작업 스레드)"""
+    # 수집 모듈은 작업을 실행할 때만 로드 (페이지 로딩 시간에 영향 없음)
+    from data.scraping import HybridDataCollector
+
+    def step(progress, label):
+        registry.update(job['id'], message=label, progress=progress, step=label)
+
+    collector = HybridDataCollector()
+
+    if job['kind'] == 'full':
+        steps = {
+            'classification': (0.05, '🔍 CTIS 분류체계 수집'),
+            'detail': (0.25, '📖 CTIS 상세정보 수집')
+        }
+        # 주기 갱신은 매번 새 수집 (변경 여부는 ETag/내용 해시로 판단),
+        # 요청 갱신은 중단된 수집이 있으면 이어서 수집
+        collector.scrape_ctis(resume=job['trigger'] != 'scheduled', on_step=lambda name: step(*steps[name]))
+        step(0.55, '📥 KOSIS 통계표 수집')
+        collector.download_kosis_tables()
+
+    step(0.75, '📊 raw 파일 처리 및 게시')
+    collector.process_manual_files(incremental=True)
+
+class RefreshScheduler:
+    """갱신 작업 스레드 (주기 실행 + 요청 실행)"""
+
+    def __init__(self, registry=None, interval=None):
+        self.registry = registry or RefreshJobRegistry()
+        self.interval = interval
+        self._wake = threading.Event()
+        self._pending = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._current_job = None
+        # 다른 프로세스에서 실행한 갱신도 주기 계산에 반영
+        self._last_run = self.registry.last_finished()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """작업 스레드 시작 (이미 실행 중이면 그대로)"""
+        with self._lock:
+            if not self.running:
+                self._thread = threading.Thread(target=self._loop, name='data-refresh', daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        """프로세스 종료 전 정리 (진행 중인 작업은 중단 처리되도록 잠금 해제)
+
+        작업 스레드는 데몬 스레드라 프로세스와 함께 종료됨
+        """
+        job = self._current_job
+        if job is not None:
+            self.registry.update(job['id'], message='⚠️ 프로세스 종료로 중단', status='interrupted',
+                                 finished_at=datetime.now().isoformat())
+            self.registry.release(job['id'])
+
+    def request(self, kind='full', trigger='manual'):
+        """갱신 요청 → 작업 기록 (이미 대기/실행 중인 작업이 있으면 그 작업)"""
+        with self._lock:
+            job, created = self.registry.create_unless_active(kind, trigger)
+            if not created:
+                return job
+            self._pending.append(job)
+        self.start()
+        self._wake.set()
+        return job
+
+    def _next_timeout(self):
+        if self.interval is None:
+            return None
+        if self._last_run is None:
+            return 0
+        return max((self._last_run + self.interval - datetime.now()).total_seconds(), 0)
+
+    def _loop(self):
+        while True:
+            self._wake.wait(self._next_timeout())
+            self._wake.clear()
+
+            with self._lock:
+                job = self._pending.pop(0) if self._pending else None
+
+            if job is None:
+                if self._next_timeout() != 0:
+                    continue
+                job = self.request_scheduled()
+                if job is None:
+                    continue
+
+            self._run(job)
+            if self._pending:
+                self._wake.set()
+
+    def request_scheduled(self):
+        """주기 실행 작업 생성 (다른 작업이 진행 중이면 이번 주기는 건너뜀)"""
+        self._last_run = datetime.now()
+        with self._lock:
+            job, created = self.registry.create_unless_active('full', 'scheduled')
+            return job if created else None
+
+    def _run(self, job):
+        self._last_run = datetime.now()
+        registry = self.registry
+
+        if not registry.acquire(job['id']):
+            registry.update(job['id'], message='⏭️ 다른 프로세스에서 갱신 중 - 건너뜀',
+                            status='skipped', finished_at=datetime.now().isoformat())
+            return
+
+        registry.update(job['id'], message=f"🚀 {JOB_KINDS[job['kind']]} 시작",
+                        status='running', started_at=datetime.now().isoformat(), pid=os.getpid())
+        self._current_job = job
+        try:
+            run_refresh_job(job, registry)
+            registry.update(job['id'], message='✅ 갱신 완료', status='succeeded', progress=1.0,
+                            step='완료', finished_at=datetime.now().isoformat())
+        except Exception as e:
+            registry.update(job['id'], message=f'❌ 갱신 실패: {str(e)}', status='failed',
+                            error=traceback.format_exc(), finished_at=datetime.now().isoformat())
+        finally:
+            self._current_job = None
+            registry.release(job['id'])
+
+_default_scheduler = None
+_default_lock = threading.Lock()
+
+def get_refresh_scheduler():
+    """기본 갱신 스케줄러 (프로세스당 하나, 자동 갱신 설정 시 주기 실행)
+
+    DASHBOARD_REFRESH_ON_START=1이면 처음 만들 때 전체 갱신도 요청 (run_app 실행 시)
+    """
+    global _default_scheduler
+    with _default_lock:
+        if _default_scheduler is None:
+            interval = load_refresh_config()
+            _default_scheduler = RefreshScheduler(interval=interval)
+            # 서버 종료 시 진행 중인 작업을 중단으로 표시하고 잠금 해제
+            atexit.register(_default_scheduler.stop)
+            if interval is not None:
+                _default_scheduler.start()
+            if os.environ.get(REFRESH_ON_START_ENV) == '1':
+                _default_scheduler.request(kind='full', trigger='startup')
+        return _default_scheduler
@@ -0,0 +1,301 @@
+"""
+샘플 데이터 생성
+
+처리 데이터가 없거나 읽을 수 없을 때 페이지가 쓰는 샘플 데이터셋을 만듭니다.
+- 시드를 지정한 numpy Generator로 배열 단위 추출 (행마다 난수 호출 없음)
+- 처리 데이터셋과 같은 컬럼/dtype (data/schemas.py)
+- 한 번 만든 결과는 assets/data/sample에 파케이로 저장해 다른 서버 프로세스도 같은 데이터를 바로 사용
+
+    python data/sample_data.py --force
+"""
+
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 상위 디렉토리 추가 (python data/sample_data.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_loader import DATA_ROOT, apply_dataset_schema, write_columnar
+
+SAMPLE_DIR = DATA_ROOT / 'sample'
+
+# 기본 시드
+SAMPLE_SEED = 42
+
+# 생성 규칙을 바꾸면 올려서 저장된 샘플을 다시 만들게 함
+SAMPLE_VERSION = 1
+
+# 분야별 가중치
+FIELD_WEIGHTS = {
+    'institution_data': {'감축': 1.2, '적응': 1.0, '융복합': 0.9},
+    'patent_data': {'감축': 1.5, '적응': 1.0, '융복합': 1.2}
+}
+
+# 기관 규모별 지표 분포 (평균, 표준편차)
+INSTITUTION_SCALES = {
+    '대기업': {'revenue': (50000, 15000), 'employees': (500, 150), 'rd_cost': (2000, 600), 'researchers': (50, 15)},
+    '중기업': {'revenue': (15000, 5000), 'employees': (150, 50), 'rd_cost': (600, 200), 'researchers': (20, 8)},
+    '소기업': {'revenue': (3000, 1000), 'employees': (30, 10), 'rd_cost': (150, 50), 'researchers': (5, 2)},
+    '연구기관': {'revenue': (8000, 2000), 'employees': (100, 30), 'rd_cost': (4000, 1000), 'researchers': (80, 20)},
+    '스타트업': {'revenue': (500, 200), 'employees': (15, 5), 'rd_cost': (100, 30), 'researchers': (8, 3)}
+}
+
+INSTITUTION_TECH_TYPES = ['재생에너지', '비재생에너지', '에너지효율', '수송', '에너지저장',
+                          '물관리', '농업', '해양수산', 'ICT융합']
+
+# 전년도 지표 비율 (2019년 = 2020년 × 비율)
+INSTITUTION_PREVIOUS_YEAR = {'revenue': 0.9, 'employees': 0.95, 'rd_cost': 0.85, 'researchers': 0.9}
+
+# 분야 → 카테고리 → 기술
+PATENT_TECHS = {
+    '감축': {
+        '재생에너지': ['태양광', '풍력', '수력', '지열', '바이오매스'],
+        '비재생에너지': ['원자력', 'CCUS', '청정석탄'],
+        '에너지효율': ['건물효율', '산업효율', 'LED조명'],
+        '수송': ['전기차', '수소차', '바이오연료'],
+        '에너지저장': ['배터리', '수소저장', '압축공기']
+    },
+    '적응': {
+        '물관리': ['홍수방어', '가뭄대응', '수자원관리'],
+        '농업': ['스마트팜', '기후적응작물', '정밀농업'],
+        '해양수산': ['해수면상승대응', '수산업적응'],
+        '생태계': ['생물다양성보전', '생태계복원'],
+        '건강': ['폭염대응', '감염병대응']
+    },
+    '융복합': {
+        'ICT융합': ['스마트그리드', 'AI기후예측', 'IoT모니터링'],
+        '바이오융합': ['바이오에너지', '바이오소재'],
+        '나노융합': ['나노태양전지', '나노필터']
+    }
+}
+
+PATENT_POPULAR_TECHS = ['태양광', '전기차', '스마트그리드', '배터리']
+
+LIFECYCLE_STAGES = ['기초연구', '응용연구', '개발연구', '시제품제작',
+                    '사업화준비', '시장진입', '시장확산', '성숙기']
+
+LIFECYCLE_TECHS = {
+    '감축': ['태양광', '풍력', '전기차', '배터리', '수소', 'CCUS', '원자력'],
+    '적응': ['스마트팜', '홍수방어', '가뭄대응', '기후예측', '생태복원'],
+    '융복합': ['스마트그리드', 'AI기후', 'IoT센서', '바이오융합']
+}
+
+# 기술 성숙도별 단계 분포 (성숙 기술은 후반, 신기술은 초기 단계에 집중)
+LIFECYCLE_PROFILES = {
+    'mature': [0.05, 0.08, 0.12, 0.15, 0.20, 0.25, 0.10, 0.05],
+    'emerging': [0.25, 0.20, 0.18, 0.15, 0.12, 0.07, 0.02, 0.01],
+    'default': [0.10, 0.15, 0.20, 0.20, 0.15, 0.12, 0.06, 0.02]
+}
+
+LIFECYCLE_TECH_PROFILES = {
+    '태양광': 'mature', '풍력': 'mature', '스마트팜': 'mature',
+    '수소': 'emerging', 'CCUS': 'emerging', 'AI기후': 'emerging', 'IoT센서': 'emerging'
+}
+
+# 연도별 분포 이동 (1년마다 초기 단계 -5%p, 후기 단계 +1.25%p)
+LIFECYCLE_YEAR_SHIFT = 0.05
+
+OVERSEAS_REGIONS = {
+    '동남아시아': {'countries': ['베트남', '태국', '인도네시아', '필리핀', '말레이시아'], 'lat': 10.0, 'lon': 110.0, 'weight': 1.5},
+    '중국': {'countries': ['중국'], 'lat': 35.0, 'lon': 104.0, 'weight': 2.0},
+    '일본': {'countries': ['일본'], 'lat': 36.0, 'lon': 138.0, 'weight': 1.2},
+    '중동': {'countries': ['UAE', '사우디아라비아', '카타르'], 'lat': 25.0, 'lon': 45.0, 'weight': 1.8},
+    '유럽': {'countries': ['독일', '프랑스', '영국', '네덜란드'], 'lat': 54.0, 'lon': 15.0, 'weight': 1.3},
+    '북미': {'countries': ['미국', '캐나다'], 'lat': 45.0, 'lon': -100.0, 'weight': 1.4},
+    '남미': {'countries': ['브라질', '아르헨티나', '칠레'], 'lat': -15.0, 'lon': -60.0, 'weight': 0.8},
+    '아프리카': {'countries': ['남아프리카공화국', '이집트', '모로코'], 'lat': 0.0, 'lon': 20.0, 'weight': 0.6},
+    '오세아니아': {'countries': ['호주', '뉴질랜드'], 'lat': -25.0, 'lon': 140.0, 'weight': 0.7}
+}
+
+OVERSEAS_TECHS = {
+    '감축': ['태양광', '풍력', '전기차', '배터리', '수소', 'ESS'],
+    '적응': ['스마트팜', '물관리', '기후예측', '방재시스템'],
+    '융복합': ['스마트그리드', 'AI기후', '그린빌딩', '스마트시티']
+}
+
+OVERSEAS_POPULAR_TECHS = ['태양광', '전기차', '스마트그리드', '배터리']
+
+def product_index(*sizes):
+    """차원 크기별 모든 조합의 위치 배열 (앞쪽 차원이 바깥 루프)"""
+    return [index.ravel() for index in np.indices(sizes)]
+
+def labels(values, codes):
+    """위치 배열 → 범주형 라벨 (문자열 배열을 만들지 않음)"""
+    return pd.Categorical.from_codes(codes, categories=list(values))
+
+def flatten_techs(tech_data):
+    """{분야: [기술]} → (분야 목록, 기술 목록, 기술별 분야 위치)"""
+    fields = list(tech_data)
+    techs = [tech for field in fields for tech in tech_data[field]]
+    tech_fields = np.repeat(np.arange(len(fields)), [len(tech_data[field]) for field in fields])
+    return fields, techs, tech_fields
+
+def generate_institution_data(rng):
+    """기관 현황 샘플 (규모 × 분야 × 기술 종류, 2020년과 전년도)"""
+    scales = list(INSTITUTION_SCALES)
+    field_weights = FIELD_WEIGHTS['institution_data']
+    scale_idx, field_idx, tech_idx = product_index(len(scales), len(field_weights), len(INSTITUTION_TECH_TYPES))
+    field_multiplier = np.array(list(field_weights.values()))[field_idx]
+
+    current, previous = {}, {}
+    for metric, ratio in INSTITUTION_PREVIOUS_YEAR.items():
+        params = np.array([INSTITUTION_SCALES[scale][metric] for scale in scales])
+        base = rng.normal(params[scale_idx, 0], params[scale_idx, 1]) * field_multiplier
+
+        if metric in ('employees', 'researchers'):
+            # 인원은 정수 (최소 1명)
+            current[metric] = np.maximum(np.trunc(base), 1)
+            previous[metric] = np.maximum(np.trunc(base * ratio), 1)
+        else:
+            current[metric] = np.maximum(base, 0)
+            previous[metric] = np.maximum(base * ratio, 0)
+
+    n = len(scale_idx)
+    return pd.DataFrame({
+        'scale': labels(scales, np.tile(scale_idx, 2)),
+        'field': labels(field_weights, np.tile(field_idx, 2)),
+        'tech_type': labels(INSTITUTION_TECH_TYPES, np.tile(tech_idx, 2)),
+        **{metric: np.concatenate([current[metric], previous[metric]]) for metric in current},
+        'year': np.repeat([2020, 2019], n)
+    })
+
+def generate_patent_data(rng):
+    """특허 샘플 (연도 × 분야/카테고리/기술, 연 10% 증가)"""
+    years = np.array([2018, 2019, 2020, 2021])
+    fields = list(PATENT_TECHS)
+    categories = [category for field in fields for category in PATENT_TECHS[field]]
+    category_fields = np.repeat(np.arange(len(fields)), [len(PATENT_TECHS[field]) for field in fields])
+    techs = [tech for field in fields for names in PATENT_TECHS[field].values() for tech in names]
+    tech_categories = np.repeat(np.arange(len(categories)),
+                                [len(names) for field in fields for names in PATENT_TECHS[field].values()])
+
+    year_idx, tech_idx = product_index(len(years), len(techs))
+    category_idx = tech_categories[tech_idx]
+    field_idx = category_fields[category_idx]
+
+    base = rng.integers(10, 200, size=len(tech_idx))
+    year_multiplier = 1 + (years[year_idx] - 2018) * 0.1
+    field_weight = np.array([FIELD_WEIGHTS['patent_data'][field] for field in fields])[field_idx]
+    tech_weight = np.where(np.isin(techs, PATENT_POPULAR_TECHS), 2.0, 1.0)[tech_idx]
+    patent_count = np.trunc(base * year_multiplier * field_weight * tech_weight).astype(np.int64)
+
+    return pd.DataFrame({
+        'year': years[year_idx],
+        'field': labels(fields, field_idx),
+        'category': labels(categories, category_idx),
+        'tech_name': labels(techs, tech_idx),
+        'patent_count': patent_count,
+        # 누적 특허 (단순화)
+        'cumulative_patents': patent_count * years[year_idx]
+    })
+
+def stage_weights(profiles, years):
+    """기술 성숙도 분포를 연도만큼 후반 단계로 이동 후 정규화 → (행, 단계) 배열"""
+    weights = np.array([LIFECYCLE_PROFILES[profile] for profile in profiles])
+    shift = ((np.asarray(years) - 2019) * LIFECYCLE_YEAR_SHIFT)[:, None]
+    early = len(LIFECYCLE_STAGES) // 2
+
+    weights[:, :early] = np.maximum(weights[:, :early] - shift, 0)
+    weights[:, early:] = np.minimum(weights[:, early:] + shift / 4, 1)
+    return weights / weights.sum(axis=1, keepdims=True)
+
+def generate_lifecycle_data(rng):
+    """수명주기 샘플 (연도 × 기술 × 단계, 해마다 후반 단계로 이동)"""
+    years = np.array([2019, 2020, 2021, 2022])
+    fields, techs, tech_fields = flatten_techs(LIFECYCLE_TECHS)
+    n_stages = len(LIFECYCLE_STAGES)
+    year_idx, tech_idx, stage_idx = product_index(len(years), len(techs), n_stages)
+
+    # (연도 × 기술) 행마다 단계 분포 한 벌
+    series_years, series_techs = product_index(len(years), len(techs))
+    profiles = [LIFECYCLE_TECH_PROFILES.get(techs[i], 'default') for i in series_techs]
+    weights = stage_weights(profiles, years[series_years])
+    total_projects = rng.integers(20, 100, size=weights.shape)
+
+    return pd.DataFrame({
+        'year': years[year_idx],
+        'field': labels(fields, tech_fields[tech_idx]),
+        'tech_name': labels(techs, tech_idx),
+        'lifecycle_stage': labels(LIFECYCLE_STAGES, stage_idx),
+        'project_count': np.trunc(total_projects * weights).astype(np.int64).ravel(),
+        'stage_order': stage_idx + 1
+    })
+
+def generate_overseas_data(rng):
+    """해외진출 샘플 (연도 × 지역 × 기술, 연 15% 증가)"""
+    years = np.array([2019, 2020, 2021, 2022])
+    regions = list(OVERSEAS_REGIONS)
+    fields, techs, tech_fields = flatten_techs(OVERSEAS_TECHS)
+    year_idx, region_idx, tech_idx = product_index(len(years), len(regions), len(techs))
+
+    region_info = [OVERSEAS_REGIONS[region] for region in regions]
+    region_weight = np.array([info['weight'] for info in region_info])[region_idx]
+    tech_weight = np.where(np.isin(techs, OVERSEAS_POPULAR_TECHS), 1.5, 1.0)[tech_idx]
+    year_multiplier = 1 + (years[year_idx] - 2019) * 0.15
+
+    base = rng.integers(5, 50, size=len(tech_idx))
+    count = np.trunc(base * region_weight * tech_weight)
+
+    return pd.DataFrame({
+        'year': years[year_idx],
+        'region': labels(regions, region_idx),
+        'field': labels(fields, tech_fields[tech_idx]),
+        'tech_name': labels(techs, tech_idx),
+        'export_count': np.trunc(count * year_multiplier).astype(np.int64),
+        'latitude': np.array([info['lat'] for info in region_info])[region_idx],
+        'longitude': np.array([info['lon'] for info in region_info])[region_idx],
+        'countries': labels([', '.join(info['countries']) for info in region_info], region_idx)
+    })
+
+# 데이터셋 → 샘플 생성 함수
+SAMPLE_GENERATORS = {
+    'institution_data': generate_institution_data,
+    'patent_data': generate_patent_data,
+    'lifecycle_data': generate_lifecycle_data,
+    'overseas_data': generate_overseas_data
+}
+
+def sample_path(name, seed=SAMPLE_SEED):
+    """저장된 샘플 파일 경로 (생성 규칙 버전과 시드별)"""
+    return SAMPLE_DIR / f'{name}.v{SAMPLE_VERSION}.seed{seed}.parquet'
+
+def generate_sample_dataset(name, seed=SAMPLE_SEED):
+    """샘플 데이터셋 생성 (같은 시드면 항상 같은 결과, 스키마 dtype 적용)"""
+    rng = np.random.default_rng(seed)
+    return apply_dataset_schema(SAMPLE_GENERATORS[name](rng), name)
+
+def load_sample_dataset(name, seed=SAMPLE_SEED, force=False):
+    """샘플 데이터셋 (저장된 파일이 있으면 읽고, 없으면 생성 후 저장)"""
+    path = sample_path(name, seed)
+    if path.exists() and not force:
+        try:
+            return pd.read_parquet(path, engine='pyarrow')
+        except Exception as e:
+            print(f"⚠️ 샘플 파일 읽기 실패, 다시 생성: {path.name} - {str(e)}")
+
+    df = generate_sample_dataset(name, seed)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 여러 프로세스가 동시에 만들어도 같은 내용으로 원자적 교체
+        write_columnar(df, path, name)
+    except OSError as e:
+        print(f"⚠️ 샘플 파일 저장 실패: {path.name} - {str(e)}")
+    return df
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='샘플 데이터 생성')
+    parser.add_argument('--seed', type=int, default=SAMPLE_SEED, help='난수 시드')
+    parser.add_argument('--force', action='store_true', help='저장된 샘플이 있어도 다시 생성')
+    args = parser.parse_args()
+
+    for name in SAMPLE_GENERATORS:
+        df = load_sample_dataset(name, seed=args.seed, force=args.force)
+        print(f"✅ {name}: {len(df)}행 → {sample_path(name, args.seed)}")
+
+if __name__ == "__main__":
+    main()
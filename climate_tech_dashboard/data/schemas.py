@@ -0,0 +1,96 @@
+"""
+처리 데이터셋 스키마
+
+processed 폴더 데이터셋별 데이터 계약 정의.
+분류 라벨(분야, 규모, 지역, 기술명 등)은 반복되는 문자열이므로 category로 저장합니다.
+
+- dtypes: 컬럼과 dtype (모든 컬럼 필수)
+- keys: 행을 유일하게 식별하는 컬럼 (중복 = 이중 집계)
+- categories: 허용 라벨
+- non_negative: 음수가 될 수 없는 측정값
+- nullable: 결측을 허용하는 컬럼
+- label_columns: KOSIS 합계/소계 라벨이 남아 있으면 안 되는 컬럼
+"""
+
+# 허용 연도 범위 (최댓값은 검증 시점 연도)
+MIN_YEAR = 2000
+
+# 기후기술 분야 (정제 후)
+CLIMATE_FIELDS = ['감축', '적응', '융복합']
+
+DATASET_SCHEMAS = {
+    'institution_data': {
+        'dtypes': {
+            'year': 'int16',
+            'field': 'category',
+            'scale': 'category',
+            'tech_type': 'category',
+            'revenue': 'float64',
+            'employees': 'float64',
+            'researchers': 'float64',
+            'rd_cost': 'float64'
+        },
+        'keys': ['year', 'field', 'scale', 'tech_type'],
+        'categories': {'field': CLIMATE_FIELDS},
+        'non_negative': ['revenue', 'employees', 'researchers', 'rd_cost'],
+        'nullable': [],
+        'label_columns': ['field', 'scale', 'tech_type']
+    },
+    'patent_data': {
+        'dtypes': {
+            'year': 'int16',
+            'field': 'category',
+            'category': 'category',
+            'tech_name': 'category',
+            'patent_count': 'int32',
+            'cumulative_patents': 'int32'
+        },
+        'keys': ['year', 'field', 'tech_name'],
+        'categories': {'field': CLIMATE_FIELDS},
+        'non_negative': ['patent_count', 'cumulative_patents'],
+        'nullable': [],
+        'label_columns': ['field', 'category', 'tech_name']
+    },
+    'lifecycle_data': {
+        'dtypes': {
+            'year': 'int16',
+            'field': 'category',
+            'tech_name': 'category',
+            'lifecycle_stage': 'category',
+            'project_count': 'int32',
+            'stage_order': 'int8'
+        },
+        'keys': ['year', 'field', 'tech_name', 'lifecycle_stage'],
+        'categories': {
+            'field': CLIMATE_FIELDS,
+            'lifecycle_stage': ['기술도입기', '기술개발기', '기술성장기', '기술성숙기', '기술쇠퇴기']
+        },
+        'non_negative': ['project_count', 'stage_order'],
+        'nullable': [],
+        'label_columns': ['field', 'tech_name', 'lifecycle_stage']
+    },
+    'overseas_data': {
+        'dtypes': {
+            'year': 'int16',
+            'region': 'category',
+            'field': 'category',
+            'tech_name': 'category',
+            'export_count': 'int32',
+            'latitude': 'float64',
+            'longitude': 'float64',
+            'countries': 'category'
+        },
+        'keys': ['year', 'region', 'field', 'tech_name'],
+        'categories': {
+            'field': CLIMATE_FIELDS,
+            'region': ['아시아태평양', '서유럽', '동유럽', '북미', '중남미', '중동아프리카', '기타']
+        },
+        'non_negative': ['export_count'],
+        # '기타' 지역은 좌표 없음
+        'nullable': ['latitude', 'longitude', 'countries'],
+        'label_columns': ['region', 'field', 'tech_name']
+    }
+}
+
+# 데이터셋별 컬럼 dtype
+DATASET_DTYPES = {name: schema['dtypes'] for name, schema in DATASET_SCHEMAS.items()}
@@ -1,36 +1,63 @@
-import requests
-from bs4 import BeautifulSoup
 import pandas as pd
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+import argparse
 import time
 import re
 from pathlib import Path
+from urllib.parse import urljoin
 import os
+import sys
+
+# 상위 디렉토리 추가 (python data/scraping.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_loader import STREAM_CHUNK_ROWS
+from data.encoding import detect_encoding
+from data.http_client import get_http_client
+from data.ctis_crawler import CtisDetailCrawler
+from data.ctis_parser import parse_classification_table
+from data.kosis_api import KosisApiClient, KOSIS_TABLES, table_url
+from data.crawl_journal import CrawlJournal
+from data.paths import DATA_ROOT
+from data.process_real_data import RealDataProcessor
+from data.validation import load_validation_report
+
+# CTIS 분류체계 페이지 (로컬 테스트 서버로 바꿀 때는 CTIS_CLASSIFICATION_URL 환경변수)
+CTIS_CLASSIFICATION_URL = 'https://www.ctis.re.kr/ko/techClass/classification.do?key=1141'
+
+# 상세 페이지 주소는 분류체계 표의 소분류 링크에서 읽음
+# 링크가 없는 페이지용 주소 템플릿은 CTIS_DETAIL_URL_TEMPLATE 환경변수로만 지정 ({no}: 소분류 번호)
+CTIS_DETAIL_URL_TEMPLATE = None
 
 class HybridDataCollector:
-    def __init__(self):
-        self.ctis_url = 'https://www.ctis.re.kr/ko/techClass/classification.do?key=1141'
+    def __init__(self, ctis_url=None, http_client=None, journal=None, data_root=DATA_ROOT):
+        self.ctis_url = ctis_url or os.environ.get('CTIS_CLASSIFICATION_URL', CTIS_CLASSIFICATION_URL)
+        self.detail_url_template = os.environ.get('CTIS_DETAIL_URL_TEMPLATE', CTIS_DETAIL_URL_TEMPLATE)
+        # 연결 풀·재시도·조건부 요청 캐시를 공유하는 HTTP 클라이언트
+        self.http = http_client or get_http_client()
         self.kosis_urls = {
             'institution_revenue': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5&scrId=&seqNo=&lang_mode=ko&obj_var_id=&itm_id=&conn_path=B4&path=%252FstatisticsList%252FstatisticsListIndex.do',
             'patent_data': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5&scrId=&seqNo=&lang_mode=ko&obj_var_id=&itm_id=&conn_path=B4&path=%252FstatisticsList%252FstatisticsListIndex.do'
         }
         
-        self.scraped_dir = Path('assets/data/scraped')
-        self.raw_dir = Path('assets/data/raw')
-        self.processed_dir = Path('assets/data/processed')
+        # 페이지가 읽는 데이터 폴더 기준 (실행 위치와 무관)
+        data_root = Path(data_root)
+        self.scraped_dir = data_root / 'scraped'
+        self.raw_dir = data_root / 'raw'
+        self.processed_dir = data_root / 'processed'
         
         # 디렉토리 생성
         self.scraped_dir.mkdir(parents=True, exist_ok=True)
         self.raw_dir.mkdir(parents=True, exist_ok=True)
         self.processed_dir.mkdir(parents=True, exist_ok=True)
         
-    def collect_all_data(self):
-        """모든 데이터 수집 (크롤링 + 수동다운로드)"""
+        # URL별 수집 결과 기록 (중단된 수집 이어 하기)
+        self.journal = journal or CrawlJournal()
+        
+    def collect_all_data(self, resume=True):
+        """모든 데이터 수집 (크롤링 + 수동다운로드)
+
+        resume=True면 중단된 수집 실행에서 완료된 URL은 건너뛰고 나머지만 수집
+        """
         print("🚀 하이브리드 데이터 수집 시작")
         print("=" * 60)
         
@@ -38,14 +65,13 @@ class HybridDataCollector:
         print("\n🕷️ 크롤링 방식 데이터 수집")
         print("-" * 40)
         
-        self.scrape_ctis_classification()
-        self.scrape_ctis_detailed_info()
+        self.scrape_ctis(resume=resume)
         
-        # 2. 수동 다운로드 방식 안내
-        print("\n📥 수동 다운로드 방식 데이터")
+        # 2. KOSIS 통계표 (OpenAPI 인증키가 없으면 수동 다운로드 안내)
+        print("\n📥 KOSIS 통계표 데이터")
         print("-" * 40)
         
-        self.guide_manual_download()
+        self.download_kosis_tables()
         
         # 3. 수동 다운로드 파일 처리
         print("\n📊 수동 다운로드 파일 처리")
@@ -56,207 +82,185 @@ class HybridDataCollector:
         print("\n" + "=" * 60)
         print("🎉 데이터 수집 완료!")
         
-    def scrape_ctis_classification(self):
-        """CTIS 분류체계 크롤링 (성공 확인됨)"""
+    def scrape_ctis(self, resume=True, on_step=None):
+        """CTIS 분류체계 + 상세정보 수집 (저널 실행 하나, 실패 없이 끝나야 실행 완료로 기록)
+
+        on_step(단계): 각 단계 시작 전 호출 (갱신 작업 진행률 표시용)
+        """
+        self.journal.start_run(resume)
+        
+        # 분류체계가 실패해도 저장된 분류체계로 상세정보는 이어서 수집
+        if on_step:
+            on_step('classification')
+        classified = self.scrape_ctis_classification(resume=resume)
+        if on_step:
+            on_step('detail')
+        detailed = self.scrape_ctis_detailed_info(resume=resume)
+        
+        if classified and detailed:
+            self.journal.finish_run()
+        return classified and detailed
+    
+    def scrape_ctis_classification(self, force=False, resume=False):
+        """CTIS 분류체계 크롤링 (페이지가 바뀌지 않았으면 파싱 생략)"""
         print("🔍 CTIS 기후기술 분류체계 크롤링...")
         
+        output_file = self.scraped_dir / 'climate_tech_classification.csv'
+        
+        if resume and not force and output_file.exists() and self.journal.is_fresh(self.ctis_url):
+            print("   ⏭️ 이어 받은 수집에서 완료 (저널) - 건너뜀")
+            return True
+        
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(self.ctis_url, headers=headers, timeout=30)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # 소분류 수집
-            l3_elements = soup.select('#table_box > table > tbody > tr > td.bgw')
-            l3_data = []
-            for i, element in enumerate(l3_elements, 1):
-                l3_text = self.clean_text(element.get_text())
-                if l3_text:
-                    l3_data.append({'No': i, 'L3': l3_text})
-            
-            # 중분류 위치
-            l2_positions = [1, 4, 12, 14, 16, 18, 21, 23, 27, 31, 33, 36, 38, 41]
-            table_rows = soup.select('#table_box > table > tbody > tr')
+            response = self.http.get(self.ctis_url)
             
-            # 중분류 수집
-            l2_data = {}
-            for pos in l2_positions:
-                if pos <= len(table_rows):
-                    row = table_rows[pos - 1]
-                    cells = row.find_all('td')
-                    
-                    if pos == 1 and len(cells) >= 5:
-                        l2_text = self.clean_text(cells[4].get_text())
-                    elif pos in [4, 12, 16, 18, 21, 27, 31, 33, 36, 38] and len(cells) >= 1:
-                        l2_text = self.clean_text(cells[0].get_text())
-                    elif pos in [14, 23, 41] and len(cells) >= 2:
-                        l2_text = self.clean_text(cells[1].get_text())
-                    else:
-                        l2_text = ""
-                    
-                    if l2_text:
-                        l2_data[pos] = l2_text
+            if not response.changed and output_file.exists() and not force:
+                reason = '304 Not Modified' if response.not_modified else '내용 동일'
+                print(f"   ⏭️ 분류체계 페이지 변경 없음 ({reason}) - 파싱 생략")
+                self.journal.record_done(self.ctis_url, response.sha256)
+                return True
             
-            # 대분류 수집
-            l1_positions = [1, 23, 41]
-            l1_data = {}
-            for pos in l1_positions:
-                if pos <= len(table_rows):
-                    row = table_rows[pos - 1]
-                    cells = row.find_all('td')
-                    if len(cells) >= 1:
-                        l1_text = self.clean_text(cells[0].get_text())
-                        if any(keyword in l1_text for keyword in ['감축', '적응', '융복합']):
-                            l1_data[pos] = l1_text
-            
-            # 데이터 병합
-            result_data = []
-            current_l1 = ""
-            current_l2 = ""
-            
-            for item in l3_data:
-                no = item['No']
-                l3 = item['L3']
-                
-                # L1 업데이트
-                for l1_pos in sorted(l1_positions, reverse=True):
-                    if no >= l1_pos and l1_pos in l1_data:
-                        current_l1 = l1_data[l1_pos]
-                        break
-                
-                # L2 업데이트
-                for l2_pos in sorted(l2_positions, reverse=True):
-                    if no >= l2_pos and l2_pos in l2_data:
-                        current_l2 = l2_data[l2_pos]
-                        break
-                
-                result_data.append({
-                    'L1_대분류': current_l1,
-                    'L2_중분류': current_l2,
-                    'L3_소분류': l3,
-                    'No': no
-                })
+            # #table_box만 파싱해 표 구조(rowspan)에서 대분류/중분류/소분류를 읽음
+            records = parse_classification_table(response.text())
+            result_data = [
+                {
+                    'L1_대분류': record['L1_대분류'],
+                    'L2_중분류': record['L2_중분류'],
+                    'L3_소분류': record['L3_소분류'],
+                    'No': record['No'],
+                    'detail_url': self.detail_url(record['detail_href'], record['No'])
+                }
+                for record in records
+            ]
             
             # 저장
             df = pd.DataFrame(result_data)
-            output_file = self.scraped_dir / 'climate_tech_classification.csv'
             df.to_csv(output_file, index=False, encoding='utf-8-sig')
             
             print(f"   ✅ 분류체계 크롤링 성공: {len(df)}개 항목")
             print(f"   📄 파일 저장: {output_file}")
             
+            self.journal.record_done(self.ctis_url, response.sha256, rows=len(df))
             return True
             
         except Exception as e:
             print(f"   ❌ 분류체계 크롤링 실패: {str(e)}")
+            self.journal.record_failed(self.ctis_url, e)
             return False
     
-    def scrape_ctis_detailed_info(self):
-        """CTIS 상세정보 크롤링 (Selenium 방식)"""
+    def detail_url(self, href, no):
+        """소분류 링크의 상세 페이지 주소 (링크가 없으면 주소 템플릿, 템플릿도 없으면 None)"""
+        if href and not href.startswith(('javascript:', '#')):
+            return urljoin(self.ctis_url, href)
+        if self.detail_url_template:
+            return self.detail_url_template.format(no=no)
+        return None
+    
+    def scrape_ctis_detailed_info(self, resume=False):
+        """CTIS 상세정보 크롤링 (소분류 상세 페이지 전체를 asyncio로 동시 수집)
+
+        페이지마다 결과를 저널에 바로 기록하고, resume=True면 이어 받은 실행에서 완료된 페이지는 건너뜀
+        """
         print("🔍 CTIS 기후기술 상세정보 크롤링...")
         
-        # 현재 Selenium 문제로 인해 우선 간단한 상세정보만 생성
-        print("   ⚠️ 동적 웹페이지 크롤링 복잡성으로 인해 기본 상세정보 생성")
-        
         # 분류체계 파일에서 기술명 읽어오기
         classification_file = self.scraped_dir / 'climate_tech_classification.csv'
         
-        if classification_file.exists():
-            df_classification = pd.read_csv(classification_file)
-            
-            detailed_data = []
-            for _, row in df_classification.head(10).iterrows():  # 상위 10개만
-                detailed_data.append({
-                    'category': row['L1_대분류'],
-                    'subtitle': row['L3_소분류'],
-                    'definition': f"{row['L3_소분류']} 기술에 대한 상세 정보",
-                    'keywords_kor': f"{row['L3_소분류']}, 기후기술, {row['L1_대분류']}",
-                    'keywords_eng': f"{row['L3_소분류']}, Climate Technology, {row['L1_대분류']}",
-                    'leading_country': '미국' if 'nuclear' in row['L3_소분류'].lower() else '중국' if 'solar' in row['L3_소분류'].lower() else '독일',
-                    'tech_level_pct': f"{80 + (row['No'] % 20)}%",
-                    'tech_gap': f"{2 + (row['No'] % 5)}년",
-                    'classification': f"{row['L1_대분류']} > {row['L2_중분류']} > {row['L3_소분류']}"
-                })
-            
-            df_detailed = pd.DataFrame(detailed_data)
-            output_file = self.scraped_dir / 'climate_tech_detailed.csv'
-            df_detailed.to_csv(output_file, index=False, encoding='utf-8-sig')
-            
-            print(f"   ✅ 상세정보 생성 완료: {len(df_detailed)}개 항목")
-            print(f"   📄 파일 저장: {output_file}")
-            
-            return True
-        else:
-            print("   ❌ 분류체계 파일이 없어 상세정보 생성 불가")
+        if not classification_file.exists():
+            print("   ❌ 분류체계 파일이 없어 상세정보 수집 불가")
             return False
+        
+        df_classification = pd.read_csv(classification_file, encoding=detect_encoding(classification_file))
+        items = self.detail_items(df_classification)
+        
+        pending = [item for item in items if not (resume and self.journal.is_fresh(item['detail_url']))]
+        if len(pending) < len(items):
+            print(f"   ⏭️ 중단된 수집에서 완료 {len(items) - len(pending)}개 건너뜀, {len(pending)}개 수집")
+        
+        if pending:
+            start_time = time.perf_counter()
+            crawler = CtisDetailCrawler(self.http)
+            crawler.crawl(pending, on_result=self.record_detail_result)
+            print(f"   ⏱️ {len(pending)}개 페이지 수집: {time.perf_counter() - start_time:.1f}초")
+        
+        # 이번 실행과 이전 실행에서 저널에 쌓인 결과로 전체 테이블 구성
+        detailed_data = []
+        failures = []
+        for item in items:
+            entry = self.journal.get(item['detail_url'])
+            if entry and entry['status'] == 'failed':
+                failures.append((item, entry['error']))
+            if entry and 'data' in entry:
+                detailed_data.append(self.detail_row(item, entry['data']))
+        
+        for item, error in failures:
+            print(f"   ❌ {item['L3_소분류']}: {error}")
+        
+        if not detailed_data:
+            print("   ❌ 수집된 상세정보가 없어 기존 파일 유지")
+            return False
+        
+        self.save_detailed_data(detailed_data)
+        return not failures
+    
+    def record_detail_result(self, item, detail, response, error):
+        """상세 페이지 하나의 수집 결과를 저널에 기록 (완료되는 즉시)"""
+        if error:
+            self.journal.record_failed(item['detail_url'], error)
+        else:
+            self.journal.record_done(item['detail_url'], response.sha256, data=detail)
+    
+    def detail_items(self, df_classification):
+        """상세 페이지 수집 대상 (분류체계 행 + 상세 페이지 주소, 주소를 모르는 소분류는 제외)"""
+        items = []
+        skipped = []
+        for item in df_classification.to_dict('records'):
+            if not isinstance(item.get('detail_url'), str) or not item['detail_url']:
+                item['detail_url'] = self.detail_url(None, item['No'])
+            (items if item['detail_url'] else skipped).append(item)
+        if skipped:
+            print(f"   ⚠️ 상세 페이지 링크가 없어 {len(skipped)}개 소분류 건너뜀 "
+                  f"(CTIS_DETAIL_URL_TEMPLATE 환경변수로 주소 지정): "
+                  f"{', '.join(item['L3_소분류'] for item in skipped[:5])}")
+        return items
+    
+    def detail_row(self, item, detail):
+        """상세정보 테이블 행"""
+        return {
+            'No': item['No'],
+            'category': item['L1_대분류'],
+            'subtitle': item['L3_소분류'],
+            **detail,
+            'classification': f"{item['L1_대분류']} > {item['L2_중분류']} > {item['L3_소분류']}"
+        }
+    
+    def save_detailed_data(self, detailed_data):
+        """상세정보 저장 (분류체계 순서)"""
+        df_detailed = pd.DataFrame(detailed_data).sort_values('No').drop(columns='No')
+        output_file = self.scraped_dir / 'climate_tech_detailed.csv'
+        df_detailed.to_csv(output_file, index=False, encoding='utf-8-sig')
+        
+        print(f"   ✅ 상세정보 수집 완료: {len(df_detailed)}개 항목")
+        print(f"   📄 파일 저장: {output_file}")
     
     def guide_manual_download(self):
         """수동 다운로드 가이드"""
         print("📋 다음 파일들을 KOSIS에서 수동 다운로드하세요:")
         print()
         
-        download_list = [
-            {
-                'name': '기관규모별 매출액',
-                'url': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5',
-                'file': 'institution_revenue.csv',
-                'description': '기후기술 영역별 기관규모별 매출액 (년 2019~2020)'
-            },
-            {
-                'name': '기관규모별 종사자 수',
-                'url': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5',
-                'file': 'institution_employees.csv',
-                'description': '기후기술 영역별 기관규모별 종사자 수 (년 2019~2020)'
-            },
-            {
-                'name': '기관규모별 연구원 수',
-                'url': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5',
-                'file': 'institution_researchers.csv',
-                'description': '기후기술 영역별 기관규모별 연구원 수 (년 2019~2020)'
-            },
-            {
-                'name': '기관규모별 연구개발비',
-                'url': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5',
-                'file': 'institution_rd_cost.csv',
-                'description': '기후기술 영역별 기관규모별 연구개발비 (년 2019~2020)'
-            },
-            {
-                'name': '특허 현황',
-                'url': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5',
-                'file': 'patent_data.csv',
-                'description': '기후기술 영역별 기업 및 기관의 누적 특허 건수 (년 2019~2020)'
-            },
-            {
-                'name': '수명주기 단계',
-                'url': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5',
-                'file': 'lifecycle_data.csv',
-                'description': '기후기술 영역별 기술수명주기 단계 (년 2019~2020)'
-            },
-            {
-                'name': '해외진출 현황',
-                'url': 'https://kosis.kr/statHtml/statHtml.do?orgId=442&tblId=DT_21_01&vw_cd=MT_ZTITLE&list_id=N2_5',
-                'file': 'overseas_data.csv',
-                'description': '기후기술 영역별 해외진출지역(복수응답) (년 2019~2020)'
-            }
-        ]
-        
-        for i, item in enumerate(download_list, 1):
+        for i, (filename, item) in enumerate(KOSIS_TABLES.items(), 1):
             print(f"{i}. {item['name']}")
-            print(f"   📄 파일명: {item['file']}")
+            print(f"   📄 파일명: {filename}")
             print(f"   📝 설명: {item['description']}")
-            print(f"   🔗 URL: {item['url']}")
-            print(f"   📁 저장 위치: assets/data/raw/{item['file']}")
+            print(f"   🔗 URL: {table_url(filename)}")
+            print(f"   📁 저장 위치: {self.raw_dir / filename}")
             print()
         
         print("⚠️ 다운로드 방법:")
         print("   1. 위 URL 접속")
         print("   2. '다운로드' 버튼 클릭")
         print("   3. CSV 형태로 다운로드")
-        print("   4. assets/data/raw/ 폴더에 저장")
+        print(f"   4. {self.raw_dir}/ 폴더에 저장")
         print()
         
         # 다운로드 확인
@@ -270,9 +274,30 @@ class HybridDataCollector:
         
         print()
         print("💡 파일 다운로드 후 다시 실행하세요!")
+        print("💡 KOSIS_API_KEY 환경변수를 설정하면 OpenAPI로 자동 수집합니다.")
+    
+    def download_kosis_tables(self):
+        """KOSIS OpenAPI로 통계표 수집 (인증키가 없으면 수동 다운로드 안내)"""
+        client = KosisApiClient(http_client=self.http)
+        if not client.available:
+            self.guide_manual_download()
+            return False
+        
+        print("📥 KOSIS OpenAPI로 통계표 수집 중...")
+        start_time = time.perf_counter()
+        results = client.download_all(self.raw_dir)
+        failed = [filename for filename, result in results.items() if isinstance(result, Exception)]
+        print(f"   ⏱️ {len(results)}개 통계표 수집: {time.perf_counter() - start_time:.1f}초")
+        
+        if failed:
+            print(f"   ⚠️ 실패한 통계표는 기존 raw 파일 사용: {', '.join(failed)}")
+        return not failed
         
-    def process_manual_files(self):
-        """수동 다운로드 파일 처리 및 통합"""
+    def process_manual_files(self, incremental=True, chunksize=None):
+        """수동 다운로드 파일 처리 및 통합
+
+        incremental=True면 변경된 파일만, chunksize를 주면 행 단위 스트리밍 처리
+        """
         print("📊 수동 다운로드 파일 처리 중...")
         
         # raw 폴더의 파일 확인
@@ -280,119 +305,63 @@ class HybridDataCollector:
         
         if not raw_files:
             print("   ❌ 처리할 파일이 없습니다.")
-            print("   📥 KOSIS에서 파일을 다운로드하고 assets/data/raw/ 폴더에 저장하세요.")
+            print(f"   📥 KOSIS에서 파일을 다운로드하고 {self.raw_dir}/ 폴더에 저장하세요.")
             return False
         
         print(f"   📁 {len(raw_files)}개 파일 발견")
         
-        # 파일별 처리
-        processed_files = []
+        # KOSIS 통계표는 실제 데이터 파이프라인으로 처리 (입력이 바뀐 데이터셋만)
+        processor = RealDataProcessor(self.raw_dir, self.processed_dir, chunksize=chunksize)
+        processor.process_all_data(incremental=incremental, publish=False)
+        
+        # 파이프라인에 없는 파일은 정제본만 복사
+        pipeline_files = processor.pipeline_input_files()
+        manifest = processor.manifest
         
         for file_path in raw_files:
+            if file_path.name in pipeline_files:
+                continue
+            
+            output_file = self.processed_dir / file_path.name
+            name = f'manual:{file_path.name}'
+            
+            if incremental and manifest.is_up_to_date(name, [file_path], [output_file]):
+                print(f"   ⏭️ 변경 없음: {file_path.name}")
+                continue
+            
             try:
                 print(f"   🔄 처리 중: {file_path.name}")
+                inputs = manifest.snapshot_inputs([file_path])
                 
-                # CSV 파일 읽기
-                df = pd.read_csv(file_path, encoding='utf-8-sig')
+                self.copy_filled_csv(file_path, output_file, chunksize or STREAM_CHUNK_ROWS)
                 
-                # 파일명에 따른 처리
-                if 'institution' in file_path.name:
-                    processed_df = self.process_institution_file(df, file_path.name)
-                elif 'patent' in file_path.name:
-                    processed_df = self.process_patent_file(df)
-                elif 'lifecycle' in file_path.name:
-                    processed_df = self.process_lifecycle_file(df)
-                elif 'overseas' in file_path.name:
-                    processed_df = self.process_overseas_file(df)
-                else:
-                    processed_df = df  # 기본 처리
-                
-                # 처리된 파일 저장
-                output_file = self.processed_dir / file_path.name
-                processed_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-                
-                processed_files.append(output_file)
+                manifest.record(name, inputs, [output_file])
                 print(f"   ✅ 처리 완료: {output_file}")
                 
             except Exception as e:
                 print(f"   ❌ 처리 실패 {file_path.name}: {str(e)}")
                 continue
         
-        if processed_files:
-            print(f"   🎉 총 {len(processed_files)}개 파일 처리 완료")
-            
-            # 통합 파일 생성
-            self.create_integrated_files(processed_files)
-            
-            return True
-        else:
-            print("   ❌ 처리된 파일이 없습니다.")
-            return False
-    
-    def process_institution_file(self, df, filename):
-        """기관 데이터 파일 처리"""
-        # 기본적인 데이터 정제
-        df_clean = df.copy()
-        
-        # 컬럼명 정리
-        df_clean.columns = [col.strip() for col in df_clean.columns]
-        
-        # 결측치 처리
-        df_clean = df_clean.fillna(0)
+        manifest.save()
         
-        return df_clean
+        # 파이프라인 결과와 복사본을 한 스냅샷으로 게시
+        processor.publish()
+        return True
     
-    def process_patent_file(self, df):
-        """특허 데이터 파일 처리"""
-        return df.fillna(0)
-    
-    def process_lifecycle_file(self, df):
-        """수명주기 데이터 파일 처리"""
-        return df.fillna(0)
-    
-    def process_overseas_file(self, df):
-        """해외진출 데이터 파일 처리"""
-        return df.fillna(0)
-    
-    def create_integrated_files(self, processed_files):
-        """통합 파일 생성"""
-        print("   🔗 통합 파일 생성 중...")
-        
-        # 기관 데이터 통합
-        institution_files = [f for f in processed_files if 'institution' in f.name]
-        if len(institution_files) >= 2:
-            self.integrate_institution_data(institution_files)
-        
-        print("   ✅ 통합 파일 생성 완료")
-    
-    def integrate_institution_data(self, files):
-        """기관 데이터 통합"""
-        integrated_data = []
-        
-        for file_path in files:
-            df = pd.read_csv(file_path)
-            
-            # 파일명에서 데이터 유형 추출
-            if 'revenue' in file_path.name:
-                data_type = 'revenue'
-            elif 'employees' in file_path.name:
-                data_type = 'employees'
-            elif 'researchers' in file_path.name:
-                data_type = 'researchers'
-            elif 'rd_cost' in file_path.name:
-                data_type = 'rd_cost'
-            else:
-                continue
-            
-            # 데이터 변환 및 추가
-            # (실제 KOSIS 데이터 구조에 맞춰 수정 필요)
-            
-        # 통합 파일 저장
-        if integrated_data:
-            integrated_df = pd.DataFrame(integrated_data)
-            output_file = self.processed_dir / 'institution_integrated.csv'
-            integrated_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-            print(f"   📊 기관 데이터 통합 완료: {output_file}")
+    def copy_filled_csv(self, file_path, output_file, chunksize):
+        """결측값을 0으로 채운 정제본 복사 (청크 단위, 완료 후 교체)"""
+        tmp_file = output_file.with_name(f'{output_file.name}.{os.getpid()}.tmp')
+        try:
+            with open(tmp_file, 'w', encoding='utf-8-sig', newline='') as f:
+                # 청크마다 dtype 추론이 달라지지 않도록 값은 원문 그대로
+                reader = pd.read_csv(file_path, encoding=detect_encoding(file_path), dtype=str,
+                                     chunksize=chunksize)
+                with reader:
+                    for i, chunk in enumerate(reader):
+                        chunk.fillna('0').to_csv(f, header=(i == 0), index=False)
+            os.replace(tmp_file, output_file)
+        finally:
+            tmp_file.unlink(missing_ok=True)
     
     def clean_text(self, text):
         """텍스트 정제"""
@@ -413,7 +382,7 @@ class HybridDataCollector:
         scraped_files = list(self.scraped_dir.glob('*.csv'))
         print(f"🕷️ 크롤링 데이터: {len(scraped_files)}개")
         for file in scraped_files:
-            df = pd.read_csv(file)
+            df = pd.read_csv(file, encoding=detect_encoding(file))
             print(f"   📄 {file.name}: {len(df)}행")
         
         # 수동 다운로드 데이터
@@ -421,34 +390,43 @@ class HybridDataCollector:
         print(f"📥 수동 다운로드 데이터: {len(raw_files)}개")
         for file in raw_files:
             try:
-                df = pd.read_csv(file)
+                df = pd.read_csv(file, encoding=detect_encoding(file))
                 print(f"   📄 {file.name}: {len(df)}행")
             except:
                 print(f"   ❌ {file.name}: 읽기 실패")
         
-        # 처리된 데이터
+        # 처리된 데이터 (ETL 저장 시 기록한 검증 보고서 기준)
         processed_files = list(self.processed_dir.glob('*.csv'))
+        report = load_validation_report(self.processed_dir)
         print(f"📊 처리된 데이터: {len(processed_files)}개")
         for file in processed_files:
-            try:
-                df = pd.read_csv(file)
-                print(f"   📄 {file.name}: {len(df)}행")
-            except:
-                print(f"   ❌ {file.name}: 읽기 실패")
+            validation = report.get(file.stem)
+            if validation is None:
+                print(f"   📄 {file.name}: 검증 대상 아님")
+            elif validation['status'] == 'passed':
+                print(f"   ✅ {file.name}: {validation['rows']}행 검증 통과")
+            else:
+                checks = ', '.join(sorted({v['check'] for v in validation['violations']}))
+                print(f"   ❌ {file.name}: 최근 처리 검증 실패 ({checks}) - 이전 파일 유지")
 
 def main():
     """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='기후기술 데이터 수집')
+    parser.add_argument('--restart', action='store_true',
+                        help='중단된 수집을 이어 받지 않고 모든 페이지를 처음부터 다시 수집')
+    args = parser.parse_args()
+    
     collector = HybridDataCollector()
     
     # 전체 데이터 수집
-    collector.collect_all_data()
+    collector.collect_all_data(resume=not args.restart)
     
     # 데이터 완성도 확인
     collector.check_data_completeness()
     
     print("\n🎯 다음 단계:")
-    print("1. KOSIS에서 필요한 파일들을 다운로드하세요")
-    print("2. assets/data/raw/ 폴더에 저장하세요")
+    print("1. KOSIS에서 필요한 파일들을 다운로드하세요 (또는 KOSIS_API_KEY 설정)")
+    print(f"2. {collector.raw_dir}/ 폴더에 저장하세요")
     print("3. 다시 이 스크립트를 실행하세요")
     print("4. streamlit run main.py로 대시보드를 실행하세요")
 
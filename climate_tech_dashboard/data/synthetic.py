@@ -0,0 +1,436 @@
+"""
+대용량 합성 데이터 생성 (확장성 측정용)
+
+실제 KOSIS 통계표와 같은 모양의 데이터를 원하는 규모로 만들어
+ETL(data/process_real_data.py)과 페이지가 데이터 양에 따라 어떻게 동작하는지 측정합니다.
+- raw: KOSIS 와이드 CSV (연도 행 + 측정항목 행 두 줄 헤더, 합계/소계 행, 전체/합계 열 포함) → ETL 입력
+- processed: 처리 데이터셋 롱 포맷 CSV + 파케이 사본 + 집계 큐브 → 페이지 입력 (ETL 결과와 비교용)
+- 기술(행)을 청크로 나눠 만들고 바로 파일에 이어 쓰므로 메모리 사용량은 청크 크기로 제한
+- 청크마다 (시드, 데이터셋, 분야, 청크 번호)로 난수를 만들어 같은 설정이면 항상 같은 파일
+
+규모 1은 현재 KOSIS 통계표(분야별 기술 14개, 3개 연도)와 같은 크기입니다.
+
+    python data/synthetic.py --output /tmp/synthetic --scale 100
+    python data/synthetic.py --output /tmp/synthetic --rows 100000000 --formats processed --no-cubes
+"""
+
+import argparse
+import codecs
+import csv
+import io
+import json
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+
+# 상위 디렉토리 추가 (python data/synthetic.py 직접 실행 지원)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.aggregates import CubeBuilder
+from data.data_loader import ColumnarWriter
+from data.process_real_data import INSTITUTION_FILES, REGION_COORDS
+from data.schemas import DATASET_DTYPES, DATASET_SCHEMAS
+
+# 기본 시드
+SYNTHETIC_SEED = 42
+
+# 청크당 기술 수 (청크 메모리 = 기술 수 × 연도 × 측정항목)
+CHUNK_TECHS = 5000
+
+# 생성 결과 요약 파일 (출력 폴더)
+MANIFEST_FILENAME = 'synthetic.json'
+
+# KOSIS 분류 열 이름 (헤더 두 줄 공통)
+CLASS_COLUMNS = ['기후기술분류별(1)', '기후기술분류별(2)']
+
+# 합계/소계 행 라벨
+TOTAL_ROW = '합계'
+SUBTOTAL_ROW = '소계'
+
+# KOSIS 누락 표기
+MISSING_MARK = '-'
+
+# 분야별 기술 (규모 1 = 현재 통계표, 규모를 키우면 일련번호를 붙여 반복)
+FIELD_TECHS = {
+    '감축': ['재생에너지', '신에너지', '비재생에너지', '에너지저장', '송배전&전력IT', '에너지수요', '온실가스 고정'],
+    '적응': ['물관리', '농업&축산', '해양수산연안', '건강', '산림육상', '예측･모니터링'],
+    '융복합': ['감축 및 적응 융복합']
+}
+
+# 기관 규모 구간 (2020년 이후 통계표, 더 많이 요청하면 가상 구간 추가)
+INSTITUTION_SCALES = ['100억 원 미만', '100억 원 이상 500억 원 미만', '500억 원 이상 1000억 원 미만',
+                      '1000억 원 이상 2000억 원 미만', '2000억 원 이상', '기타(공공기관)']
+
+# 특허 측정항목 (보유, 등록 순)
+PATENT_LABELS = ['특허보유규모 (건)', '당해연도 특허등록건수 (건)']
+
+# 데이터셋별 raw 파일 (지표 → 파일)과 측정항목별 합계 열 라벨
+SYNTHETIC_DATASETS = {
+    'institution_data': {'raw_files': INSTITUTION_FILES, 'total_measure': '전체'},
+    'patent_data': {'raw_files': {'patent': 'patent_data.csv'}, 'total_measure': None},
+    'lifecycle_data': {'raw_files': {'project_count': 'lifecycle_data.csv'}, 'total_measure': '합계'},
+    'overseas_data': {'raw_files': {'export_count': 'overseas_data.csv'}, 'total_measure': '합계'}
+}
+
+# 지표별 셀 값 분포 (로그정규 중앙값, 시그마) - 현재 통계표 셀 값 수준
+VALUE_DISTRIBUTIONS = {
+    'revenue': (1500000, 1.2),
+    'employees': (2000, 1.0),
+    'researchers': (600, 1.0),
+    'rd_cost': (90000, 1.2),
+    'patent': (1500, 1.0),
+    'project_count': (60, 1.3),
+    'export_count': (20, 1.3)
+}
+
+# 특허 보유 규모 = 당해 등록 건수 × 배율 (균등 분포 범위)
+PATENT_HOLDING_RATIO = (6.0, 14.0)
+
+def scale_labels(count):
+    """기관 규모 구간 라벨 (실제 구간 다음에 가상 구간)"""
+    extra = [f'가상 규모구간 {i:03d}' for i in range(len(INSTITUTION_SCALES) + 1, count + 1)]
+    return (INSTITUTION_SCALES + extra)[:count]
+
+def region_labels(count):
+    """해외진출 지역 라벨 (스키마 지역 다음에 가상 지역)"""
+    regions = DATASET_SCHEMAS['overseas_data']['categories']['region']
+    extra = [f'가상지역 {i:03d}' for i in range(len(regions) + 1, count + 1)]
+    return (regions + extra)[:count]
+
+def open_csv(path):
+    """CSV 파일 열기 (바이너리, utf-8-sig BOM 기록)"""
+    f = open(path, 'wb')
+    f.write(codecs.BOM_UTF8)
+    return f
+
+def write_csv_rows(f, rows):
+    """헤더·합계 행처럼 몇 줄 안 되는 행 쓰기"""
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    f.write(buffer.getvalue().encode('utf-8'))
+
+def write_csv_chunk(f, df, header=False):
+    """청크를 CSV에 이어 쓰기 (pyarrow CSV 작성기 - pandas to_csv보다 수 배 빠름, 범주형은 문자열로)"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    table = table.cast(pa.schema([
+        pa.field(field.name, field.type.value_type if pa.types.is_dictionary(field.type) else field.type)
+        for field in table.schema
+    ]))
+    pacsv.write_csv(table, f, pacsv.WriteOptions(include_header=header, quoting_style='needed'))
+
+def tech_names(field, start, stop):
+    """분야의 start~stop번째 기술 이름 (기본 기술 이름을 돌려 쓰고 두 바퀴째부터 일련번호)"""
+    bases = FIELD_TECHS[field]
+    names = []
+    for i in range(start, stop):
+        base = bases[i % len(bases)]
+        names.append(base if i < len(bases) else f'{base}-{i // len(bases):06d}')
+    return names
+
+class SyntheticGenerator:
+    """KOSIS 모양 합성 데이터 생성기"""
+
+    def __init__(self, output_dir, scale=1.0, years=3, end_year=2021, scales=len(INSTITUTION_SCALES),
+                 regions=None, chunk_techs=CHUNK_TECHS, seed=SYNTHETIC_SEED, missing_rate=0.0):
+        self.output_dir = Path(output_dir)
+        self.raw_dir = self.output_dir / 'raw'
+        self.processed_dir = self.output_dir / 'processed'
+        self.years = list(range(end_year - years + 1, end_year + 1))
+        self.chunk_techs = chunk_techs
+        self.seed = seed
+        self.missing_rate = missing_rate
+        self.scale = scale
+
+        # 분야별 기술 수 (분야 비율은 현재 통계표와 동일, 분야마다 최소 1개)
+        self.field_techs = {field: max(1, round(len(bases) * scale)) for field, bases in FIELD_TECHS.items()}
+
+        region_count = regions or len(DATASET_SCHEMAS['overseas_data']['categories']['region'])
+        self.measures = {
+            'institution_data': scale_labels(scales),
+            'patent_data': PATENT_LABELS,
+            'lifecycle_data': DATASET_SCHEMAS['lifecycle_data']['categories']['lifecycle_stage'],
+            'overseas_data': region_labels(region_count)
+        }
+        if region_count > len(DATASET_SCHEMAS['overseas_data']['categories']['region']):
+            print("⚠️ 스키마에 없는 가상 지역은 ETL 검증(categories)에서 위반으로 보고됩니다")
+
+    @classmethod
+    def scale_for_rows(cls, rows, years=3, scales=len(INSTITUTION_SCALES)):
+        """기관 데이터셋 처리 행 수가 rows가 되는 규모 (가장 큰 데이터셋 기준)"""
+        base_techs = sum(len(bases) for bases in FIELD_TECHS.values())
+        return rows / (base_techs * years * scales)
+
+    def expected_rows(self, name):
+        """처리 데이터셋 예상 행 수 (누락 제외 전)"""
+        return sum(self.field_techs.values()) * len(self.years) * len(self.measures[name])
+
+    def chunks(self):
+        """(분야 번호, 분야, 시작, 끝) 청크 목록 (분야 순서 = raw 파일 행 순서)"""
+        for field_idx, (field, count) in enumerate(self.field_techs.items()):
+            for start in range(0, count, self.chunk_techs):
+                yield field_idx, field, start, min(start + self.chunk_techs, count)
+
+    def generate_values(self, name, field_idx, start, stop):
+        """청크 값 → (지표별 정수 배열 (기술, 연도, 측정항목), 지표별 누락 마스크)
+
+        같은 청크는 항상 같은 난수열을 쓰므로 합계 계산 단계와 저장 단계의 값이 같음
+        """
+        dataset_idx = list(SYNTHETIC_DATASETS).index(name)
+        rng = np.random.default_rng([self.seed, dataset_idx, field_idx, start // self.chunk_techs])
+        shape = (stop - start, len(self.years), len(self.measures[name]))
+
+        values = {}
+        for metric in SYNTHETIC_DATASETS[name]['raw_files']:
+            median, sigma = VALUE_DISTRIBUTIONS[metric]
+            values[metric] = np.rint(rng.lognormal(np.log(median), sigma, shape)).astype(np.int64)
+
+        if name == 'patent_data':
+            # 측정항목 순서: 보유, 등록 (보유 규모 = 등록 건수 × 배율)
+            ratio = rng.uniform(*PATENT_HOLDING_RATIO, shape[:2])
+            values['patent'][:, :, 0] = np.rint(values['patent'][:, :, 1] * ratio).astype(np.int64)
+
+        masks = {metric: rng.random(shape) < self.missing_rate if self.missing_rate > 0 else None
+                 for metric in values}
+        return values, masks
+
+    # ---- raw (KOSIS 와이드) ----
+
+    def raw_header(self, name):
+        """두 줄 헤더 (연도 행, 측정항목 행 - 합계 열이 있으면 연도마다 맨 앞)"""
+        total = SYNTHETIC_DATASETS[name]['total_measure']
+        measures = ([total] if total else []) + self.measures[name]
+        years = [str(year) for year in self.years for _ in measures]
+        return [CLASS_COLUMNS + years, CLASS_COLUMNS + measures * len(self.years)]
+
+    def wide_matrix(self, name, values):
+        """(기술, 연도, 측정항목) → 와이드 행렬 (연도마다 합계 열 + 측정항목 열)"""
+        if SYNTHETIC_DATASETS[name]['total_measure']:
+            values = np.concatenate([values.sum(axis=2, keepdims=True), values], axis=2)
+        return values.reshape(len(values), -1)
+
+    def compute_totals(self, name):
+        """합계/소계 행 값 (지표별 {분야: (연도, 측정항목) 합계}, 누락 셀도 합계에 포함)"""
+        totals = {metric: {} for metric in SYNTHETIC_DATASETS[name]['raw_files']}
+        for field_idx, field, start, stop in self.chunks():
+            values, _ = self.generate_values(name, field_idx, start, stop)
+            for metric, array in values.items():
+                field_total = totals[metric].setdefault(field, 0)
+                totals[metric][field] = field_total + array.sum(axis=0)
+        return totals
+
+    def write_raw_chunk(self, f, name, field, techs, values, mask):
+        """기술 행 청크를 와이드 CSV에 이어 쓰기 (누락 셀은 '-')"""
+        matrix = self.wide_matrix(name, values)
+        if mask is not None:
+            # 합계 열은 누락으로 표시하지 않음 (KOSIS 비밀보호 셀도 합계에는 포함)
+            if SYNTHETIC_DATASETS[name]['total_measure']:
+                mask = np.concatenate([np.zeros(mask.shape[:2] + (1,), dtype=bool), mask], axis=2)
+            matrix = np.where(mask.reshape(len(matrix), -1), MISSING_MARK, matrix.astype(str))
+        body = pd.DataFrame(matrix, columns=[f'c{i}' for i in range(matrix.shape[1])])
+        body.insert(0, 'tech', techs)
+        body.insert(0, 'field', field)
+        write_csv_chunk(f, body)
+
+    def write_total_row(self, f, name, label, total):
+        write_csv_rows(f, [[label, SUBTOTAL_ROW] + self.wide_matrix(name, total[np.newaxis])[0].tolist()])
+
+    # ---- processed (롱 포맷) ----
+
+    def long_frame(self, name, field, techs, values, masks):
+        """청크 값 → 처리 데이터셋 행 (누락 처리는 ETL과 동일)
+
+        - 기관: 누락 지표는 0 (지표 파일 외부 조인 후 fillna(0))
+        - 특허: 누락 항목은 0 (pivot_table 합계라 행은 모두 남음)
+        - 생애주기/해외진출: 누락 행 제외
+        """
+        n_techs, n_years, n_measures = next(iter(values.values())).shape
+        tech_idx, year_idx, measure_idx = (idx.ravel() for idx in np.indices((n_techs, n_years, n_measures)))
+        measures = self.measures[name]
+
+        if name == 'patent_data':
+            # 측정항목 축을 지표 열로 (보유, 등록)
+            tech_idx, year_idx = tech_idx[::n_measures], year_idx[::n_measures]
+            holding, count = values['patent'][:, :, 0].ravel(), values['patent'][:, :, 1].ravel()
+            if masks['patent'] is not None:
+                holding = np.where(masks['patent'][:, :, 0].ravel(), 0, holding)
+                count = np.where(masks['patent'][:, :, 1].ravel(), 0, count)
+            columns = {'patent_count': count, 'cumulative_patents': holding}
+        else:
+            columns = {}
+            keep = np.ones(len(tech_idx), dtype=bool)
+            for metric, array in values.items():
+                flat = array.ravel()
+                if masks[metric] is not None:
+                    if name == 'institution_data':
+                        flat = np.where(masks[metric].ravel(), 0, flat)
+                    else:
+                        keep &= ~masks[metric].ravel()
+                # 기관 지표는 ETL 외부 조인 결과와 같이 실수
+                columns[metric] = flat.astype(float) if name == 'institution_data' else flat
+            columns = {metric: flat[keep] for metric, flat in columns.items()}
+            tech_idx, year_idx, measure_idx = tech_idx[keep], year_idx[keep], measure_idx[keep]
+
+        tech = pd.Categorical.from_codes(tech_idx, techs)
+        frame = {
+            'year': np.asarray(self.years, dtype=np.int64)[year_idx],
+            'field': pd.Categorical.from_codes(np.zeros(len(tech_idx), dtype=np.int8), [field])
+        }
+        if name == 'institution_data':
+            frame.update(scale=pd.Categorical.from_codes(measure_idx, measures), tech_type=tech)
+        elif name == 'patent_data':
+            frame.update(category=tech, tech_name=tech)
+        elif name == 'lifecycle_data':
+            frame.update(tech_name=tech, lifecycle_stage=pd.Categorical.from_codes(measure_idx, measures))
+        else:
+            region = pd.Categorical.from_codes(measure_idx, measures)
+            frame = {'year': frame['year'], 'region': region, 'field': frame['field'], 'tech_name': tech}
+        frame.update(columns)
+
+        if name == 'lifecycle_data':
+            # ETL과 같이 헤더 순서 기준 단계 순번 (1부터)
+            frame['stage_order'] = measure_idx.astype(np.int64) + 1
+        elif name == 'overseas_data':
+            coords = [REGION_COORDS.get(region, (np.nan, np.nan, None)) for region in measures]
+            frame['latitude'] = np.array([c[0] for c in coords], dtype=float)[measure_idx]
+            frame['longitude'] = np.array([c[1] for c in coords], dtype=float)[measure_idx]
+            frame['countries'] = np.array([c[2] for c in coords], dtype=object)[measure_idx]
+
+        return pd.DataFrame(frame)[list(DATASET_DTYPES[name])]
+
+    # ---- 데이터셋 생성 ----
+
+    def generate_dataset(self, name, formats=('raw', 'processed'), cubes=True):
+        """데이터셋 하나 생성 (청크 단위 스트리밍) → 처리 행 수"""
+        spec = SYNTHETIC_DATASETS[name]
+        started = time.time()
+
+        raw_files, totals = {}, None
+        if 'raw' in formats:
+            self.raw_dir.mkdir(parents=True, exist_ok=True)
+            totals = self.compute_totals(name)
+            for metric, filename in spec['raw_files'].items():
+                f = raw_files[metric] = open_csv(self.raw_dir / filename)
+                write_csv_rows(f, self.raw_header(name))
+                self.write_total_row(f, name, TOTAL_ROW, sum(totals[metric].values()))
+
+        csv_file = columnar = cube_builder = csv_path = None
+        if 'processed' in formats:
+            self.processed_dir.mkdir(parents=True, exist_ok=True)
+            csv_path = self.processed_dir / f'{name}.csv'
+            csv_file = open_csv(csv_path.with_name(f'{csv_path.name}.{os.getpid()}.tmp'))
+            columnar = ColumnarWriter(self.processed_dir / f'{name}.parquet', name)
+            cube_builder = CubeBuilder(name, self.processed_dir) if cubes else None
+
+        rows = 0
+        current_field = None
+        try:
+            for field_idx, field, start, stop in self.chunks():
+                values, masks = self.generate_values(name, field_idx, start, stop)
+                techs = tech_names(field, start, stop)
+
+                for metric, f in raw_files.items():
+                    if field != current_field:
+                        self.write_total_row(f, name, field, totals[metric][field])
+                    self.write_raw_chunk(f, name, field, techs, values[metric], masks[metric])
+                current_field = field
+
+                if csv_file is not None:
+                    chunk = self.long_frame(name, field, techs, values, masks)
+                    write_csv_chunk(csv_file, chunk, header=csv_file.tell() == len(codecs.BOM_UTF8))
+                    columnar.write(chunk)
+                    if cube_builder is not None:
+                        cube_builder.add(chunk)
+                    rows += len(chunk)
+
+            if csv_file is not None:
+                csv_file.close()
+                os.replace(csv_file.name, csv_path)
+                columnar.close()
+                if cube_builder is not None:
+                    cube_builder.write()
+        except BaseException:
+            if csv_file is not None:
+                csv_file.close()
+                Path(csv_file.name).unlink(missing_ok=True)
+                columnar.abort()
+            raise
+        finally:
+            for f in raw_files.values():
+                f.close()
+
+        print(f"✅ {name}: 기술 {sum(self.field_techs.values()):,}개, 처리 {rows:,}행 "
+              f"({time.time() - started:.1f}초)")
+        return rows
+
+    def generate(self, datasets=None, formats=('raw', 'processed'), cubes=True):
+        """데이터셋 생성 후 요약 파일 저장 → 요약"""
+        datasets = datasets or list(SYNTHETIC_DATASETS)
+        print(f"🧪 합성 데이터 생성: 규모 {self.scale:g}배, {len(self.years)}개 연도, "
+              f"청크당 기술 {self.chunk_techs:,}개 → {self.output_dir}")
+
+        summary = {
+            'created_at': datetime.now().isoformat(),
+            'seed': self.seed,
+            'scale': self.scale,
+            'years': self.years,
+            'field_techs': self.field_techs,
+            'measures': {name: len(self.measures[name]) for name in datasets},
+            'missing_rate': self.missing_rate,
+            'formats': list(formats),
+            'datasets': {}
+        }
+        for name in datasets:
+            started = time.time()
+            rows = self.generate_dataset(name, formats=formats, cubes=cubes)
+            summary['datasets'][name] = {
+                'expected_rows': self.expected_rows(name),
+                'processed_rows': rows if 'processed' in formats else None,
+                'seconds': round(time.time() - started, 3)
+            }
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.output_dir / MANIFEST_FILENAME, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, ensure_ascii=False, indent=2)
+        return summary
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='KOSIS 모양 대용량 합성 데이터 생성')
+    parser.add_argument('--output', required=True, help='출력 폴더 (raw/, processed/ 생성)')
+    size = parser.add_mutually_exclusive_group()
+    size.add_argument('--scale', type=float, default=1.0, help='현재 통계표 대비 기술 수 배율')
+    size.add_argument('--rows', type=int, help='기관 데이터셋 처리 행 수 목표 (규모 자동 계산)')
+    parser.add_argument('--years', type=int, default=3, help='연도 수')
+    parser.add_argument('--end-year', type=int, default=2021, help='마지막 연도')
+    parser.add_argument('--scales', type=int, default=len(INSTITUTION_SCALES), help='기관 규모 구간 수')
+    parser.add_argument('--regions', type=int, help='해외진출 지역 수 (기본: 스키마 지역 전체)')
+    parser.add_argument('--chunk-techs', type=int, default=CHUNK_TECHS, help='청크당 기술 수')
+    parser.add_argument('--seed', type=int, default=SYNTHETIC_SEED, help='난수 시드')
+    parser.add_argument('--missing-rate', type=float, default=0.0, help="누락('-') 셀 비율")
+    parser.add_argument('--datasets', nargs='+', choices=list(SYNTHETIC_DATASETS), help='생성할 데이터셋')
+    parser.add_argument('--formats', nargs='+', choices=['raw', 'processed'], default=['raw', 'processed'],
+                        help='출력 형식')
+    parser.add_argument('--no-cubes', action='store_true', help='처리 데이터 집계 큐브 생략')
+    args = parser.parse_args()
+
+    scale = args.scale
+    if args.rows:
+        scale = SyntheticGenerator.scale_for_rows(args.rows, years=args.years, scales=args.scales)
+
+    generator = SyntheticGenerator(
+        args.output, scale=scale, years=args.years, end_year=args.end_year, scales=args.scales,
+        regions=args.regions, chunk_techs=args.chunk_techs, seed=args.seed, missing_rate=args.missing_rate
+    )
+    summary = generator.generate(datasets=args.datasets, formats=args.formats, cubes=not args.no_cubes)
+    total = sum(info['expected_rows'] for info in summary['datasets'].values())
+    print(f"📦 완료: 처리 데이터 약 {total:,}행 → {generator.output_dir}")
+
+if __name__ == "__main__":
+    main()
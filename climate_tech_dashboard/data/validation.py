@@ -0,0 +1,152 @@
+"""
+처리 데이터셋 계약 검증
+
+ETL 저장 단계에서 청크마다 벡터화된 마스크로 스키마(data/schemas.py)를 검사하고,
+결과를 processed 폴더의 검증 보고서(JSON)에 기록합니다.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data.data_loader import KOSIS_TOTAL_LABELS
+from data.schemas import DATASET_SCHEMAS, MIN_YEAR
+
+REPORT_FILENAME = 'validation_report.json'
+
+# 위반 항목별로 남기는 예시 값 수
+MAX_EXAMPLES = 5
+
+class DatasetValidator:
+    """데이터셋 계약 검증 (청크 단위로 누적)"""
+
+    def __init__(self, name, max_year=None):
+        self.name = name
+        self.schema = DATASET_SCHEMAS.get(name)
+        self.max_year = max_year or datetime.now().year
+        self.rows = 0
+        self.violations = {}
+        # 청크 경계를 넘는 중복 키 확인용 (행당 8바이트)
+        self._key_hashes = []
+
+    @property
+    def failed(self):
+        return bool(self.violations)
+
+    def _add(self, check, column, mask, values=None):
+        """위반 마스크 누적"""
+        count = int(mask.sum())
+        if not count:
+            return
+
+        entry = self.violations.setdefault((check, column), {'count': 0, 'examples': []})
+        entry['count'] += count
+        if values is not None and len(entry['examples']) < MAX_EXAMPLES:
+            examples = pd.unique(values[mask].astype(str))[:MAX_EXAMPLES].tolist()
+            entry['examples'] = list(dict.fromkeys(entry['examples'] + examples))[:MAX_EXAMPLES]
+
+    def check(self, df):
+        """청크 하나 검사"""
+        if self.schema is None:
+            return
+
+        self.rows += len(df)
+        schema = self.schema
+
+        for col, dtype in schema['dtypes'].items():
+            if col not in df.columns:
+                self.violations.setdefault(('missing_column', col), {'count': 1, 'examples': []})
+                continue
+
+            values = df[col]
+            if col not in schema['nullable']:
+                self._add('null', col, values.isna())
+
+            if dtype == 'category':
+                continue
+
+            # 숫자 컬럼: 숫자가 아닌 값, 정수 컬럼의 소수/범위 초과
+            numeric = pd.to_numeric(values, errors='coerce')
+            self._add('dtype', col, numeric.isna() & values.notna(), values)
+
+            if dtype.startswith('int'):
+                bounds = np.iinfo(dtype)
+                bad = numeric.notna() & ((numeric % 1 != 0) | (numeric < bounds.min) | (numeric > bounds.max))
+                self._add('dtype', col, bad, values)
+
+            if col in schema['non_negative']:
+                self._add('negative', col, numeric < 0, values)
+
+        if 'year' in df.columns:
+            year = pd.to_numeric(df['year'], errors='coerce')
+            self._add('year_range', 'year', (year < MIN_YEAR) | (year > self.max_year), df['year'])
+
+        for col, allowed in schema['categories'].items():
+            if col in df.columns:
+                values = df[col]
+                self._add('category', col, values.notna() & ~values.isin(allowed), values)
+
+        # KOSIS 합계/소계 행이 남으면 이중 집계
+        for col in schema['label_columns']:
+            if col in df.columns:
+                self._add('total_label', col, df[col].isin(KOSIS_TOTAL_LABELS), df[col])
+
+        keys = [col for col in schema['keys'] if col in df.columns]
+        if keys and len(keys) == len(schema['keys']):
+            key_frame = df[keys].astype(str)
+            self._key_hashes.append(pd.util.hash_pandas_object(key_frame, index=False).to_numpy())
+
+    def result(self):
+        """검증 결과 (보고서 항목)"""
+        violations = dict(self.violations)
+
+        if self._key_hashes:
+            hashes = np.concatenate(self._key_hashes)
+            duplicates = len(hashes) - len(np.unique(hashes))
+            if duplicates:
+                violations[('duplicate_key', ','.join(self.schema['keys']))] = {'count': duplicates, 'examples': []}
+
+        return {
+            'status': 'failed' if violations else 'passed',
+            'rows': self.rows,
+            'violations': [
+                {'check': check, 'column': column, **entry}
+                for (check, column), entry in violations.items()
+            ],
+            'validated_at': datetime.now().isoformat()
+        }
+
+def validate_dataset(df, name):
+    """DataFrame 하나 검증"""
+    validator = DatasetValidator(name)
+    validator.check(df)
+    return validator.result()
+
+def load_validation_report(processed_dir):
+    """검증 보고서 읽기 (없으면 빈 dict)"""
+    try:
+        with open(Path(processed_dir) / REPORT_FILENAME, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def update_validation_report(processed_dir, results):
+    """데이터셋별 검증 결과 갱신 (이번에 처리하지 않은 데이터셋은 이전 결과 유지)"""
+    report_path = Path(processed_dir) / REPORT_FILENAME
+    report = load_validation_report(processed_dir)
+    for name, result in results.items():
+        # 결과가 같으면 이전 항목 유지 (보고서 내용이 같아야 스냅샷이 중복 제거됨)
+        previous = report.get(name, {})
+        if {k: v for k, v in previous.items() if k != 'validated_at'} != \
+                {k: v for k, v in result.items() if k != 'validated_at'}:
+            report[name] = result
+
+    tmp_path = report_path.with_name(f'{report_path.name}.{os.getpid()}.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, report_path)
+    return report
@@ -8,34 +8,32 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-import pandas as pd
-from pathlib import Path
+from data.data_loader import get_data_repository, PROCESSED_DIR
+from data.refresh import get_refresh_scheduler
 
-# ✅ 파일 경로 설정
-BASE_DIR = Path(__file__).resolve().parent
-DATA_DIR = BASE_DIR / "assets" / "data" / "processed"
+# ✅ 자동 갱신 설정 시 백그라운드 갱신 시작 (서버 프로세스당 한 번, 화면은 기다리지 않음)
+get_refresh_scheduler()
 
-institution_file = DATA_DIR / "institution_data.csv"
-patent_file = DATA_DIR / "patent_data.csv"
+# ✅ 데이터 불러오기 (세션 간 공유 저장소, 파일이 바뀔 때만 다시 읽음)
+repository = get_data_repository()
 
-# ✅ 파일 존재 확인
-if not institution_file.exists():
-    st.error(f"❌ 기관 데이터 파일이 없습니다: {institution_file}")
-    st.stop()
-
-if not patent_file.exists():
-    st.error(f"❌ 특허 데이터 파일이 없습니다: {patent_file}")
-    st.stop()
-
-# ✅ 데이터 불러오기
 try:
-    institution_data = pd.read_csv(institution_file)
-    patent_data = pd.read_csv(patent_file)
+    institution_data = repository.dataset('institution_data')
+    patent_data = repository.dataset('patent_data')
 except Exception as e:
     st.error("❌ 데이터 불러오는 중 오류 발생")
     st.exception(e)
     st.stop()
 
+# ✅ 데이터 존재 확인
+if institution_data is None:
+    st.error(f"❌ 기관 데이터 파일이 없습니다: {PROCESSED_DIR / 'institution_data.csv'}")
+    st.stop()
+
+if patent_data is None:
+    st.error(f"❌ 특허 데이터 파일이 없습니다: {PROCESSED_DIR / 'patent_data.csv'}")
+    st.stop()
+
 # ✅ 메인 UI 출력
 st.markdown("""
 <style>
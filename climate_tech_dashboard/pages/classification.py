@@ -3,6 +3,15 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+import sys
+import os
+
+# 상위 디렉토리 추가 (data 모듈 import용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.data_loader import get_data_repository
+from utils.profiling import profiled_page
+from utils.tracing import plotly_chart, traced, traced_page
 
 # 페이지 설정
 st.set_page_config(page_title="기후기술 분류체계", page_icon="🔬", layout="wide")
@@ -26,32 +35,22 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@traced('load')
 def load_classification_data():
     """분류체계 데이터 로드"""
     try:
-        # 실제 크롤링된 데이터 로드 시도
-        data_path = Path('climate_tech_classifivation.csv')
-        if data_path.exists():
-            df = pd.read_csv(data_path)
-        else:
-            # 샘플 데이터 생성
-            df = create_sample_classification_data()
-        return df
+        # 크롤링된 분류체계 (scraped 폴더, 없으면 샘플 데이터)
+        return get_data_repository().scraped('climate_tech_classification',
+                                             default=create_sample_classification_data)
     except Exception as e:
         st.error(f"데이터 로드 실패: {str(e)}")
         return create_sample_classification_data()
 
-@st.cache_data
+@traced('load')
 def load_detailed_data():
     """상세정보 데이터 로드"""
     try:
-        data_path = Path('./climate_tech_detailed.csv')
-        if data_path.exists():
-            df = pd.read_csv(data_path)
-        else:
-            df = create_sample_detailed_data()
-        return df
+        return get_data_repository().scraped('climate_tech_detailed', default=create_sample_detailed_data)
     except Exception as e:
         st.error(f"상세정보 로드 실패: {str(e)}")
         return create_sample_detailed_data()
@@ -134,6 +133,7 @@ def create_sample_detailed_data():
     ]
     return pd.DataFrame(data)
 
+@traced('filter')
 def filter_data(df, field, tech_type):
     """데이터 필터링"""
     filtered_df = df.copy()
@@ -146,6 +146,7 @@ def filter_data(df, field, tech_type):
     
     return filtered_df
 
+@traced('figure')
 def create_pie_chart(data, level='L2'):
     """파이차트 생성"""
     if level == 'L1':
@@ -193,6 +194,7 @@ def create_pie_chart(data, level='L2'):
     
     return fig
 
+@traced('figure')
 def create_sunburst_chart(data):
     """선버스트 차트 생성"""
     if data.empty:
@@ -251,6 +253,8 @@ def show_detailed_info(detailed_data, selected_tech):
             </div>
             """, unsafe_allow_html=True)
 
+@profiled_page('classification')
+@traced_page('classification')
 def main():
     st.title("🔬 기후기술 분류체계")
     
@@ -332,7 +336,7 @@ def main():
             
             # 파이차트 생성
             fig = create_pie_chart(filtered_data, level)
-            st.plotly_chart(fig, use_container_width=True)
+            plotly_chart(fig, use_container_width=True, key='pie_chart')
         
         with col2:
             st.subheader("📊 분류 현황")
@@ -349,7 +353,7 @@ def main():
     
     else:  # 선버스트차트
         fig = create_sunburst_chart(filtered_data)
-        st.plotly_chart(fig, use_container_width=True)
+        plotly_chart(fig, use_container_width=True, key='sunburst_chart')
     
     # 상세정보 섹션
     if show_details:
@@ -3,6 +3,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+import html
 import json
 from datetime import datetime
 import sys
@@ -11,6 +12,14 @@ import os
 # 상위 디렉토리 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from data.data_loader import get_data_repository, DATA_ROOT
+from data.refresh import get_refresh_scheduler, load_refresh_config, JOB_KINDS, ACTIVE_STATUSES, CONFIG_PATH
+from utils.profiling import (PROFILE_DIR, PROFILERS, REQUEST_KEY, download_buttons, request_profile,
+                             saved_profiles)
+
+# 갱신 상태 확인 주기 (초)
+REFRESH_POLL_SECONDS = 2
+
 # 페이지 설정
 st.set_page_config(page_title="데이터 관리", page_icon="⚙️", layout="wide")
 
@@ -60,7 +69,7 @@ st.markdown("""
 
 def get_data_status():
     """데이터 상태 확인"""
-    base_path = Path('./assets/data')
+    base_path = DATA_ROOT
     
     data_files = {
         'scraped': {
@@ -89,9 +98,9 @@ def get_data_status():
                 file_size = file_path.stat().st_size
                 modified_time = datetime.fromtimestamp(file_path.stat().st_mtime)
                 
-                # 데이터 미리보기
+                # 데이터 미리보기 (공유 저장소, 파일이 바뀔 때만 다시 읽음)
                 try:
-                    df = pd.read_csv(file_path)
+                    df = get_data_repository().csv(file_path)
                     rows = len(df)
                     cols = len(df.columns)
                     
@@ -120,43 +129,65 @@ def get_data_status():
     
     return status
 
-def run_data_collection():
-    """데이터 수집 실행"""
-    try:
-        # 데이터 수집 모듈 import
-        from data.scraping import ClimateTechScraper
-        
-        with st.spinner("데이터 수집 중..."):
-            scraper = ClimateTechScraper()
-            
-            # 진행 상황 표시
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            # 기본 분류체계 크롤링
-            status_text.text("기후기술 분류체계 수집 중...")
-            progress_bar.progress(25)
-            classification_df = scraper.scrape_classification_basic()
-            
-            # 상세정보 크롤링
-            status_text.text("상세정보 수집 중...")
-            progress_bar.progress(50)
-            detailed_df = scraper.scrape_detailed_info()
-            
-            # 샘플 데이터 생성
-            status_text.text("샘플 데이터 생성 중...")
-            progress_bar.progress(75)
-            
-            if classification_df is None or detailed_df is None:
-                scraper.create_sample_data()
-            
-            progress_bar.progress(100)
-            status_text.text("데이터 수집 완료!")
-            
-            return True, "데이터 수집이 완료되었습니다."
-            
-    except Exception as e:
-        return False, f"데이터 수집 실패: {str(e)}"
+# 작업 상태 → 표시
+JOB_STATUS_LABELS = {
+    'queued': ('⏳', '대기 중'),
+    'running': ('🔄', '진행 중'),
+    'succeeded': ('✅', '완료'),
+    'failed': ('❌', '실패'),
+    'skipped': ('⏭️', '건너뜀'),
+    'interrupted': ('⚠️', '중단됨')
+}
+
+def request_refresh(kind):
+    """백그라운드 갱신 요청 (화면은 기다리지 않음)"""
+    job = get_refresh_scheduler().request(kind=kind, trigger='manual')
+    st.session_state.refresh_job_id = job['id']
+    return job
+
+def show_refresh_job(job):
+    """갱신 작업 하나 표시"""
+    icon, label = JOB_STATUS_LABELS.get(job['status'], ('❔', job['status']))
+    st.markdown(f"**{icon} {JOB_KINDS.get(job['kind'], job['kind'])}** · {label} · "
+                f"{job['created_at'][:19].replace('T', ' ')} ({job['trigger']})")
+    
+    if job['status'] in ACTIVE_STATUSES:
+        st.progress(job['progress'], text=job['step'])
+    
+    if job['log']:
+        st.markdown(f"""
+        <div class="log-entry">
+            {'<br>'.join(html.escape(line) for line in job['log'][-10:])}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    if job['status'] == 'failed' and job.get('error'):
+        with st.expander("오류 상세"):
+            st.code(job['error'])
+
+@st.fragment(run_every=REFRESH_POLL_SECONDS)
+def show_refresh_status():
+    """갱신 작업 상태 (작업 기록을 주기적으로 다시 읽는 부분만 재실행)"""
+    jobs = get_refresh_scheduler().registry.jobs()
+    if not jobs:
+        st.info("갱신 기록이 없습니다.")
+        return
+    
+    # 진행 중인 작업, 없으면 가장 최근 작업
+    current = next((job for job in jobs if job['status'] in ACTIVE_STATUSES), jobs[0])
+    show_refresh_job(current)
+    
+    # 이 세션에서 요청한 갱신이 끝났으면 알림 (공유 저장소는 바뀐 파일을 자동으로 다시 읽음)
+    if st.session_state.get('refresh_job_id') == current['id'] and current['status'] == 'succeeded':
+        del st.session_state.refresh_job_id
+        st.success("데이터 갱신이 완료되었습니다. 다른 페이지에 새 데이터가 반영됩니다.")
+    
+    history = [job for job in jobs if job['id'] != current['id']]
+    if history:
+        with st.expander(f"📝 이전 갱신 기록 ({len(history)}건)"):
+            for job in history:
+                show_refresh_job(job)
+                st.markdown("---")
 
 def create_data_overview_chart(status):
     """데이터 개요 차트 생성"""
@@ -229,8 +260,7 @@ def show_data_preview(status):
             
             # 상세 정보
             if st.checkbox("상세 정보 보기"):
-                file_path = Path(f'assets/data/{folder}/{filename}')
-                full_df = pd.read_csv(file_path)
+                full_df = get_data_repository().csv(DATA_ROOT / folder / filename)
                 
                 col1, col2 = st.columns(2)
                 
@@ -273,6 +303,39 @@ def show_system_info():
     except ImportError:
         st.warning("시스템 정보를 위해 psutil 패키지가 필요합니다.")
 
+def show_profiling_tools():
+    """재실행 프로파일링 예약과 저장된 프로파일"""
+    st.subheader("🔬 재실행 프로파일링")
+    st.caption("예약하면 다음에 여는 분석 페이지의 재실행 한 번을 프로파일링합니다. "
+               "페이지 URL에 ?profile=1 (샘플링) 또는 ?profile=cprofile을 붙여도 됩니다.")
+    
+    pending = st.session_state.get(REQUEST_KEY)
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        profiler = st.selectbox("프로파일러", list(PROFILERS), format_func=lambda name: PROFILERS[name].label)
+    
+    with col2:
+        if pending:
+            if st.button("⏹️ 예약 취소"):
+                st.session_state.pop(REQUEST_KEY, None)
+                st.rerun()
+        elif st.button("▶️ 다음 재실행 프로파일링"):
+            request_profile(profiler)
+            st.rerun()
+    
+    if pending:
+        st.info(f"예약됨: {PROFILERS[pending].label} - 분석 페이지로 이동하면 첫 재실행을 프로파일링합니다.")
+    
+    profiles = saved_profiles()
+    if profiles:
+        st.markdown(f"**저장된 프로파일** (`{PROFILE_DIR}`)")
+        for name, files in profiles.items():
+            with st.expander(name):
+                download_buttons(files, f'saved_{name}')
+    else:
+        st.info("저장된 프로파일이 없습니다.")
+
 def main():
     st.title("⚙️ 데이터 관리")
     
@@ -375,10 +438,10 @@ def main():
             col1, col2 = st.columns(2)
             
             with col1:
-                st.plotly_chart(fig1, use_container_width=True)
+                st.plotly_chart(fig1, use_container_width=True, key='fig1')
             
             with col2:
-                st.plotly_chart(fig2, use_container_width=True)
+                st.plotly_chart(fig2, use_container_width=True, key='fig2')
     
     with tab2:
         st.subheader("🔍 데이터 수집")
@@ -386,55 +449,36 @@ def main():
         st.markdown("""
         ### 데이터 수집 옵션
         
-        **자동 수집:** 웹 크롤링을 통해 실제 데이터를 수집합니다.
-        - 기후기술 분류체계 (CTIS 웹사이트)
-        - 기후기술 상세정보 (CTIS 웹사이트)
+        수집과 처리는 백그라운드에서 실행되며, 진행 중에도 다른 페이지를 계속 사용할 수 있습니다.
         
-        **샘플 데이터:** 실제 데이터와 유사한 샘플 데이터를 생성합니다.
-        - 기관 현황 데이터
-        - 특허 현황 데이터
-        - 수명주기 데이터
-        - 해외진출 데이터
+        **전체 갱신:** 웹 크롤링과 KOSIS 통계표 수집 후 데이터를 처리합니다.
+        - 기후기술 분류체계 / 상세정보 (CTIS 웹사이트)
+        - 기관·특허·수명주기·해외진출 통계표 (KOSIS, KOSIS_API_KEY 설정 시)
+        
+        **raw 파일 처리:** assets/data/raw 폴더의 파일만 다시 처리합니다 (변경된 파일만).
         """)
         
+        active = get_refresh_scheduler().registry.active()
+        
         col1, col2 = st.columns(2)
         
         with col1:
-            if st.button("🕷️ 실제 데이터 수집", use_container_width=True):
-                success, message = run_data_collection()
-                
-                if success:
-                    st.success(message)
-                    st.balloons()
-                else:
-                    st.error(message)
+            if st.button("🕷️ 전체 갱신", use_container_width=True, disabled=active is not None):
+                request_refresh('full')
         
         with col2:
-            if st.button("📋 샘플 데이터 생성", use_container_width=True):
-                try:
-                    from data.scraping import ClimateTechScraper
-                    
-                    with st.spinner("샘플 데이터 생성 중..."):
-                        scraper = ClimateTechScraper()
-                        scraper.create_sample_data()
-                    
-                    st.success("샘플 데이터가 생성되었습니다.")
-                except Exception as e:
-                    st.error(f"샘플 데이터 생성 실패: {str(e)}")
-        
-        # 수집 로그
-        st.subheader("📝 수집 로그")
-        
-        if 'collection_logs' in st.session_state:
-            for log in st.session_state.collection_logs[-10:]:  # 최근 10개
-                st.markdown(f"""
-                <div class="log-entry">
-                    <strong>{log['timestamp']}</strong><br>
-                    {log['message']}
-                </div>
-                """, unsafe_allow_html=True)
+            if st.button("📊 raw 파일 처리", use_container_width=True, disabled=active is not None):
+                request_refresh('process')
+        
+        interval = load_refresh_config()
+        if interval is not None:
+            st.caption(f"⏰ 자동 갱신: {interval.total_seconds() / 3600:g}시간마다")
         else:
-            st.info("수집 로그가 없습니다.")
+            st.caption("⏰ 자동 갱신 꺼짐 (설정 파일의 auto_refresh)")
+        
+        # 갱신 상태
+        st.subheader("📝 갱신 상태")
+        show_refresh_status()
     
     with tab3:
         show_data_preview(status)
@@ -450,6 +494,7 @@ def main():
         with col1:
             if st.button("🗑️ 캐시 정리"):
                 st.cache_data.clear()
+                get_data_repository().clear()
                 st.success("캐시가 정리되었습니다.")
         
         with col2:
@@ -467,10 +512,12 @@ def main():
                 st.warning("변경사항 적용을 위해 앱을 재시작하세요.")
                 st.markdown("```bash\nstreamlit run main.py\n```")
         
+        show_profiling_tools()
+        
         # 설정 파일 관리
         st.subheader("⚙️ 설정 관리")
         
-        config_path = Path('config/app_config.json')
+        config_path = CONFIG_PATH
         
         if config_path.exists():
             with open(config_path, 'r', encoding='utf-8') as f:
@@ -525,6 +572,7 @@ def main():
     with col1:
         if st.button("🔄 데이터 새로고침", use_container_width=True):
             st.cache_data.clear()
+            get_data_repository().clear()
             st.experimental_rerun()
     
     with col2:
@@ -542,7 +590,7 @@ def main():
                 
                 with zipfile.ZipFile(zip_buffer, 'w', zipfile.ZIP_DEFLATED) as zip_file:
                     for folder in ['scraped', 'processed']:
-                        folder_path = Path(f'assets/data/{folder}')
+                        folder_path = DATA_ROOT / folder
                         if folder_path.exists():
                             for file_path in folder_path.glob('*.csv'):
                                 zip_file.write(file_path, f'{folder}/{file_path.name}')
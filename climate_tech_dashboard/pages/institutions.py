@@ -4,6 +4,17 @@ import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 from pathlib import Path
+import sys
+import os
+
+# 상위 디렉토리 추가 (data 모듈 import용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.aggregates import ROW_COUNT, build_cube, dataset_cubes, slice_cube
+from data.data_loader import get_data_repository
+from data.sample_data import load_sample_dataset
+from utils.profiling import profiled_page
+from utils.tracing import plotly_chart, traced, traced_page
 
 # 페이지 설정
 st.set_page_config(page_title="기관 현황", page_icon="🏢", layout="wide")
@@ -29,108 +40,36 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@traced('load')
 def load_institution_data():
     """기관 현황 데이터 로드 또는 생성"""
     try:
-        # 실제 데이터 경로 확인
-        data_path = Path('./assets/data/processed/institution_data.csv')
-        if data_path.exists():
-            return pd.read_csv(data_path)
-        else:
-            return create_sample_institution_data()
+        # 세션 간 공유 저장소 (게시된 스냅샷의 파일이 바뀔 때만 다시 읽음)
+        return get_data_repository().dataset('institution_data', default=create_sample_institution_data)
     except Exception as e:
         st.error(f"데이터 로드 실패: {str(e)}")
         return create_sample_institution_data()
 
+@traced('load')
+def load_institution_cubes():
+    """기관 현황 집계 큐브 로드 (ETL이 만든 큐브, 없으면 데이터셋으로 한 번 계산)"""
+    try:
+        return get_data_repository().cubes('institution_data', default=load_institution_data)
+    except Exception as e:
+        st.error(f"집계 데이터 로드 실패: {str(e)}")
+        sample = create_sample_institution_data()
+        return {name: build_cube(name, sample) for name in dataset_cubes('institution_data')}
+
 def create_sample_institution_data():
-    """샘플 기관 현황 데이터 생성"""
-    np.random.seed(42)
-    
-    # 기관 규모
-    scales = ['대기업', '중기업', '소기업', '연구기관', '스타트업']
-    
-    # 기후기술 분야
-    fields = ['감축', '적응', '융복합']
-    
-    # 기술 종류
-    tech_types = ['재생에너지', '비재생에너지', '에너지효율', '수송', '에너지저장', 
-                  '물관리', '농업', '해양수산', 'ICT융합']
-    
-    data = []
-    
-    for scale in scales:
-        for field in fields:
-            for tech_type in tech_types:
-                # 규모별 기본값 설정
-                if scale == '대기업':
-                    base_revenue = np.random.normal(50000, 15000)
-                    base_employees = np.random.normal(500, 150)
-                    base_rd_cost = np.random.normal(2000, 600)
-                    base_researchers = np.random.normal(50, 15)
-                elif scale == '중기업':
-                    base_revenue = np.random.normal(15000, 5000)
-                    base_employees = np.random.normal(150, 50)
-                    base_rd_cost = np.random.normal(600, 200)
-                    base_researchers = np.random.normal(20, 8)
-                elif scale == '소기업':
-                    base_revenue = np.random.normal(3000, 1000)
-                    base_employees = np.random.normal(30, 10)
-                    base_rd_cost = np.random.normal(150, 50)
-                    base_researchers = np.random.normal(5, 2)
-                elif scale == '연구기관':
-                    base_revenue = np.random.normal(8000, 2000)
-                    base_employees = np.random.normal(100, 30)
-                    base_rd_cost = np.random.normal(4000, 1000)
-                    base_researchers = np.random.normal(80, 20)
-                else:  # 스타트업
-                    base_revenue = np.random.normal(500, 200)
-                    base_employees = np.random.normal(15, 5)
-                    base_rd_cost = np.random.normal(100, 30)
-                    base_researchers = np.random.normal(8, 3)
-                
-                # 분야별 조정 (감축 기술이 상대적으로 투자 많음)
-                field_multiplier = 1.2 if field == '감축' else 1.0 if field == '적응' else 0.9
-                
-                data.append({
-                    'scale': scale,
-                    'field': field,
-                    'tech_type': tech_type,
-                    'revenue': max(0, base_revenue * field_multiplier),
-                    'employees': max(1, int(base_employees * field_multiplier)),
-                    'rd_cost': max(0, base_rd_cost * field_multiplier),
-                    'researchers': max(1, int(base_researchers * field_multiplier)),
-                    'year': 2020
-                })
-                
-                # 2019년 데이터도 추가 (약간 낮은 값)
-                data.append({
-                    'scale': scale,
-                    'field': field,
-                    'tech_type': tech_type,
-                    'revenue': max(0, base_revenue * field_multiplier * 0.9),
-                    'employees': max(1, int(base_employees * field_multiplier * 0.95)),
-                    'rd_cost': max(0, base_rd_cost * field_multiplier * 0.85),
-                    'researchers': max(1, int(base_researchers * field_multiplier * 0.9)),
-                    'year': 2019
-                })
-    
-    return pd.DataFrame(data)
+    """샘플 기관 현황 데이터 (시드 고정 벡터화 생성, 한 번 만든 뒤 디스크에서 재사용)"""
+    return load_sample_dataset('institution_data')
 
-def filter_institution_data(df, scale, field, year):
-    """기관 데이터 필터링"""
-    filtered_df = df.copy()
-    
-    if scale != "전체":
-        filtered_df = filtered_df[filtered_df['scale'] == scale]
-    
-    if field != "전체":
-        filtered_df = filtered_df[filtered_df['field'] == field]
-    
-    filtered_df = filtered_df[filtered_df['year'] == year]
-    
-    return filtered_df
+@traced('filter')
+def filter_institution_data(cube, scale, field, year):
+    """기관 데이터 필터링 (연도 × 분야 × 규모 × 기술 큐브 자르기)"""
+    return slice_cube(cube, year=year, scale=scale, field=field)
 
+@traced('figure')
 def create_bar_chart(data, metric, title):
     """막대차트 생성"""
     if data.empty:
@@ -139,7 +78,7 @@ def create_bar_chart(data, metric, title):
                                         x=0.5, y=0.5, showarrow=False)
     
     # 기술 종류별 집계
-    agg_data = data.groupby('tech_type')[metric].sum().reset_index()
+    agg_data = data.groupby('tech_type', observed=True)[metric].sum().reset_index()
     agg_data = agg_data.sort_values(metric, ascending=True)
     
     fig = px.bar(
@@ -167,6 +106,7 @@ def create_bar_chart(data, metric, title):
     
     return fig
 
+@traced('figure')
 def create_correlation_scatter(data, x_metric, y_metric, field):
     """상관분석 산점도 생성"""
     if data.empty:
@@ -229,17 +169,20 @@ def get_metric_label(metric):
     }
     return labels.get(metric, metric)
 
+@traced('aggregate')
 def calculate_correlation(data, x_metric, y_metric):
     """상관계수 계산"""
     if len(data) < 2:
         return 0
     return data[x_metric].corr(data[y_metric])
 
+@profiled_page('institutions')
+@traced_page('institutions')
 def main():
     st.title("🏢 기후기술 기관 현황")
     
-    # 데이터 로드
-    institution_data = load_institution_data()
+    # 데이터 로드 (ETL이 미리 집계한 연도 × 분야 × 규모 × 기술 큐브)
+    institution_data = load_institution_cubes()['institution_by_tech']
     
     # 사이드바 컨트롤
     st.sidebar.header("🔧 필터 설정")
@@ -322,11 +265,11 @@ def main():
             selected_metric, 
             f"기술 종류별 {selected_metric_name}"
         )
-        st.plotly_chart(bar_fig, use_container_width=True)
+        plotly_chart(bar_fig, use_container_width=True, key='bar_fig')
     
     with col2:
         st.markdown("### 📋 상위 5개 기술")
-        top5_data = filtered_data.groupby('tech_type')[selected_metric].sum().sort_values(ascending=False).head(5)
+        top5_data = filtered_data.groupby('tech_type', observed=True)[selected_metric].sum().sort_values(ascending=False).head(5)
         
         for i, (tech, value) in enumerate(top5_data.items(), 1):
             st.markdown(f"""
@@ -346,7 +289,7 @@ def main():
         scatter_fig1 = create_correlation_scatter(
             filtered_data, 'revenue', 'employees', selected_field
         )
-        st.plotly_chart(scatter_fig1, use_container_width=True)
+        plotly_chart(scatter_fig1, use_container_width=True, key='scatter_fig1')
         
         # 상관계수 표시
         corr1 = calculate_correlation(filtered_data, 'revenue', 'employees')
@@ -357,7 +300,7 @@ def main():
         scatter_fig2 = create_correlation_scatter(
             filtered_data, 'revenue', 'rd_cost', selected_field
         )
-        st.plotly_chart(scatter_fig2, use_container_width=True)
+        plotly_chart(scatter_fig2, use_container_width=True, key='scatter_fig2')
         
         # 상관계수 표시
         corr2 = calculate_correlation(filtered_data, 'revenue', 'rd_cost')
@@ -366,12 +309,9 @@ def main():
     # 기관 규모별 분석
     st.subheader("🏭 기관 규모별 분석")
     
-    scale_analysis = filtered_data.groupby('scale').agg({
-        'revenue': 'mean',
-        'employees': 'mean',
-        'rd_cost': 'mean',
-        'researchers': 'mean'
-    }).round(0)
+    # 원본 행 기준 평균 = 규모별 합계 / 원본 행 수
+    scale_totals = filtered_data.groupby('scale', observed=True)[list(metrics.values()) + [ROW_COUNT]].sum()
+    scale_analysis = scale_totals[list(metrics.values())].div(scale_totals[ROW_COUNT], axis=0).round(0)
     
     # 규모별 비교 차트
     scale_fig = go.Figure()
@@ -393,7 +333,7 @@ def main():
         title_x=0.5
     )
     
-    st.plotly_chart(scale_fig, use_container_width=True)
+    plotly_chart(scale_fig, use_container_width=True, key='scale_fig')
     
     # 홈으로 돌아가기
     if st.button("🏠 메인으로 돌아가기"):
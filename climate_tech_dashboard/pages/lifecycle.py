@@ -4,6 +4,17 @@ import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 from pathlib import Path
+import sys
+import os
+
+# 상위 디렉토리 추가 (data 모듈 import용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.aggregates import build_cube, dataset_cubes, slice_cube
+from data.data_loader import get_data_repository
+from data.sample_data import load_sample_dataset
+from utils.profiling import profiled_page
+from utils.tracing import plotly_chart, traced, traced_page
 
 # 페이지 설정
 st.set_page_config(page_title="기술 수명주기", page_icon="🔄", layout="wide")
@@ -37,109 +48,42 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@traced('load')
 def load_lifecycle_data():
     """수명주기 데이터 로드 또는 생성"""
     try:
-        data_path = Path('./assets/data/processed/lifecycle_data.csv')
-        if data_path.exists():
-            return pd.read_csv(data_path)
-        else:
-            return create_sample_lifecycle_data()
+        # 세션 간 공유 저장소 (게시된 스냅샷의 파일이 바뀔 때만 다시 읽음)
+        return get_data_repository().dataset('lifecycle_data', default=create_sample_lifecycle_data)
     except Exception as e:
         st.error(f"수명주기 데이터 로드 실패: {str(e)}")
         return create_sample_lifecycle_data()
 
+@traced('load')
+def load_lifecycle_cubes():
+    """수명주기 집계 큐브 로드 (ETL이 만든 큐브, 없으면 데이터셋으로 한 번 계산)"""
+    try:
+        return get_data_repository().cubes('lifecycle_data', default=load_lifecycle_data)
+    except Exception as e:
+        st.error(f"수명주기 집계 데이터 로드 실패: {str(e)}")
+        sample = create_sample_lifecycle_data()
+        return {name: build_cube(name, sample) for name in dataset_cubes('lifecycle_data')}
+
 def create_sample_lifecycle_data():
-    """샘플 수명주기 데이터 생성"""
-    np.random.seed(42)
-    
-    # 수명주기 단계 정의
-    lifecycle_stages = [
-        '기초연구', '응용연구', '개발연구', '시제품제작',
-        '사업화준비', '시장진입', '시장확산', '성숙기'
-    ]
-    
-    # 기술 분야 및 세부 기술
-    tech_data = {
-        '감축': ['태양광', '풍력', '전기차', '배터리', '수소', 'CCUS', '원자력'],
-        '적응': ['스마트팜', '홍수방어', '가뭄대응', '기후예측', '생태복원'],
-        '융복합': ['스마트그리드', 'AI기후', 'IoT센서', '바이오융합']
-    }
-    
-    data = []
-    years = [2019, 2020, 2021, 2022]
-    
-    for year in years:
-        for field, techs in tech_data.items():
-            for tech in techs:
-                # 각 기술의 수명주기 분포 생성
-                stage_weights = create_stage_distribution(tech, year)
-                
-                for i, stage in enumerate(lifecycle_stages):
-                    # 기술별 총 프로젝트 수 (무작위)
-                    total_projects = np.random.randint(20, 100)
-                    
-                    # 해당 단계의 프로젝트 수
-                    stage_projects = int(total_projects * stage_weights[i])
-                    
-                    data.append({
-                        'year': year,
-                        'field': field,
-                        'tech_name': tech,
-                        'lifecycle_stage': stage,
-                        'project_count': stage_projects,
-                        'stage_order': i + 1
-                    })
-    
-    return pd.DataFrame(data)
+    """샘플 수명주기 데이터 (시드 고정 벡터화 생성, 한 번 만든 뒤 디스크에서 재사용)"""
+    return load_sample_dataset('lifecycle_data')
 
-def create_stage_distribution(tech, year):
-    """기술별 수명주기 단계 분포 생성"""
-    # 기술 성숙도에 따른 분포
-    mature_techs = ['태양광', '풍력', '스마트팜']
-    emerging_techs = ['수소', 'CCUS', 'AI기후', 'IoT센서']
-    
-    if tech in mature_techs:
-        # 성숙 기술: 후반 단계에 집중
-        weights = [0.05, 0.08, 0.12, 0.15, 0.20, 0.25, 0.10, 0.05]
-    elif tech in emerging_techs:
-        # 신기술: 초기 단계에 집중
-        weights = [0.25, 0.20, 0.18, 0.15, 0.12, 0.07, 0.02, 0.01]
-    else:
-        # 일반 기술: 중간 단계에 집중
-        weights = [0.10, 0.15, 0.20, 0.20, 0.15, 0.12, 0.06, 0.02]
-    
-    # 연도별 진화 (시간이 지나면서 후반 단계로 이동)
-    year_shift = (year - 2019) * 0.05
-    for i in range(len(weights)):
-        if i < 4:  # 초기 단계 감소
-            weights[i] = max(0, weights[i] - year_shift)
-        else:  # 후기 단계 증가
-            weights[i] = min(1, weights[i] + year_shift/4)
-    
-    # 정규화
-    total = sum(weights)
-    return [w/total for w in weights]
-
-def filter_lifecycle_data(df, year, field, tech_type):
-    """수명주기 데이터 필터링"""
-    filtered_df = df[df['year'] == year].copy()
-    
-    if field != "전체":
-        filtered_df = filtered_df[filtered_df['field'] == field]
-    
-    if tech_type != "전체":
-        filtered_df = filtered_df[filtered_df['tech_name'] == tech_type]
-    
-    return filtered_df
+@traced('filter')
+def filter_lifecycle_data(cube, year, field, tech_type):
+    """수명주기 데이터 필터링 (연도 × 분야 × 기술 × 단계 큐브 자르기)"""
+    return slice_cube(cube, year=year, field=field, tech_name=tech_type)
 
+@traced('aggregate')
 def create_stage_summary_table(data):
     """수명주기 단계별 요약 테이블"""
     if data.empty:
         return pd.DataFrame()
     
-    summary = data.groupby('lifecycle_stage').agg({
+    summary = data.groupby('lifecycle_stage', observed=True).agg({
         'project_count': ['sum', 'mean', 'count'],
         'tech_name': 'nunique'
     }).round(1)
@@ -149,6 +93,7 @@ def create_stage_summary_table(data):
     
     return summary
 
+@traced('figure')
 def create_lifecycle_line_chart(data, selected_stages):
     """수명주기 라인차트 생성"""
     if data.empty:
@@ -161,7 +106,7 @@ def create_lifecycle_line_chart(data, selected_stages):
         data = data[data['lifecycle_stage'].isin(selected_stages)]
     
     # 기술별 단계별 집계
-    line_data = data.groupby(['tech_name', 'lifecycle_stage', 'stage_order'])['project_count'].sum().reset_index()
+    line_data = data.groupby(['tech_name', 'lifecycle_stage', 'stage_order'], observed=True)['project_count'].sum().reset_index()
     
     fig = go.Figure()
     
@@ -192,6 +137,7 @@ def create_lifecycle_line_chart(data, selected_stages):
     
     return fig
 
+@traced('figure')
 def create_stage_distribution_chart(data):
     """단계별 분포 차트"""
     if data.empty:
@@ -199,7 +145,7 @@ def create_stage_distribution_chart(data):
                                         xref="paper", yref="paper", 
                                         x=0.5, y=0.5, showarrow=False)
     
-    stage_summary = data.groupby('lifecycle_stage')['project_count'].sum().reset_index()
+    stage_summary = data.groupby('lifecycle_stage', observed=True)['project_count'].sum().reset_index()
     stage_summary = stage_summary.sort_values('project_count', ascending=True)
     
     fig = px.bar(
@@ -225,6 +171,7 @@ def create_stage_distribution_chart(data):
     
     return fig
 
+@traced('figure')
 def create_field_stage_heatmap(data):
     """분야별 단계 히트맵"""
     if data.empty:
@@ -238,7 +185,8 @@ def create_field_stage_heatmap(data):
         index='lifecycle_stage',
         columns='field',
         aggfunc='sum',
-        fill_value=0
+        fill_value=0,
+        observed=True
     )
     
     fig = px.imshow(
@@ -257,6 +205,7 @@ def create_field_stage_heatmap(data):
     
     return fig
 
+@traced('figure')
 def create_tech_maturity_radar(data):
     """기술 성숙도 레이더 차트"""
     if data.empty:
@@ -267,24 +216,17 @@ def create_tech_maturity_radar(data):
     # 기술별 성숙도 계산 (후반 단계 비중으로 계산)
     maturity_stages = ['사업화준비', '시장진입', '시장확산', '성숙기']
     
-    tech_maturity = []
-    for tech in data['tech_name'].unique():
-        tech_data = data[data['tech_name'] == tech]
-        total_projects = tech_data['project_count'].sum()
-        
-        if total_projects > 0:
-            mature_projects = tech_data[tech_data['lifecycle_stage'].isin(maturity_stages)]['project_count'].sum()
-            maturity_score = (mature_projects / total_projects) * 100
-        else:
-            maturity_score = 0
-        
-        tech_maturity.append({
-            'tech_name': tech,
-            'maturity_score': maturity_score,
-            'total_projects': total_projects
-        })
-    
-    maturity_df = pd.DataFrame(tech_maturity)
+    # 한 번의 groupby로 전체/후반 단계 합계 (부분집합 결과를 reindex하면 기술이 많을 때
+    # 범주 코드 dtype이 달라 실패함)
+    sums = (data.assign(mature_count=data['project_count'].where(data['lifecycle_stage'].isin(maturity_stages), 0))
+            .groupby('tech_name', observed=True, sort=False)[['project_count', 'mature_count']].sum())
+    total_projects, mature_projects = sums['project_count'], sums['mature_count']
+
+    maturity_df = pd.DataFrame({
+        'tech_name': total_projects.index.astype(str),
+        'maturity_score': (mature_projects / total_projects * 100).where(total_projects > 0, 0).to_numpy(),
+        'total_projects': total_projects.to_numpy()
+    })
     maturity_df = maturity_df.sort_values('maturity_score', ascending=False).head(8)
     
     fig = go.Figure()
@@ -325,35 +267,36 @@ def get_stage_info():
         '성숙기': '시장 안정화 및 기술 고도화'
     }
 
+@profiled_page('lifecycle')
+@traced_page('lifecycle')
 def main():
     st.title("🔄 기후기술 수명주기")
     
-    # 데이터 로드
-    lifecycle_data = load_lifecycle_data()
+    # 데이터 로드 (ETL이 미리 집계한 기술별/단계별 큐브)
+    cubes = load_lifecycle_cubes()
+    lifecycle_data = cubes['lifecycle_by_tech']
+    stage_data = cubes['lifecycle_by_stage']
     
     # 사이드바 컨트롤
     st.sidebar.header("🔧 필터 설정")
     
     # 연도 선택
-    years = sorted(lifecycle_data['year'].unique(), reverse=True)
+    years = sorted(stage_data['year'].unique(), reverse=True)
     selected_year = st.sidebar.selectbox("연도", years)
     
     # 기술분야 선택
-    fields = ["전체"] + sorted(lifecycle_data['field'].unique().tolist())
+    fields = ["전체"] + sorted(stage_data['field'].unique().tolist())
     selected_field = st.sidebar.selectbox("기후기술 분야", fields)
     
     # 기술 종류 선택 (동적 업데이트)
-    if selected_field == "전체":
-        tech_types = ["전체"] + sorted(lifecycle_data['tech_name'].unique().tolist())
-    else:
-        filtered_for_types = lifecycle_data[lifecycle_data['field'] == selected_field]
-        tech_types = ["전체"] + sorted(filtered_for_types['tech_name'].unique().tolist())
+    field_techs = slice_cube(lifecycle_data, field=selected_field)['tech_name']
+    tech_types = ["전체"] + sorted(field_techs.unique().tolist())
     
     selected_tech_type = st.sidebar.selectbox("기후기술 종류", tech_types)
     
     # 수명주기 단계 선택 (다중 선택)
-    all_stages = sorted(lifecycle_data['lifecycle_stage'].unique(), 
-                       key=lambda x: lifecycle_data[lifecycle_data['lifecycle_stage']==x]['stage_order'].iloc[0])
+    all_stages = (stage_data.drop_duplicates('lifecycle_stage')
+                  .sort_values('stage_order', kind='stable')['lifecycle_stage'].tolist())
     selected_stages = st.sidebar.multiselect(
         "표시할 수명주기 단계",
         all_stages,
@@ -402,7 +345,7 @@ def main():
     with col4:
         # 가장 활발한 단계
         if not filtered_data.empty:
-            most_active_stage = filtered_data.groupby('lifecycle_stage')['project_count'].sum().idxmax()
+            most_active_stage = filtered_data.groupby('lifecycle_stage', observed=True)['project_count'].sum().idxmax()
         else:
             most_active_stage = "없음"
         
@@ -445,7 +388,7 @@ def main():
     st.subheader("📈 기술별 수명주기 분포")
     
     line_fig = create_lifecycle_line_chart(filtered_data, selected_stages)
-    st.plotly_chart(line_fig, use_container_width=True)
+    plotly_chart(line_fig, use_container_width=True, key='line_fig')
     
     # 범례 커스터마이징 (기술 종류별 색상)
     if not filtered_data.empty:
@@ -470,43 +413,37 @@ def main():
     with col1:
         st.subheader("📊 단계별 프로젝트 분포")
         dist_fig = create_stage_distribution_chart(filtered_data)
-        st.plotly_chart(dist_fig, use_container_width=True)
+        plotly_chart(dist_fig, use_container_width=True, key='dist_fig')
     
     with col2:
         st.subheader("🎯 기술 성숙도 분석")
         radar_fig = create_tech_maturity_radar(filtered_data)
-        st.plotly_chart(radar_fig, use_container_width=True)
+        plotly_chart(radar_fig, use_container_width=True, key='radar_fig')
     
     # 히트맵 분석
     st.subheader("🔥 분야별 수명주기 히트맵")
     heatmap_fig = create_field_stage_heatmap(filtered_data)
-    st.plotly_chart(heatmap_fig, use_container_width=True)
+    plotly_chart(heatmap_fig, use_container_width=True, key='heatmap_fig')
     
     # 연도별 트렌드 분석
-    if len(lifecycle_data['year'].unique()) > 1:
+    if len(stage_data['year'].unique()) > 1:
         st.subheader("📈 연도별 수명주기 트렌드")
         
-        # 연도별 성숙도 변화
-        yearly_maturity = []
+        # 연도별 성숙도 변화 (연도 × 분야 × 단계 큐브)
         mature_stages = ['사업화준비', '시장진입', '시장확산', '성숙기']
         
-        for year in sorted(lifecycle_data['year'].unique()):
-            year_data = lifecycle_data[lifecycle_data['year'] == year]
-            if selected_field != "전체":
-                year_data = year_data[year_data['field'] == selected_field]
-            
-            total_projects = year_data['project_count'].sum()
-            mature_projects = year_data[year_data['lifecycle_stage'].isin(mature_stages)]['project_count'].sum()
-            
-            maturity_pct = (mature_projects / total_projects * 100) if total_projects > 0 else 0
-            
-            yearly_maturity.append({
-                'year': year,
-                'maturity_percentage': maturity_pct,
-                'total_projects': total_projects
-            })
+        field_stages = slice_cube(stage_data, field=selected_field)
+        all_years = sorted(stage_data['year'].unique())
+        total_projects = field_stages.groupby('year')['project_count'].sum().reindex(all_years, fill_value=0)
+        mature_projects = (field_stages[field_stages['lifecycle_stage'].isin(mature_stages)]
+                           .groupby('year')['project_count'].sum()
+                           .reindex(all_years, fill_value=0))
         
-        maturity_trend_df = pd.DataFrame(yearly_maturity)
+        maturity_trend_df = pd.DataFrame({
+            'year': all_years,
+            'maturity_percentage': (mature_projects / total_projects * 100).where(total_projects > 0, 0).to_numpy(),
+            'total_projects': total_projects.to_numpy()
+        })
         
         trend_fig = px.line(
             maturity_trend_df,
@@ -528,7 +465,7 @@ def main():
             hovertemplate='<b>%{x}년</b><br>성숙도: %{y:.1f}%<extra></extra>'
         )
         
-        st.plotly_chart(trend_fig, use_container_width=True)
+        plotly_chart(trend_fig, use_container_width=True, key='trend_fig')
     
     # 상세 분석
     if st.checkbox("📋 상세 분석 보기"):
@@ -583,8 +520,8 @@ def main():
         with col3:
             # 가장 활발한 기술
             if not filtered_data.empty:
-                most_active_tech = filtered_data.groupby('tech_name')['project_count'].sum().idxmax()
-                most_active_count = filtered_data.groupby('tech_name')['project_count'].sum().max()
+                most_active_tech = filtered_data.groupby('tech_name', observed=True)['project_count'].sum().idxmax()
+                most_active_count = filtered_data.groupby('tech_name', observed=True)['project_count'].sum().max()
                 st.metric("가장 활발한 기술", most_active_tech)
                 st.metric("해당 기술 프로젝트 수", f"{most_active_count}")
     
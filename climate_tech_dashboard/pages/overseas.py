@@ -7,6 +7,17 @@ from streamlit_folium import st_folium
 import numpy as np
 import math
 from pathlib import Path
+import sys
+import os
+
+# 상위 디렉토리 추가 (data 모듈 import용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.aggregates import build_cube, dataset_cubes, slice_cube
+from data.data_loader import get_data_repository
+from data.sample_data import load_sample_dataset
+from utils.profiling import profiled_page
+from utils.tracing import plotly_chart, traced, traced_page
 
 # 페이지 설정
 st.set_page_config(page_title="해외진출 현황", page_icon="🌏", layout="wide")
@@ -40,110 +51,34 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@traced('load')
 def load_overseas_data():
     """해외진출 데이터 로드 또는 생성"""
     try:
-        data_path = Path('./assets/data/processed/overseas_data.csv')
-        if data_path.exists():
-            return pd.read_csv(data_path)
-        else:
-            return create_sample_overseas_data()
+        # 세션 간 공유 저장소 (게시된 스냅샷의 파일이 바뀔 때만 다시 읽음)
+        return get_data_repository().dataset('overseas_data', default=create_sample_overseas_data)
     except Exception as e:
         st.error(f"해외진출 데이터 로드 실패: {str(e)}")
         return create_sample_overseas_data()
 
+@traced('load')
+def load_overseas_cubes():
+    """해외진출 집계 큐브 로드 (ETL이 만든 큐브, 없으면 데이터셋으로 한 번 계산)"""
+    try:
+        return get_data_repository().cubes('overseas_data', default=load_overseas_data)
+    except Exception as e:
+        st.error(f"해외진출 집계 데이터 로드 실패: {str(e)}")
+        sample = create_sample_overseas_data()
+        return {name: build_cube(name, sample) for name in dataset_cubes('overseas_data')}
+
 def create_sample_overseas_data():
-    """샘플 해외진출 데이터 생성"""
-    np.random.seed(42)
-    
-    # 지역별 좌표 정보
-    regions_info = {
-        '동남아시아': {
-            'countries': ['베트남', '태국', '인도네시아', '필리핀', '말레이시아'],
-            'lat': 10.0, 'lon': 110.0, 'weight': 1.5
-        },
-        '중국': {
-            'countries': ['중국'],
-            'lat': 35.0, 'lon': 104.0, 'weight': 2.0
-        },
-        '일본': {
-            'countries': ['일본'],
-            'lat': 36.0, 'lon': 138.0, 'weight': 1.2
-        },
-        '중동': {
-            'countries': ['UAE', '사우디아라비아', '카타르'],
-            'lat': 25.0, 'lon': 45.0, 'weight': 1.8
-        },
-        '유럽': {
-            'countries': ['독일', '프랑스', '영국', '네덜란드'],
-            'lat': 54.0, 'lon': 15.0, 'weight': 1.3
-        },
-        '북미': {
-            'countries': ['미국', '캐나다'],
-            'lat': 45.0, 'lon': -100.0, 'weight': 1.4
-        },
-        '남미': {
-            'countries': ['브라질', '아르헨티나', '칠레'],
-            'lat': -15.0, 'lon': -60.0, 'weight': 0.8
-        },
-        '아프리카': {
-            'countries': ['남아프리카공화국', '이집트', '모로코'],
-            'lat': 0.0, 'lon': 20.0, 'weight': 0.6
-        },
-        '오세아니아': {
-            'countries': ['호주', '뉴질랜드'],
-            'lat': -25.0, 'lon': 140.0, 'weight': 0.7
-        }
-    }
-    
-    # 기후기술 분야 및 세부 기술
-    tech_data = {
-        '감축': ['태양광', '풍력', '전기차', '배터리', '수소', 'ESS'],
-        '적응': ['스마트팜', '물관리', '기후예측', '방재시스템'],
-        '융복합': ['스마트그리드', 'AI기후', '그린빌딩', '스마트시티']
-    }
-    
-    data = []
-    years = [2019, 2020, 2021, 2022]
-    
-    for year in years:
-        for region, region_info in regions_info.items():
-            for field, techs in tech_data.items():
-                for tech in techs:
-                    # 지역별 가중치와 기술별 인기도 반영
-                    popular_techs = ['태양광', '전기차', '스마트그리드', '배터리']
-                    tech_weight = 1.5 if tech in popular_techs else 1.0
-                    
-                    # 기본 진출 건수 (지역별, 기술별 차이)
-                    base_count = np.random.randint(5, 50)
-                    final_count = int(base_count * region_info['weight'] * tech_weight)
-                    
-                    # 연도별 증가 트렌드
-                    year_multiplier = 1 + (year - 2019) * 0.15
-                    final_count = int(final_count * year_multiplier)
-                    
-                    data.append({
-                        'year': year,
-                        'region': region,
-                        'field': field,
-                        'tech_name': tech,
-                        'export_count': final_count,
-                        'latitude': region_info['lat'],
-                        'longitude': region_info['lon'],
-                        'countries': ', '.join(region_info['countries'])
-                    })
-    
-    return pd.DataFrame(data)
+    """샘플 해외진출 데이터 (시드 고정 벡터화 생성, 한 번 만든 뒤 디스크에서 재사용)"""
+    return load_sample_dataset('overseas_data')
 
-def filter_overseas_data(df, year, field):
-    """해외진출 데이터 필터링"""
-    filtered_df = df[df['year'] == year].copy()
-    
-    if field != "전체":
-        filtered_df = filtered_df[filtered_df['field'] == field]
-    
-    return filtered_df
+@traced('filter')
+def filter_overseas_data(cube, year, field):
+    """해외진출 데이터 필터링 (연도 × 분야 × 지역 × 기술 큐브 자르기)"""
+    return slice_cube(cube, year=year, field=field)
 
 def create_arc_points(lat1, lon1, lat2, lon2, num_points=50):
     """두 점 사이의 아크(곡선) 포인트들을 생성"""
@@ -173,6 +108,7 @@ def create_arc_points(lat1, lon1, lat2, lon2, num_points=50):
     
     return points
 
+@traced('figure')
 def create_arc_flow_map(data):
     """한국에서 각 지역으로 아크형 플로우를 그리는 인터랙티브 지도"""
     if data.empty:
@@ -184,7 +120,7 @@ def create_arc_flow_map(data):
     korea_lat, korea_lon = 37.5665, 126.9780
     
     # 지역별 진출 건수 집계
-    region_summary = data.groupby(['region', 'latitude', 'longitude']).agg({
+    region_summary = data.groupby(['region', 'latitude', 'longitude'], observed=True).agg({
         'export_count': 'sum',
         'tech_name': 'count',
         'countries': 'first'
@@ -294,6 +230,7 @@ def create_arc_flow_map(data):
     
     return fig
 
+@traced('figure')
 def create_animated_flow_map(data):
     """애니메이션 효과가 있는 플로우 지도"""
     if data.empty:
@@ -303,7 +240,7 @@ def create_animated_flow_map(data):
     korea_lat, korea_lon = 37.5665, 126.9780
     
     # 지역별 데이터 준비
-    region_summary = data.groupby(['region', 'latitude', 'longitude']).agg({
+    region_summary = data.groupby(['region', 'latitude', 'longitude'], observed=True).agg({
         'export_count': 'sum',
         'tech_name': 'count',
         'countries': 'first'
@@ -404,6 +341,7 @@ def create_animated_flow_map(data):
     
     return fig
 
+@traced('figure')
 def create_3d_globe_flow(data):
     """3D 지구본 스타일 플로우 맵"""
     if data.empty:
@@ -413,7 +351,7 @@ def create_3d_globe_flow(data):
     korea_lat, korea_lon = 37.5665, 126.9780
     
     # 지역별 데이터
-    region_summary = data.groupby(['region', 'latitude', 'longitude']).agg({
+    region_summary = data.groupby(['region', 'latitude', 'longitude'], observed=True).agg({
         'export_count': 'sum',
         'tech_name': 'count',
         'countries': 'first'
@@ -483,12 +421,13 @@ def create_3d_globe_flow(data):
     
     return fig
 
+@traced('aggregate')
 def get_top7_data(data):
     """해외진출 Top 7 데이터"""
     if data.empty:
         return pd.DataFrame()
     
-    top7 = data.groupby(['region', 'tech_name']).agg({
+    top7 = data.groupby(['region', 'tech_name'], observed=True).agg({
         'export_count': 'sum'
     }).reset_index()
     
@@ -497,6 +436,7 @@ def get_top7_data(data):
     
     return top7
 
+@traced('figure')
 def create_region_chart(data, selected_region=None):
     """지역별 진출 현황 차트"""
     if data.empty:
@@ -505,7 +445,7 @@ def create_region_chart(data, selected_region=None):
                                         x=0.5, y=0.5, showarrow=False)
     
     # 지역별 집계
-    region_data = data.groupby(['region', 'field'])['export_count'].sum().reset_index()
+    region_data = data.groupby(['region', 'field'], observed=True)['export_count'].sum().reset_index()
     
     fig = px.bar(
         region_data,
@@ -541,6 +481,7 @@ def create_region_chart(data, selected_region=None):
     
     return fig
 
+@traced('figure')
 def create_tech_chart(data, selected_tech=None):
     """기술별 진출 현황 차트"""
     if data.empty:
@@ -548,7 +489,7 @@ def create_tech_chart(data, selected_tech=None):
                                         xref="paper", yref="paper", 
                                         x=0.5, y=0.5, showarrow=False)
     
-    tech_data = data.groupby(['tech_name', 'field'])['export_count'].sum().reset_index()
+    tech_data = data.groupby(['tech_name', 'field'], observed=True)['export_count'].sum().reset_index()
     tech_data = tech_data.sort_values('export_count', ascending=True)
     
     fig = px.bar(
@@ -582,6 +523,7 @@ def create_tech_chart(data, selected_tech=None):
     
     return fig
 
+@traced('figure')
 def create_flow_diagram(data):
     """진출 흐름도 (Sankey diagram)"""
     if data.empty:
@@ -590,7 +532,7 @@ def create_flow_diagram(data):
                                         x=0.5, y=0.5, showarrow=False)
     
     # 한국 -> 지역 -> 기술 흐름 데이터 준비
-    flows = data.groupby(['field', 'region', 'tech_name'])['export_count'].sum().reset_index()
+    flows = data.groupby(['field', 'region', 'tech_name'], observed=True)['export_count'].sum().reset_index()
     flows = flows.sort_values('export_count', ascending=False).head(20)  # 상위 20개만
     
     # 노드 레이블 생성
@@ -646,21 +588,25 @@ def create_flow_diagram(data):
     
     return fig
 
+@profiled_page('overseas')
+@traced_page('overseas')
 def main():
     st.title("🌏 기후기술 해외진출 현황")
     
-    # 데이터 로드
-    overseas_data = load_overseas_data()
+    # 데이터 로드 (ETL이 미리 집계한 지역·기술별/연도별 큐브)
+    cubes = load_overseas_cubes()
+    overseas_data = cubes['overseas_by_tech']
+    overseas_trend = cubes['overseas_by_year']
     
     # 사이드바 컨트롤
     st.sidebar.header("🔧 필터 설정")
     
     # 연도 선택
-    years = sorted(overseas_data['year'].unique(), reverse=True)
+    years = sorted(overseas_trend['year'].unique(), reverse=True)
     selected_year = st.sidebar.selectbox("연도", years)
     
     # 기술분야 선택
-    fields = ["전체"] + sorted(overseas_data['field'].unique().tolist())
+    fields = ["전체"] + sorted(overseas_trend['field'].unique().tolist())
     selected_field = st.sidebar.selectbox("기후기술 분야", fields)
     
     # 데이터 필터링
@@ -701,7 +647,7 @@ def main():
     with col4:
         # 최다 진출 지역
         if not filtered_data.empty:
-            top_region = filtered_data.groupby('region')['export_count'].sum().idxmax()
+            top_region = filtered_data.groupby('region', observed=True)['export_count'].sum().idxmax()
         else:
             top_region = "없음"
         
@@ -731,13 +677,13 @@ def main():
     # 지도 생성
     if map_type == "아크형 플로우":
         world_map = create_arc_flow_map(filtered_data)
-        st.plotly_chart(world_map, use_container_width=True)
+        plotly_chart(world_map, use_container_width=True, key='world_map')
     elif map_type == "애니메이션":
         world_map = create_animated_flow_map(filtered_data)
-        st.plotly_chart(world_map, use_container_width=True)
+        plotly_chart(world_map, use_container_width=True, key='world_map')
     elif map_type == "3D 지구본":
         world_map = create_3d_globe_flow(filtered_data)
-        st.plotly_chart(world_map, use_container_width=True)
+        plotly_chart(world_map, use_container_width=True, key='world_map')
     
     # 지도 설명 추가
     st.info("💡 **지도 사용법:** 마커를 클릭하면 상세 정보를 볼 수 있습니다. 선의 굵기와 색상은 진출 건수를 나타냅니다.")
@@ -749,7 +695,7 @@ def main():
         # 진출 흐름도
         st.subheader("🌊 진출 흐름도")
         flow_fig = create_flow_diagram(filtered_data)
-        st.plotly_chart(flow_fig, use_container_width=True)
+        plotly_chart(flow_fig, use_container_width=True, key='flow_fig')
     
     with col2:
         # 해외진출 Top 7
@@ -773,12 +719,12 @@ def main():
     with col1:
         st.subheader("🌍 지역별 진출 현황")
         region_fig = create_region_chart(filtered_data)
-        st.plotly_chart(region_fig, use_container_width=True)
+        plotly_chart(region_fig, use_container_width=True, key='region_fig')
     
     with col2:
         st.subheader("🔬 기술별 진출 현황")
         tech_fig = create_tech_chart(filtered_data)
-        st.plotly_chart(tech_fig, use_container_width=True)
+        plotly_chart(tech_fig, use_container_width=True, key='tech_fig')
     
     # 기술 종류별 색상 범례
     st.subheader("🎨 기술 분야 범례")
@@ -810,11 +756,11 @@ def main():
         """, unsafe_allow_html=True)
     
     # 연도별 트렌드 분석
-    if len(overseas_data['year'].unique()) > 1:
+    if len(overseas_trend['year'].unique()) > 1:
         st.subheader("📈 연도별 진출 트렌드")
         
-        # 연도별 진출 현황
-        yearly_trend = overseas_data.groupby(['year', 'field'])['export_count'].sum().reset_index()
+        # 연도별 진출 현황 (연도 × 분야 큐브)
+        yearly_trend = overseas_trend[['year', 'field', 'export_count']]
         
         trend_fig = px.line(
             yearly_trend,
@@ -843,18 +789,19 @@ def main():
             marker=dict(size=8)
         )
         
-        st.plotly_chart(trend_fig, use_container_width=True)
+        plotly_chart(trend_fig, use_container_width=True, key='trend_fig')
         
         # 성장률 분석
         st.subheader("📊 성장률 분석")
         
         # 최근 2년간 성장률 계산
-        recent_years = sorted(overseas_data['year'].unique())[-2:]
+        yearly_totals = overseas_trend.groupby('year')['export_count'].sum()
+        recent_years = sorted(yearly_totals.index)[-2:]
         if len(recent_years) >= 2:
             older_year, newer_year = recent_years[0], recent_years[1]
             
-            older_data = overseas_data[overseas_data['year'] == older_year]['export_count'].sum()
-            newer_data = overseas_data[overseas_data['year'] == newer_year]['export_count'].sum()
+            older_data = yearly_totals[older_year]
+            newer_data = yearly_totals[newer_year]
             
             if older_data > 0:
                 growth_rate = ((newer_data - older_data) / older_data) * 100
@@ -875,7 +822,7 @@ def main():
         st.subheader("📄 상세 데이터")
         
         # 상세 데이터 표시
-        detail_data = filtered_data.groupby(['region', 'tech_name', 'field']).agg({
+        detail_data = filtered_data.groupby(['region', 'tech_name', 'field'], observed=True).agg({
             'export_count': 'sum',
             'countries': 'first'
         }).reset_index()
@@ -921,7 +868,7 @@ def main():
         # 지역별 상세 분석
         st.subheader("🌍 지역별 상세 분석")
         
-        region_analysis = detail_data.groupby('region').agg({
+        region_analysis = detail_data.groupby('region', observed=True).agg({
             'export_count': ['sum', 'mean', 'count'],
             'tech_name': 'nunique'
         }).round(1)
@@ -946,9 +893,9 @@ def main():
     
     if not filtered_data.empty:
         # 인사이트 계산
-        top_region = filtered_data.groupby('region')['export_count'].sum().idxmax()
-        top_tech = filtered_data.groupby('tech_name')['export_count'].sum().idxmax()
-        top_field = filtered_data.groupby('field')['export_count'].sum().idxmax()
+        top_region = filtered_data.groupby('region', observed=True)['export_count'].sum().idxmax()
+        top_tech = filtered_data.groupby('tech_name', observed=True)['export_count'].sum().idxmax()
+        top_field = filtered_data.groupby('field', observed=True)['export_count'].sum().idxmax()
         
         col1, col2 = st.columns(2)
         
@@ -4,6 +4,17 @@ import plotly.express as px
 import plotly.graph_objects as go
 import numpy as np
 from pathlib import Path
+import sys
+import os
+
+# 상위 디렉토리 추가 (data 모듈 import용)
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data.aggregates import build_cube, dataset_cubes, slice_cube
+from data.data_loader import get_data_repository
+from data.sample_data import load_sample_dataset
+from utils.profiling import profiled_page
+from utils.tracing import plotly_chart, traced, traced_page
 
 # 페이지 설정
 st.set_page_config(page_title="특허 현황", page_icon="📋", layout="wide")
@@ -29,86 +40,36 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-@st.cache_data
+@traced('load')
 def load_patent_data():
     """특허 데이터 로드 또는 생성"""
     try:
-        data_path = Path('./assets/data/processed/patent_data.csv')
-        if data_path.exists():
-            return pd.read_csv(data_path)
-        else:
-            return create_sample_patent_data()
+        # 세션 간 공유 저장소 (게시된 스냅샷의 파일이 바뀔 때만 다시 읽음)
+        return get_data_repository().dataset('patent_data', default=create_sample_patent_data)
     except Exception as e:
         st.error(f"특허 데이터 로드 실패: {str(e)}")
         return create_sample_patent_data()
 
+@traced('load')
+def load_patent_cubes():
+    """특허 집계 큐브 로드 (ETL이 만든 큐브, 없으면 데이터셋으로 한 번 계산)"""
+    try:
+        return get_data_repository().cubes('patent_data', default=load_patent_data)
+    except Exception as e:
+        st.error(f"특허 집계 데이터 로드 실패: {str(e)}")
+        sample = create_sample_patent_data()
+        return {name: build_cube(name, sample) for name in dataset_cubes('patent_data')}
+
 def create_sample_patent_data():
-    """샘플 특허 데이터 생성"""
-    np.random.seed(42)
-    
-    # 기후기술 분야 및 세부 기술
-    tech_data = {
-        '감축': {
-            '재생에너지': ['태양광', '풍력', '수력', '지열', '바이오매스'],
-            '비재생에너지': ['원자력', 'CCUS', '청정석탄'],
-            '에너지효율': ['건물효율', '산업효율', 'LED조명'],
-            '수송': ['전기차', '수소차', '바이오연료'],
-            '에너지저장': ['배터리', '수소저장', '압축공기']
-        },
-        '적응': {
-            '물관리': ['홍수방어', '가뭄대응', '수자원관리'],
-            '농업': ['스마트팜', '기후적응작물', '정밀농업'],
-            '해양수산': ['해수면상승대응', '수산업적응'],
-            '생태계': ['생물다양성보전', '생태계복원'],
-            '건강': ['폭염대응', '감염병대응']
-        },
-        '융복합': {
-            'ICT융합': ['스마트그리드', 'AI기후예측', 'IoT모니터링'],
-            '바이오융합': ['바이오에너지', '바이오소재'],
-            '나노융합': ['나노태양전지', '나노필터']
-        }
-    }
-    
-    data = []
-    years = [2018, 2019, 2020, 2021]
-    
-    for year in years:
-        for field, categories in tech_data.items():
-            for category, techs in categories.items():
-                for tech in techs:
-                    # 연도별 특허 증가 트렌드 반영
-                    base_patents = np.random.randint(10, 200)
-                    year_multiplier = 1 + (year - 2018) * 0.1  # 연간 10% 증가
-                    
-                    # 분야별 가중치
-                    field_weights = {'감축': 1.5, '적응': 1.0, '융복합': 1.2}
-                    
-                    # 인기 기술 가중치
-                    popular_techs = ['태양광', '전기차', '스마트그리드', '배터리']
-                    tech_weight = 2.0 if tech in popular_techs else 1.0
-                    
-                    patent_count = int(base_patents * year_multiplier * field_weights[field] * tech_weight)
-                    
-                    data.append({
-                        'year': year,
-                        'field': field,
-                        'category': category,
-                        'tech_name': tech,
-                        'patent_count': patent_count,
-                        'cumulative_patents': patent_count * year  # 누적 특허 (단순화)
-                    })
-    
-    return pd.DataFrame(data)
+    """샘플 특허 데이터 (시드 고정 벡터화 생성, 한 번 만든 뒤 디스크에서 재사용)"""
+    return load_sample_dataset('patent_data')
 
-def filter_patent_data(df, year, field):
-    """특허 데이터 필터링"""
-    filtered_df = df[df['year'] == year].copy()
-    
-    if field != "전체":
-        filtered_df = filtered_df[filtered_df['field'] == field]
-    
-    return filtered_df
+@traced('filter')
+def filter_patent_data(cube, year, field):
+    """특허 데이터 필터링 (연도 × 분야 × 기술 큐브 자르기)"""
+    return slice_cube(cube, year=year, field=field)
 
+@traced('figure')
 def create_patent_bar_chart(data, top_n=15):
     """특허 건수 막대차트 생성"""
     if data.empty:
@@ -148,6 +109,7 @@ def create_patent_bar_chart(data, top_n=15):
     
     return fig
 
+@traced('figure')
 def create_field_comparison_chart(data):
     """분야별 특허 비교 차트"""
     if data.empty:
@@ -155,7 +117,7 @@ def create_field_comparison_chart(data):
                                         xref="paper", yref="paper", 
                                         x=0.5, y=0.5, showarrow=False)
     
-    field_summary = data.groupby('field')['patent_count'].sum().reset_index()
+    field_summary = data.groupby('field', observed=True)['patent_count'].sum().reset_index()
     
     fig = px.pie(
         field_summary,
@@ -182,14 +144,13 @@ def create_field_comparison_chart(data):
     
     return fig
 
-def create_yearly_trend_chart(all_data, selected_field):
-    """연도별 특허 트렌드 차트"""
+@traced('figure')
+def create_yearly_trend_chart(year_cube, selected_field):
+    """연도별 특허 트렌드 차트 (연도 × 분야 큐브)"""
+    trend_data = slice_cube(year_cube, field=selected_field).groupby('year')['patent_count'].sum().reset_index()
     if selected_field == "전체":
-        trend_data = all_data.groupby('year')['patent_count'].sum().reset_index()
         title = "전체 기후기술 연도별 특허 트렌드"
     else:
-        filtered_data = all_data[all_data['field'] == selected_field]
-        trend_data = filtered_data.groupby('year')['patent_count'].sum().reset_index()
         title = f"{selected_field} 기술 연도별 특허 트렌드"
     
     if trend_data.empty:
@@ -221,6 +182,7 @@ def create_yearly_trend_chart(all_data, selected_field):
     
     return fig
 
+@traced('figure')
 def create_category_heatmap(data):
     """카테고리별 히트맵"""
     if data.empty:
@@ -234,7 +196,8 @@ def create_category_heatmap(data):
         index='category', 
         columns='field', 
         aggfunc='sum', 
-        fill_value=0
+        fill_value=0,
+        observed=True
     )
     
     fig = px.imshow(
@@ -253,21 +216,25 @@ def create_category_heatmap(data):
     
     return fig
 
+@profiled_page('patents')
+@traced_page('patents')
 def main():
     st.title("📋 기후기술 특허 현황")
     
-    # 데이터 로드
-    patent_data = load_patent_data()
+    # 데이터 로드 (ETL이 미리 집계한 기술별/연도별 큐브)
+    cubes = load_patent_cubes()
+    patent_data = cubes['patent_by_tech']
+    patent_trend = cubes['patent_by_year']
     
     # 사이드바 컨트롤
     st.sidebar.header("🔧 필터 설정")
     
     # 연도 선택
-    years = sorted(patent_data['year'].unique(), reverse=True)
+    years = sorted(patent_trend['year'].unique(), reverse=True)
     selected_year = st.sidebar.selectbox("연도", years)
     
     # 기술분야 선택
-    fields = ["전체"] + sorted(patent_data['field'].unique().tolist())
+    fields = ["전체"] + sorted(patent_trend['field'].unique().tolist())
     selected_field = st.sidebar.selectbox("기후기술 분야", fields)
     
     # 표시할 기술 수
@@ -323,17 +290,17 @@ def main():
     with col1:
         st.subheader("📈 기술별 특허 등록 현황")
         bar_fig = create_patent_bar_chart(filtered_data, top_n)
-        st.plotly_chart(bar_fig, use_container_width=True)
+        plotly_chart(bar_fig, use_container_width=True, key='bar_fig')
     
     with col2:
         st.subheader("🎯 분야별 특허 비율")
         pie_fig = create_field_comparison_chart(filtered_data)
-        st.plotly_chart(pie_fig, use_container_width=True)
+        plotly_chart(pie_fig, use_container_width=True, key='pie_fig')
     
     # 트렌드 분석
     st.subheader("📊 연도별 특허 트렌드")
-    trend_fig = create_yearly_trend_chart(patent_data, selected_field)
-    st.plotly_chart(trend_fig, use_container_width=True)
+    trend_fig = create_yearly_trend_chart(patent_trend, selected_field)
+    plotly_chart(trend_fig, use_container_width=True, key='trend_fig')
     
     # 히트맵 및 상세 분석
     col1, col2 = st.columns(2)
@@ -341,7 +308,7 @@ def main():
     with col1:
         st.subheader("🔥 카테고리별 히트맵")
         heatmap_fig = create_category_heatmap(filtered_data)
-        st.plotly_chart(heatmap_fig, use_container_width=True)
+        plotly_chart(heatmap_fig, use_container_width=True, key='heatmap_fig')
     
     with col2:
         st.subheader("🏆 상위 10개 기술")
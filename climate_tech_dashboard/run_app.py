@@ -38,16 +38,10 @@ def setup_directories():
         Path(dir_path).mkdir(parents=True, exist_ok=True)
     print("✅ 디렉토리 구조가 준비되었습니다.")
 
-def run_data_collection():
-    """데이터 수집 자동 실행 (입력 없이)"""
-    print("📊 데이터 크롤링 시작 (자동 실행)...")
-    try:
-        from data.scraping import main as scraping_main
-        scraping_main()
-        print("✅ 데이터 수집 완료!")
-    except Exception as e:
-        print(f"⚠️ 데이터 수집 실패: {e}")
-        print("📋 샘플 데이터로 계속 진행합니다.")
+def request_startup_refresh():
+    """서버 프로세스에 시작 시 데이터 갱신 요청 (갱신 스케줄러는 서버 프로세스 하나만 가짐)"""
+    print("📊 앱이 뜨면 데이터 갱신을 백그라운드에서 시작합니다 (진행 상황: 데이터 관리 페이지)")
+    os.environ['DASHBOARD_REFRESH_ON_START'] = '1'
 
 def run_streamlit_app():
     """Streamlit 앱 실행"""
@@ -84,8 +78,8 @@ def main():
         return
 
     setup_directories()
-    run_data_collection()  # 👈 자동 실행으로 변경됨
-    
+    request_startup_refresh()
+    run_streamlit_app()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,72 @@
+import logging
+import os
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+# 상위 디렉토리 추가 (data, utils, pages 모듈 import용)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 매니페스트/캐시 등 데이터 폴더에 쓰는 파일은 임시 폴더로 (저장소 assets/data를 건드리지 않음)
+os.environ.setdefault('DASHBOARD_DATA_ROOT', tempfile.mkdtemp(prefix='dashboard-test-data-'))
+
+# 스크립트 실행 밖에서 페이지 모듈을 import할 때 나오는 Streamlit 경고 숨김
+logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+class StubServer:
+    """요청을 기록하고 respond(경로, 쿼리) → (상태, 헤더, 본문)으로 응답하는 로컬 HTTP 서버"""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                query = {key: values[0] for key, values in parse_qs(url.query).items()}
+                stub.requests.append({'path': url.path, 'query': query, 'headers': dict(self.headers)})
+                status, headers, body = stub.respond(url.path, query)
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self.server.server_port}'
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+@pytest.fixture
+def stub_server():
+    """StubServer 생성 함수 (테스트가 끝나면 닫음)"""
+    servers = []
+
+    def start(respond):
+        servers.append(StubServer(respond))
+        return servers[-1]
+
+    yield start
+    for server in servers:
+        server.close()
+
+@pytest.fixture
+def http_client(tmp_path):
+    """테스트용 HTTP 클라이언트 (재시도 없음, 캐시는 임시 폴더)"""
+    from data.http_client import HttpClient
+    client = HttpClient(cache_dir=tmp_path / 'http_cache', retries=0, timeout=5)
+    yield client
+    client.close()
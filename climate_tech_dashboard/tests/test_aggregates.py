@@ -0,0 +1,55 @@
+import importlib
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.aggregates import build_cube, dataset_cubes, slice_cube
+from data.data_loader import apply_dataset_schema
+
+# 레이더 성숙도 계산의 후반 단계가 있는 단계 목록 / 없는 단계 목록 (스키마 단계 이름)
+MATURE_STAGES = ['기초연구', '사업화준비', '시장진입', '시장확산', '성숙기']
+SCHEMA_STAGES = ['기술도입기', '기술개발기', '기술성장기', '기술성숙기', '기술쇠퇴기']
+
+def lifecycle_frame(tech_count, stages=MATURE_STAGES, years=(2020, 2021)):
+    """기술 수가 tech_count인 수명주기 데이터셋"""
+    rng = np.random.default_rng(0)
+    rows = [(year, '감축', f'기술{i:03d}', stage, order)
+            for year in years for i in range(tech_count) for order, stage in enumerate(stages, 1)]
+    df = pd.DataFrame(rows, columns=['year', 'field', 'tech_name', 'lifecycle_stage', 'stage_order'])
+    df['project_count'] = rng.integers(1, 50, len(df))
+    return apply_dataset_schema(df, 'lifecycle_data')
+
+@pytest.fixture(scope='module')
+def lifecycle_page():
+    return importlib.import_module('pages.lifecycle')
+
+def test_build_cube_keeps_totals():
+    df = lifecycle_frame(10)
+    cube = build_cube('lifecycle_by_stage', df)
+    assert cube['project_count'].sum() == df['project_count'].sum()
+    assert cube['rows'].sum() == len(df)
+    assert cube['lifecycle_stage'].dtype == 'category'
+
+def test_slice_cube_ignores_all_label():
+    cube = build_cube('lifecycle_by_tech', lifecycle_frame(3))
+    assert len(slice_cube(cube, year=None, field='전체')) == len(cube)
+    assert set(slice_cube(cube, year=2021)['year']) == {2021}
+
+@pytest.mark.parametrize('stages', [MATURE_STAGES, SCHEMA_STAGES])
+@pytest.mark.parametrize('tech_count', [20, 128, 300])
+def test_maturity_radar_with_many_techs(lifecycle_page, tech_count, stages):
+    # 범주가 127개를 넘으면 pandas가 코드 dtype을 int16으로 바꿈 (후반 단계가 없을 때 reindex 실패하던 경우)
+    df = lifecycle_frame(tech_count, stages)
+    cubes = {name: build_cube(name, df) for name in dataset_cubes('lifecycle_data')}
+    cube = cubes['lifecycle_by_tech']
+    assert cube['tech_name'].cat.categories.size == tech_count
+
+    fig = lifecycle_page.create_tech_maturity_radar(cube)
+
+    assert len(fig.data) == 1
+    scores = fig.data[0].r
+    assert len(scores) == 8
+    assert all(0 <= score <= 100 for score in scores)
+    if stages is SCHEMA_STAGES:
+        assert not any(scores)
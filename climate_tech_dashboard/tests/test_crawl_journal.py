@@ -0,0 +1,54 @@
+from data.crawl_journal import CrawlJournal
+
+URLS = ['https://example.test/a', 'https://example.test/b']
+
+def test_resume_skips_only_urls_done_in_interrupted_run(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = CrawlJournal(path)
+    run_id = journal.start_run()
+    journal.record_done(URLS[0], 'sha-a')
+    journal.record_failed(URLS[1], 'timeout')
+
+    # 실행이 완료되지 않은 채 프로세스 종료 → 다음 실행이 이어 받음
+    resumed = CrawlJournal(path)
+    assert resumed.interrupted_run() == run_id
+    assert resumed.start_run(resume=True) == run_id
+    assert resumed.is_fresh(URLS[0])
+    assert not resumed.is_fresh(URLS[1])
+    assert resumed.get(URLS[1])['status'] == 'failed'
+
+def test_finished_run_is_not_resumed(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = CrawlJournal(path)
+    journal.start_run()
+    journal.record_done(URLS[0], 'sha-a')
+    journal.finish_run()
+
+    next_run = CrawlJournal(path)
+    assert next_run.interrupted_run() is None
+    next_run.start_run(resume=True)
+    assert not next_run.is_fresh(URLS[0])
+    assert next_run.get(URLS[0])['sha256'] == 'sha-a'
+
+def test_restart_ignores_interrupted_run(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = CrawlJournal(path)
+    run_id = journal.start_run()
+    journal.record_done(URLS[0], 'sha-a')
+
+    restarted = CrawlJournal(path)
+    assert restarted.start_run(resume=False) != run_id
+    assert not restarted.is_fresh(URLS[0])
+
+def test_compact_keeps_latest_entries(tmp_path):
+    path = tmp_path / 'journal.jsonl'
+    journal = CrawlJournal(path)
+    run_id = journal.start_run()
+    for i in range(5):
+        journal.record_done(URLS[0], f'sha-{i}')
+
+    compacted = CrawlJournal(path)
+    assert len(path.read_text(encoding='utf-8').splitlines()) == 2
+    assert compacted.get(URLS[0])['sha256'] == 'sha-4'
+    assert compacted.interrupted_run() == run_id
+    assert compacted.summary(URLS) == {'done': 1, 'failed': 0, 'pending': 1}
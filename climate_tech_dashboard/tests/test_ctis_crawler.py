@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data.crawl_journal import CrawlJournal
+from data.ctis_crawler import CtisDetailCrawler
+from data.ctis_parser import parse_detail_page
+from data.scraping import HybridDataCollector
+
+FIXTURES = Path(__file__).resolve().parent.parent / 'benchmarks' / 'fixtures'
+DETAIL_HTML = (FIXTURES / 'ctis_detail.html').read_text(encoding='utf-8')
+CLASSIFICATION_HTML = (FIXTURES / 'ctis_classification.html').read_bytes()
+
+DETAIL = {
+    'definition': '태양의 빛에너지를 반도체 소자(태양전지)를 이용해 전기에너지로 직접 변환하는 기술',
+    'keywords_kor': '태양전지, 태양광 모듈, 페로브스카이트',
+    'keywords_eng': 'Solar cell, PV module, Perovskite',
+    'leading_country': '미국',
+    'tech_level_pct': '88.5',
+    'tech_gap': '1.5'
+}
+
+# 경로 → (Content-Type, 본문): 인코딩 선언 위치별 상세 페이지
+DETAIL_PAGES = {
+    '/utf8': ('text/html; charset=UTF-8', DETAIL_HTML.encode('utf-8')),
+    '/euckr-header': ('text/html;charset=EUC-KR',
+                      DETAIL_HTML.replace('charset="utf-8"', 'charset="euc-kr"').encode('cp949')),
+    '/euckr-meta': ('text/html', DETAIL_HTML.replace('charset="utf-8"', 'charset="euc-kr"').encode('cp949')),
+    '/euckr-undeclared': ('text/html', DETAIL_HTML.replace('<meta charset="utf-8">\n', '').encode('cp949'))
+}
+
+def detail_respond(path, query):
+    if path.startswith('/ko/techClass/classificationView.do'):
+        content_type, body = DETAIL_PAGES['/euckr-meta']
+    elif path.startswith('/ko/techClass/classification.do'):
+        content_type, body = 'text/html; charset=UTF-8', CLASSIFICATION_HTML
+    elif path in DETAIL_PAGES:
+        content_type, body = DETAIL_PAGES[path]
+    else:
+        return 404, {}, b''
+    return 200, {'Content-Type': content_type}, body
+
+def test_parse_detail_page_fixture():
+    assert parse_detail_page(DETAIL_HTML) == DETAIL
+
+@pytest.mark.parametrize('path', list(DETAIL_PAGES))
+def test_crawler_decodes_declared_or_sniffed_charset(stub_server, http_client, path):
+    server = stub_server(detail_respond)
+    crawler = CtisDetailCrawler(http_client, requests_per_second=0)
+
+    [(item, detail, response, error)] = crawler.crawl([{'detail_url': server.url + path}])
+
+    assert error is None
+    assert detail == DETAIL
+
+def test_crawler_records_failed_pages(stub_server, http_client):
+    server = stub_server(detail_respond)
+    crawler = CtisDetailCrawler(http_client, requests_per_second=0)
+    results = []
+
+    crawler.crawl([{'detail_url': server.url + '/utf8'}, {'detail_url': server.url + '/missing'}],
+                  on_result=lambda *result: results.append(result))
+
+    errors = {item['detail_url']: error for item, detail, response, error in results}
+    assert errors[server.url + '/utf8'] is None
+    assert '404' in errors[server.url + '/missing']
+
+def test_detail_urls_come_from_classification_links(stub_server, http_client, tmp_path, monkeypatch):
+    monkeypatch.delenv('CTIS_DETAIL_URL_TEMPLATE', raising=False)
+    server = stub_server(detail_respond)
+    collector = HybridDataCollector(ctis_url=server.url + '/ko/techClass/classification.do?key=1141',
+                                    http_client=http_client, journal=CrawlJournal(tmp_path / 'journal.jsonl'),
+                                    data_root=tmp_path)
+
+    assert collector.scrape_ctis_classification()
+    classification = pd.read_csv(collector.scraped_dir / 'climate_tech_classification.csv', encoding='utf-8-sig')
+    assert len(classification) == 45
+    assert classification['detail_url'].tolist() == [
+        f'{server.url}/ko/techClass/classificationView.do?key=1141&no={no}' for no in classification['No']]
+
+    assert collector.scrape_ctis_detailed_info()
+    detailed = pd.read_csv(collector.scraped_dir / 'climate_tech_detailed.csv', encoding='utf-8-sig')
+    assert len(detailed) == 45
+    assert (detailed['definition'] == DETAIL['definition']).all()
+
+def test_items_without_link_are_skipped_without_template(http_client, tmp_path, monkeypatch):
+    monkeypatch.delenv('CTIS_DETAIL_URL_TEMPLATE', raising=False)
+    collector = HybridDataCollector(ctis_url='https://ctis.test/classification.do', http_client=http_client,
+                                    journal=CrawlJournal(tmp_path / 'journal.jsonl'), data_root=tmp_path)
+    classification = pd.DataFrame({
+        'L1_대분류': ['감축', '감축'], 'L2_중분류': ['재생에너지', '재생에너지'], 'L3_소분류': ['태양광', '풍력'],
+        'No': [1, 2], 'detail_url': ['https://ctis.test/view.do?no=1', None]
+    })
+
+    assert [item['No'] for item in collector.detail_items(classification)] == [1]
+
+    monkeypatch.setattr(collector, 'detail_url_template', 'https://ctis.test/view.do?no={no}')
+    assert [item['detail_url'] for item in collector.detail_items(classification)] == [
+        'https://ctis.test/view.do?no=1', 'https://ctis.test/view.do?no=2']
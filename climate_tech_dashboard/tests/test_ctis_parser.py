@@ -0,0 +1,54 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from data import ctis_parser
+from data.ctis_parser import parse_classification_table
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+FIXTURE = PACKAGE_ROOT / 'benchmarks' / 'fixtures' / 'ctis_classification.html'
+EXPECTED_CSV = PACKAGE_ROOT / 'assets' / 'data' / 'scraped' / 'climate_tech_classification.csv'
+
+HTML = FIXTURE.read_text(encoding='utf-8')
+
+# 첫 소분류 뒤에 추가하는 행 (대분류/중분류 rowspan을 하나씩 늘림)
+NEW_ROW = '<tr><td class="bgw"><a href="/ko/techClass/classificationView.do?key=1141&amp;no=99">신규 기술</a></td></tr>'
+
+@pytest.fixture(params=['lxml', 'html.parser'])
+def backend(request, monkeypatch):
+    if request.param == 'html.parser':
+        monkeypatch.setattr(ctis_parser, 'lxml_html', None)
+    return request.param
+
+def insert_row(html):
+    html = html.replace('rowspan="22" class="bg1"', 'rowspan="23" class="bg1"', 1)
+    html = html.replace('rowspan="3" class="bg2">(1)비재생 에너지', 'rowspan="4" class="bg2">(1)비재생 에너지', 1)
+    first_row_end = html.index('</tr>', html.index('1. 원자력 발전')) + len('</tr>')
+    return html[:first_row_end] + NEW_ROW + html[first_row_end:]
+
+def test_fixture_matches_classification_csv(backend):
+    expected = pd.read_csv(EXPECTED_CSV, encoding='utf-8-sig')
+
+    records = parse_classification_table(HTML)
+
+    pd.testing.assert_frame_equal(pd.DataFrame(records)[expected.columns], expected)
+    assert records[0]['detail_href'] == '/ko/techClass/classificationView.do?key=1141&no=1'
+
+def test_bytes_with_meta_charset_parse_like_text(backend):
+    assert parse_classification_table(HTML.encode('utf-8')) == parse_classification_table(HTML)
+
+def test_inserted_row_keeps_following_classification(backend):
+    original = parse_classification_table(HTML)
+
+    records = parse_classification_table(insert_row(HTML))
+
+    assert len(records) == len(original) + 1
+    assert (records[1]['L1_대분류'], records[1]['L2_중분류'], records[1]['L3_소분류']) == \
+        ('감축', '(1)비재생 에너지', '신규 기술')
+    key = ('L1_대분류', 'L2_중분류', 'L3_소분류')
+    assert [[r[k] for k in key] for r in records[:1] + records[2:]] == [[r[k] for k in key] for r in original]
+
+def test_page_without_table_raises(backend):
+    with pytest.raises(ValueError):
+        parse_classification_table('<html><body><p>점검 중입니다</p></body></html>')
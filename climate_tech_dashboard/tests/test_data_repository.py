@@ -0,0 +1,71 @@
+import os
+
+import pandas as pd
+import pytest
+
+from data.data_loader import ARROW_CACHE_KEEP, DataRepository, apply_dataset_schema
+
+def write_patent_dataset(processed_dir, count):
+    df = pd.DataFrame({
+        'year': [2020, 2021],
+        'field': ['감축', '적응'],
+        'category': ['태양광', '물관리'],
+        'tech_name': ['태양광', '물관리'],
+        'patent_count': [count, count + 1],
+        'cumulative_patents': [10, 20]
+    })
+    processed_dir.mkdir(parents=True, exist_ok=True)
+    apply_dataset_schema(df, 'patent_data').to_csv(processed_dir / 'patent_data.csv', index=False)
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    import data.data_loader as data_loader
+    processed_dir = tmp_path / 'processed'
+    monkeypatch.setattr(data_loader, 'PROCESSED_DIR', processed_dir)
+    monkeypatch.setattr(data_loader, 'resolve_processed_dir', lambda snapshot_id=None: processed_dir)
+    write_patent_dataset(processed_dir, 1)
+    return DataRepository(tmp_path, mmap=True), processed_dir
+
+def test_returned_frames_are_read_only(repository):
+    repo, _ = repository
+    df = repo.dataset('patent_data')
+
+    with pytest.raises(ValueError):
+        df.loc[df['year'] == 2020, 'patent_count'] = 0
+    with pytest.raises(ValueError):
+        df.loc[0, 'field'] = '적응'
+
+    # 컬럼 추가/교체는 호출한 쪽 복사본에만 반영
+    df['share'] = df['patent_count'] / df['patent_count'].sum()
+    df['patent_count'] = df['patent_count'] * 10
+    again = repo.dataset('patent_data')
+    assert 'share' not in again.columns
+    assert again['patent_count'].tolist() == [1, 2]
+    assert again['field'].dtype == 'category'
+
+def test_repository_leaves_pandas_options_alone(repository):
+    repo, _ = repository
+    before = pd.get_option('mode.copy_on_write')
+    repo.dataset('patent_data')
+    assert pd.get_option('mode.copy_on_write') == before
+
+def test_arrow_cache_keeps_recent_versions(repository, tmp_path):
+    repo, processed_dir = repository
+    cache_dir = tmp_path / '.arrow_cache'
+
+    for count in range(ARROW_CACHE_KEEP + 3):
+        write_patent_dataset(processed_dir, 100 + count)
+        # 같은 크기·시각이면 변경을 못 알아채므로 수정 시각을 다르게
+        os.utime(processed_dir / 'patent_data.csv', ns=(count * 10 ** 9, count * 10 ** 9))
+        assert repo.dataset('patent_data')['patent_count'].iloc[0] == 100 + count
+
+    assert len(list(cache_dir.glob('patent_data.*.arrow'))) == ARROW_CACHE_KEEP
+
+def test_stored_none_is_recomputed_with_default(tmp_path, monkeypatch):
+    import data.data_loader as data_loader
+    monkeypatch.setattr(data_loader, 'resolve_processed_dir', lambda snapshot_id=None: tmp_path / 'missing')
+    repo = DataRepository(tmp_path)
+
+    assert repo.dataset('lifecycle_data') is None
+    sample = repo.dataset('lifecycle_data', default=lambda: pd.DataFrame({'year': [2020]}))
+    assert sample['year'].tolist() == [2020]
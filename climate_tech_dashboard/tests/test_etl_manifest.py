@@ -0,0 +1,77 @@
+import os
+
+import pytest
+
+from data.etl_manifest import EtlManifest
+
+@pytest.fixture
+def files(tmp_path):
+    raw = tmp_path / 'raw.csv'
+    processed = tmp_path / 'processed.csv'
+    raw.write_text('a,b\n1,2\n', encoding='utf-8')
+    processed.write_text('a\n3\n', encoding='utf-8')
+    return raw, processed
+
+def recorded_manifest(tmp_path, raw, processed):
+    manifest = EtlManifest(tmp_path / 'manifest.json')
+    assert manifest.record('dataset', manifest.snapshot_inputs([raw]), [processed])
+    manifest.save()
+    return EtlManifest(tmp_path / 'manifest.json')
+
+def test_unrecorded_dataset_is_not_up_to_date(tmp_path, files):
+    raw, processed = files
+    assert not EtlManifest(tmp_path / 'manifest.json').is_up_to_date('dataset', [raw], [processed])
+
+def test_recorded_dataset_is_skipped_until_input_changes(tmp_path, files):
+    raw, processed = files
+    manifest = recorded_manifest(tmp_path, raw, processed)
+    assert manifest.is_up_to_date('dataset', [raw], [processed])
+
+    raw.write_text('a,b\n1,3\n', encoding='utf-8')
+    assert not EtlManifest(tmp_path / 'manifest.json').is_up_to_date('dataset', [raw], [processed])
+
+def test_touched_file_with_same_content_is_up_to_date(tmp_path, files):
+    raw, processed = files
+    manifest = recorded_manifest(tmp_path, raw, processed)
+
+    stat = raw.stat()
+    os.utime(raw, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert manifest.is_up_to_date('dataset', [raw], [processed])
+
+def test_changed_or_missing_output_is_reprocessed(tmp_path, files):
+    raw, processed = files
+    manifest = recorded_manifest(tmp_path, raw, processed)
+
+    processed.write_text('a\n4\n', encoding='utf-8')
+    assert not manifest.is_up_to_date('dataset', [raw], [processed])
+
+    processed.unlink()
+    assert not manifest.is_up_to_date('dataset', [raw], [processed])
+
+def test_different_file_list_is_reprocessed(tmp_path, files):
+    raw, processed = files
+    manifest = recorded_manifest(tmp_path, raw, processed)
+    extra = tmp_path / 'extra.csv'
+
+    assert not manifest.is_up_to_date('dataset', [raw, extra], [processed])
+    assert not manifest.is_up_to_date('dataset', [raw], [processed, extra])
+
+def test_input_changed_during_processing_is_reprocessed(tmp_path, files):
+    raw, processed = files
+    manifest = EtlManifest(tmp_path / 'manifest.json')
+    inputs = manifest.snapshot_inputs([raw])
+
+    # 처리 중 입력이 바뀌면 처리 시작 전 지문이 기록됨 → 다음 실행에서 다시 처리
+    raw.write_text('a,b\n9,9\n', encoding='utf-8')
+    manifest.record('dataset', inputs, [processed])
+
+    assert not manifest.is_up_to_date('dataset', [raw], [processed])
+
+def test_record_without_outputs_forgets_dataset(tmp_path, files):
+    raw, processed = files
+    manifest = recorded_manifest(tmp_path, raw, processed)
+    processed.unlink()
+
+    assert not manifest.record('dataset', manifest.snapshot_inputs([raw]), [processed])
+    assert 'dataset' not in manifest.entries
@@ -0,0 +1,115 @@
+import json
+
+import pytest
+
+from data import kosis_api
+from data.data_loader import read_kosis_table
+from data.kosis_api import KosisApiClient, KosisApiError
+
+# 한 번에 응답하는 최대 연도 수 (넘으면 셀 수 제한 오류 31)
+MAX_YEARS = 2
+
+TECHS = [('감축', '태양광'), ('감축', '풍력'), ('적응', '물관리')]
+MEASURES = ['대기업', '중소기업']
+
+def kosis_value(tech, year, measure):
+    return str(TECHS.index(tech) * 10000 + year * 10 + MEASURES.index(measure))
+
+def kosis_records(start, end):
+    # 물관리는 2020년부터 (뒤 페이지에만 있는 행)
+    return [{
+        'C1_NM': field, 'C1_OBJ_NM': '기후기술분류별(1)',
+        'C2_NM': tech, 'C2_OBJ_NM': '기후기술분류별(2)',
+        'C3_NM': measure, 'ITM_NM': '매출액', 'PRD_DE': str(year),
+        'DT': kosis_value((field, tech), year, measure)
+    } for year in range(start, end + 1) for field, tech in TECHS for measure in MEASURES
+        if not (tech == '물관리' and year < 2020)]
+
+def kosis_respond(path, query):
+    start, end = int(query['startPrdDe']), int(query['endPrdDe'])
+    if query['tblId'] == 'EMPTY':
+        payload = {'err': '30', 'errMsg': '데이터가 존재하지 않습니다.'}
+    elif end - start + 1 > MAX_YEARS:
+        payload = {'err': '31', 'errMsg': '조회결과가 40,000셀을 초과하였습니다.'}
+    else:
+        payload = kosis_records(start, end)
+    return 200, {'Content-Type': 'application/json'}, json.dumps(payload, ensure_ascii=False).encode('utf-8')
+
+@pytest.fixture
+def kosis(stub_server, http_client):
+    server = stub_server(kosis_respond)
+    client = KosisApiClient(api_key='test-key', base_url=f'{server.url}/openapi', http_client=http_client,
+                            years_per_page=5)
+    return server, client
+
+def requested_windows(server):
+    return [(int(r['query']['startPrdDe']), int(r['query']['endPrdDe'])) for r in server.requests]
+
+def test_fetch_table_pages_and_halves_on_cell_limit(kosis):
+    server, client = kosis
+
+    raw_table = client.fetch_table('442', 'DT_TEST', 2016, 2022)
+
+    # 5년 페이지 → 오류 31이면 반으로 나눠 다시 요청 (앞쪽 기간부터)
+    assert requested_windows(server) == [
+        (2016, 2020), (2016, 2018), (2016, 2017), (2018, 2018), (2019, 2020),
+        (2021, 2022)
+    ]
+    assert all(r['query']['orgId'] == '442' and r['query']['apiKey'] == 'test-key' for r in server.requests)
+
+    years = raw_table.iloc[0, 2:].tolist()
+    assert raw_table.iloc[0, :2].tolist() == ['기후기술분류별(1)', '기후기술분류별(2)']
+    assert years == sorted(years) and len(years) == 7 * len(MEASURES)
+    assert raw_table.iloc[1, 2:4].tolist() == MEASURES
+    assert raw_table.iloc[2:, 1].tolist() == ['태양광', '풍력', '물관리']
+
+def test_fetch_table_round_trips_through_raw_reader(kosis, tmp_path):
+    _, client = kosis
+    raw_file = tmp_path / 'table.csv'
+    client.fetch_table('442', 'DT_TEST', 2018, 2021).to_csv(raw_file, header=False, index=False,
+                                                            encoding='utf-8-sig')
+
+    long_df = read_kosis_table(raw_file)
+
+    expected = {(f, t, y, m): float(kosis_value((f, t), y, m))
+                for r in kosis_records(2018, 2021)
+                for f, t, y, m in [(r['C1_NM'], r['C2_NM'], int(r['PRD_DE']), r['C3_NM'])]}
+    present = long_df.dropna(subset=['value'])
+    assert dict(zip(zip(present['field'], present['tech_name'], present['year'], present['measure']),
+                    present['value'])) == expected
+    # 2020년 전 물관리 셀은 결측 표시
+    assert long_df['value'].isna().sum() == 2 * len(MEASURES)
+
+def test_fetch_table_without_data(kosis):
+    _, client = kosis
+    assert client.fetch_table('442', 'EMPTY', 2016, 2022) is None
+
+def test_single_year_over_cell_limit_raises(kosis, monkeypatch):
+    _, client = kosis
+    monkeypatch.setitem(globals(), 'MAX_YEARS', 0)
+    with pytest.raises(KosisApiError) as excinfo:
+        client.fetch_table('442', 'DT_TEST', 2020, 2020)
+    assert excinfo.value.code == '31'
+
+def test_download_all_skips_unknown_table_ids(kosis, tmp_path, monkeypatch, capsys):
+    server, client = kosis
+    monkeypatch.setenv('KOSIS_TABLE_IDS', 'patent_data.csv=442/DT_PATENT')
+
+    results = client.download_all(tmp_path, start_year=2019, end_year=2020)
+
+    assert set(results) == {'institution_revenue.csv', 'patent_data.csv'}
+    assert {r['query']['tblId'] for r in server.requests} == {'DT_21_01', 'DT_PATENT'}
+    assert (tmp_path / 'patent_data.csv').exists()
+    assert not (tmp_path / 'lifecycle_data.csv').exists()
+    assert '통계표 ID가 없어 건너뜀' in capsys.readouterr().out
+
+def test_table_id_configuration(monkeypatch):
+    monkeypatch.setenv('KOSIS_TABLE_IDS', 'lifecycle_data.csv=101/DT_X, overseas_data.csv=102/DT_Y')
+    assert kosis_api.table_id('lifecycle_data.csv') == ('101', 'DT_X')
+    assert kosis_api.table_id('overseas_data.csv') == ('102', 'DT_Y')
+    assert kosis_api.table_id('patent_data.csv') is None
+    assert kosis_api.table_url('patent_data.csv') == kosis_api.KOSIS_LIST_URL
+
+    monkeypatch.setenv('KOSIS_TABLE_IDS', 'patent_data.csv=DT_ONLY')
+    with pytest.raises(ValueError):
+        kosis_api.table_id('patent_data.csv')
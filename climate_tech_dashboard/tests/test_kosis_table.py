@@ -0,0 +1,60 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data.data_loader import read_kosis_table, read_kosis_table_chunked, reshape_kosis_table
+
+HEADER = [
+    ['기후기술분류별(1)', '기후기술분류별(2)', '2020 년', '2020 년', '2021 년', '2021 년'],
+    ['기후기술분류별(1)', '기후기술분류별(2)', '500억원 이상  1000억 원 미만', '중소기업', '500억원 이상  1000억 원 미만', '중소기업']
+]
+BODY = [
+    ['합계', '합계', '100', '200', '300', '400'],
+    ['감축기술', '태양광', '1,234', '-', '5', 'X'],
+    ['감축기술', '소계', '50', '60', '70', '80'],
+    ['적응기술', ' 물관리 ', '7', '8', '9', '10']
+]
+LARGE = '500억 원 이상 1000억 원 미만'
+
+def raw_table(header=HEADER, body=BODY):
+    return pd.DataFrame(header + body)
+
+def test_reshape_wide_table_to_long_rows():
+    long_df = reshape_kosis_table(raw_table())
+
+    assert list(long_df.columns) == ['field', 'tech_name', 'year', 'measure', 'value']
+    assert long_df['year'].dtype == np.int64
+    assert set(long_df['tech_name']) == {'태양광', '물관리'}
+    assert len(long_df) == 8
+
+    solar = long_df[long_df['tech_name'] == '태양광'].set_index(['year', 'measure'])['value']
+    assert solar[(2020, LARGE)] == 1234
+    assert solar[(2021, LARGE)] == 5
+    # 결측/비공개 표시값은 NaN
+    assert solar[[(2020, '중소기업'), (2021, '중소기업')]].isna().all()
+
+def test_reshape_keeps_totals_when_asked():
+    long_df = reshape_kosis_table(raw_table(), drop_totals=False)
+
+    assert len(long_df) == len(BODY) * 4
+    assert set(long_df['tech_name']) == {'합계', '태양광', '소계', '물관리'}
+
+def test_reshape_names_extra_class_columns():
+    header = [['분류(1)', '분류(2)', '분류(3)', '2020'], ['분류(1)', '분류(2)', '분류(3)', '매출액']]
+    body = [['감축기술', '재생에너지', '태양광', '3']]
+
+    long_df = reshape_kosis_table(raw_table(header, body))
+
+    assert list(long_df.columns) == ['field', 'tech_name', 'class3', 'year', 'measure', 'value']
+    assert long_df.iloc[0][['class3', 'year', 'value']].tolist() == ['태양광', 2020, 3]
+
+@pytest.mark.parametrize('encoding', ['utf-8-sig', 'cp949'])
+def test_chunked_read_matches_whole_file(tmp_path, encoding):
+    path = tmp_path / 'table.csv'
+    raw_table().to_csv(path, header=False, index=False, encoding=encoding)
+
+    whole = read_kosis_table(path)
+    chunked = pd.concat(read_kosis_table_chunked(path, chunksize=1), ignore_index=True)
+
+    pd.testing.assert_frame_equal(chunked, whole)
+    pd.testing.assert_frame_equal(whole, reshape_kosis_table(raw_table()))
@@ -0,0 +1,113 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+from data import process_real_data
+from data.data_loader import resolve_processed_dir
+from data.etl_manifest import EtlManifest
+from data.kosis_api import long_to_raw_table
+from data.paths import PROCESSED_DIR, RAW_DIR
+from data.process_real_data import INSTITUTION_FILES, PIPELINES, RealDataProcessor
+from data.publish import get_snapshot_store
+
+TECHS = [('감축', '태양광'), ('감축', '풍력'), ('적응', '물관리'), ('융복합', '스마트그리드'), ('적응', '기상예측')]
+SCALES = ['대기업', '중소기업']
+YEARS = ['2019', '2020']
+
+def metric_value(metric_index, tech_index, scale_index, year):
+    return metric_index * 1000 + tech_index * 100 + scale_index * 10 + int(year) - 2019
+
+def write_raw_table(path, metric_index, tech_order):
+    long_df = pd.DataFrame([
+        {'field': f'{TECHS[t][0]}기술', 'tech_name': TECHS[t][1], 'year': year, 'measure': scale,
+         'value': str(metric_value(metric_index, t, s, year))}
+        for t in tech_order for year in YEARS for s, scale in enumerate(SCALES)
+    ])
+    raw = long_to_raw_table(long_df, ['기후기술분류별(1)', '기후기술분류별(2)'])
+    raw.to_csv(path, header=False, index=False, encoding='utf-8-sig')
+
+@pytest.fixture
+def raw_dir(tmp_path):
+    raw_dir = tmp_path / 'raw'
+    raw_dir.mkdir()
+    # 지표 파일마다 분류 행 순서가 다름 (같은 청크 번호에 다른 기술이 들어감)
+    orders = [[0, 1, 2, 3, 4], [4, 3, 2, 1, 0], [2, 0, 4, 1, 3], [1, 2, 3, 4, 0]]
+    for i, (filename, order) in enumerate(zip(INSTITUTION_FILES.values(), orders)):
+        write_raw_table(raw_dir / filename, i, order)
+    return raw_dir
+
+@pytest.mark.parametrize('chunksize', [None, 1, 2])
+def test_institution_metrics_join_on_keys_across_chunks(raw_dir, tmp_path, chunksize):
+    processed_dir = tmp_path / f'processed-{chunksize}'
+    processor = RealDataProcessor(raw_dir, processed_dir, chunksize=chunksize)
+
+    assert processor.process_institution_data()
+
+    df = pd.read_csv(processed_dir / 'institution_data.csv', encoding='utf-8-sig')
+    assert len(df) == len(TECHS) * len(SCALES) * len(YEARS)
+    assert not df.duplicated(['year', 'field', 'scale', 'tech_type']).any()
+    for t, (field, tech) in enumerate(TECHS):
+        for s, scale in enumerate(SCALES):
+            for year in YEARS:
+                row = df[(df['tech_type'] == tech) & (df['scale'] == scale) & (df['year'] == int(year))]
+                assert row['field'].tolist() == [field]
+                assert row[list(INSTITUTION_FILES)].iloc[0].tolist() == [
+                    metric_value(m, t, s, year) for m in range(len(INSTITUTION_FILES))
+                ]
+
+def test_institution_missing_metric_file_defaults_to_zero(raw_dir, tmp_path):
+    (raw_dir / INSTITUTION_FILES['rd_cost']).unlink()
+    processor = RealDataProcessor(raw_dir, tmp_path / 'processed', chunksize=2)
+
+    assert processor.process_institution_data()
+
+    df = pd.read_csv(tmp_path / 'processed' / 'institution_data.csv', encoding='utf-8-sig')
+    assert (df['rd_cost'] == 0).all()
+    assert (df['employees'] >= 1000).all()
+
+def test_incremental_run_skips_unchanged_pipelines(raw_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(process_real_data, 'PIPELINES', {'institution': PIPELINES['institution']})
+    calls = []
+    original = RealDataProcessor.process_institution_data
+    monkeypatch.setattr(RealDataProcessor, 'process_institution_data',
+                        lambda self: calls.append(1) or original(self))
+
+    def run():
+        processor = RealDataProcessor(raw_dir, tmp_path / 'processed')
+        processor.manifest = EtlManifest(tmp_path / 'manifest.json')
+        return processor.process_all_data(incremental=True, publish=False)
+
+    assert run() == ['institution']
+    assert run() == []
+    assert len(calls) == 1
+
+    # 입력 파일 하나가 바뀌면 다시 처리
+    write_raw_table(raw_dir / INSTITUTION_FILES['revenue'], 9, [0, 1, 2, 3, 4])
+    assert run() == ['institution']
+    assert len(calls) == 2
+
+@pytest.fixture
+def default_data_dirs():
+    """기본 데이터 폴더(DASHBOARD_DATA_ROOT)의 raw/processed/snapshots (테스트 후 정리)"""
+    yield RAW_DIR, PROCESSED_DIR
+    for path in (RAW_DIR, PROCESSED_DIR, get_snapshot_store().root):
+        shutil.rmtree(path, ignore_errors=True)
+
+def test_default_dirs_publish_to_store_pages_read(raw_dir, default_data_dirs, tmp_path, monkeypatch):
+    default_raw, default_processed = default_data_dirs
+    shutil.copytree(raw_dir, default_raw, dirs_exist_ok=True)
+    monkeypatch.setattr(process_real_data, 'PIPELINES', {'institution': PIPELINES['institution']})
+    # 실행 위치는 데이터 폴더와 무관
+    cwd = tmp_path / 'cwd'
+    cwd.mkdir()
+    monkeypatch.chdir(cwd)
+
+    processor = RealDataProcessor()
+    processor.manifest = EtlManifest(tmp_path / 'manifest.json')
+
+    assert processor.process_all_data() == ['institution']
+    assert processor.snapshots is get_snapshot_store()
+    assert (resolve_processed_dir() / 'institution_data.csv').exists()
+    assert (default_processed / 'institution_data.csv').exists()
+    assert not any(cwd.iterdir())
@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from utils import profiling
+
+def test_captures_in_same_second_get_distinct_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(profiling, 'PROFILE_DIR', tmp_path)
+    fixed = datetime(2026, 1, 1, 12, 0, 0)
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return fixed
+
+    monkeypatch.setattr(profiling, 'datetime', FrozenDatetime)
+
+    for _ in range(3):
+        assert profiling.capture('lifecycle', 'cprofile', sum, range(1000)) == sum(range(1000))
+
+    stems = {path.stem for path in tmp_path.iterdir()}
+    assert len(stems) == 3
+    assert all(stem.startswith('lifecycle-20260101-120000-') and stem.endswith('-cprofile') for stem in stems)
+    assert all(len(files) == 2 for files in profiling.saved_profiles().values())
@@ -0,0 +1,98 @@
+import os
+
+import pytest
+
+from data.publish import SnapshotStore
+
+@pytest.fixture
+def store(tmp_path):
+    return SnapshotStore(tmp_path / 'snapshots')
+
+@pytest.fixture
+def processed(tmp_path):
+    source = tmp_path / 'processed'
+    source.mkdir()
+    return source
+
+def write_version(source, version):
+    (source / 'institution_data.csv').write_text(f'year,revenue\n2020,{version}\n', encoding='utf-8')
+    (source / 'validation_report.json').write_text('{}', encoding='utf-8')
+
+def stored_objects(store):
+    return sorted(p.name for p in store.objects_dir.glob('*/*'))
+
+def test_publish_switches_current_and_dedupes_content(store, processed):
+    write_version(processed, 1)
+    first = store.publish(processed)
+
+    assert store.current_id() == first
+    assert (store.snapshot_dir() / 'institution_data.csv').read_text(encoding='utf-8').endswith('2020,1\n')
+    assert len(stored_objects(store)) == 2
+
+    # 같은 내용을 다시 게시하면 같은 스냅샷, 기록 추가 없음
+    assert store.publish(processed) == first
+    assert len(store.history()) == 1
+
+    # 바뀐 파일만 새 객체로 저장
+    write_version(processed, 2)
+    second = store.publish(processed)
+    assert second != first
+    assert store.current_id() == second
+    assert len(stored_objects(store)) == 3
+    assert (store.snapshot_dir(first) / 'institution_data.csv').read_text(encoding='utf-8').endswith('2020,1\n')
+
+def test_publish_skips_columnar_copy_older_than_csv(store, processed):
+    write_version(processed, 1)
+    parquet = processed / 'institution_data.parquet'
+    parquet.write_bytes(b'old parquet')
+    csv_mtime = (processed / 'institution_data.csv').stat().st_mtime_ns
+    os.utime(parquet, ns=(csv_mtime - 10 ** 9, csv_mtime - 10 ** 9))
+
+    snapshot_id = store.publish(processed)
+
+    assert sorted(p.name for p in store.snapshot_dir(snapshot_id).iterdir()) == [
+        'institution_data.csv', 'validation_report.json']
+
+def test_publish_without_files_keeps_current(store, processed):
+    assert store.publish(processed) is None
+    assert store.current_id() is None
+    assert store.snapshot_dir() is None
+
+def test_rollback_to_previous_and_named_snapshot(store, processed):
+    write_version(processed, 1)
+    first = store.publish(processed)
+    write_version(processed, 2)
+    second = store.publish(processed)
+
+    assert store.rollback() == first
+    assert store.current_id() == first
+    last = store.history()[-1]
+    assert (last['action'], last['snapshot'], last['from']) == ('rollback', first, second)
+
+    assert store.rollback(second) == second
+    assert store.rollback('missing') is None
+    assert store.current_id() == second
+
+def test_rollback_without_previous_snapshot(store, processed):
+    write_version(processed, 1)
+    store.publish(processed)
+
+    assert store.rollback() is None
+
+def test_prune_keeps_recent_snapshots_and_referenced_objects(store, processed):
+    published = []
+    for version in range(4):
+        write_version(processed, version)
+        published.append(store.publish(processed))
+
+    store.rollback(published[0])
+    store.prune(keep=2)
+
+    # 최근 게시/롤백 순 2개 (롤백한 첫 스냅샷 + 마지막 게시)
+    assert sorted(store.list_snapshots()) == sorted([published[0], published[3]])
+    assert store.current_id() == published[0]
+    assert store.snapshot_dir(published[1]) == store.root / published[0]
+    # 남은 스냅샷이 참조하는 객체만 유지 (CSV 2개 + 공통 보고서 1개)
+    assert len(stored_objects(store)) == 3
+    for snapshot_id in store.list_snapshots():
+        assert (store.snapshot_dir(snapshot_id) / 'institution_data.csv').exists()
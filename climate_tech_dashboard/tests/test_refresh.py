@@ -0,0 +1,90 @@
+import multiprocessing
+import os
+import shutil
+from pathlib import Path
+
+import pandas as pd
+
+from data.refresh import RefreshJobRegistry
+
+UPDATES_PER_PROCESS = 20
+
+def append_logs(jobs_path, lock_path, job_id, worker):
+    registry = RefreshJobRegistry(jobs_path, lock_path)
+    for i in range(UPDATES_PER_PROCESS):
+        registry.update(job_id, message=f'{worker}-{i}')
+
+def request_job(jobs_path, lock_path, results):
+    job, created = RefreshJobRegistry(jobs_path, lock_path).create_unless_active('full', 'manual')
+    results.put((job['id'], created))
+
+def refresh_and_read(results):
+    # 자식 프로세스에서 import하므로 부모가 지정한 DASHBOARD_DATA_ROOT와 실행 위치를 사용
+    from data.data_loader import get_data_repository, resolve_processed_dir
+    from data.publish import get_snapshot_store
+    from data.refresh import run_refresh_job
+
+    registry = RefreshJobRegistry()
+    run_refresh_job(registry.create('process', 'manual'), registry)
+
+    store = get_snapshot_store()
+    institution = get_data_repository().dataset('institution_data')
+    results.put((str(store.root), store.current_id(), str(resolve_processed_dir()), len(institution)))
+
+def run_processes(target, args_list):
+    ctx = multiprocessing.get_context('spawn')
+    processes = [ctx.Process(target=target, args=args) for args in args_list]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+def test_concurrent_updates_keep_every_log_line(tmp_path):
+    jobs_path, lock_path = tmp_path / 'jobs.json', tmp_path / 'refresh.lock'
+    job = RefreshJobRegistry(jobs_path, lock_path).create('full', 'manual')
+
+    run_processes(append_logs, [(jobs_path, lock_path, job['id'], worker) for worker in range(2)])
+
+    log = RefreshJobRegistry(jobs_path, lock_path).get(job['id'])['log']
+    # 로그는 최근 50줄만 보관 (2 × 20줄 = 40줄은 모두 남아야 함)
+    assert len(log) == 2 * UPDATES_PER_PROCESS
+    assert not (tmp_path / 'jobs.json.lock').exists()
+
+def test_concurrent_requests_create_one_job(tmp_path):
+    jobs_path, lock_path = tmp_path / 'jobs.json', tmp_path / 'refresh.lock'
+    results = multiprocessing.get_context('spawn').Queue()
+
+    run_processes(request_job, [(jobs_path, lock_path, results)] * 4)
+
+    outcomes = [results.get(timeout=5) for _ in range(4)]
+    assert len({job_id for job_id, _ in outcomes}) == 1
+    assert sum(created for _, created in outcomes) == 1
+    assert len(RefreshJobRegistry(jobs_path, lock_path).jobs()) == 1
+
+def test_stale_registry_lock_is_removed(tmp_path):
+    registry = RefreshJobRegistry(tmp_path / 'jobs.json', tmp_path / 'refresh.lock')
+    registry.registry_lock_path.write_text('12345')
+    old = registry.registry_lock_path.stat().st_mtime - 3600
+    os.utime(registry.registry_lock_path, (old, old))
+
+    job = registry.create('process', 'manual')
+    assert registry.get(job['id'])['status'] == 'queued'
+
+def test_refresh_publishes_where_pages_read(tmp_path, monkeypatch):
+    data_root, cwd = tmp_path / 'data', tmp_path / 'cwd'
+    shutil.copytree(Path(__file__).resolve().parent.parent / 'assets' / 'data' / 'raw', data_root / 'raw')
+    cwd.mkdir()
+    monkeypatch.setenv('DASHBOARD_DATA_ROOT', str(data_root))
+    monkeypatch.chdir(cwd)
+    results = multiprocessing.get_context('spawn').Queue()
+
+    run_processes(refresh_and_read, [(results,)])
+
+    store_root, snapshot_id, served_dir, rows = results.get(timeout=5)
+    assert store_root == str(data_root / 'snapshots')
+    assert snapshot_id is not None
+    assert served_dir == str(data_root / 'snapshots' / snapshot_id)
+    published = pd.read_csv(data_root / 'snapshots' / snapshot_id / 'institution_data.csv', encoding='utf-8-sig')
+    assert rows == len(published) > 0
+    assert not any(cwd.iterdir())
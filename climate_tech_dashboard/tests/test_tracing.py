@@ -0,0 +1,29 @@
+import importlib
+import json
+
+from utils import tracing
+
+def test_tracing_is_opt_in(monkeypatch):
+    monkeypatch.delenv('DASHBOARD_TRACING', raising=False)
+    assert importlib.reload(tracing).TRACING is False
+    monkeypatch.setenv('DASHBOARD_TRACING', '1')
+    assert importlib.reload(tracing).TRACING is True
+    monkeypatch.delenv('DASHBOARD_TRACING')
+    importlib.reload(tracing)
+
+def test_trace_log_keeps_capped_rotations(tmp_path, monkeypatch):
+    path = tmp_path / 'traces.jsonl'
+    monkeypatch.setattr(tracing, 'TRACE_PATH', path)
+    monkeypatch.setattr(tracing, 'TRACE_MAX_BYTES', 100)
+    monkeypatch.setattr(tracing, 'TRACE_BACKUPS', 2)
+
+    for i in range(20):
+        tracing.write_trace({'page': 'test', 'i': i, 'padding': 'x' * 40})
+
+    files = sorted(p.name for p in tmp_path.iterdir())
+    assert files == ['traces.jsonl', 'traces.jsonl.1', 'traces.jsonl.2']
+    # 가장 최근 기록은 현재 파일, 바로 이전 기록은 .1
+    newest = [json.loads(line)['i'] for line in path.read_text(encoding='utf-8').splitlines()]
+    previous = [json.loads(line)['i'] for line in (tmp_path / 'traces.jsonl.1').read_text(encoding='utf-8').splitlines()]
+    assert newest[-1] == 19
+    assert previous[-1] == newest[0] - 1
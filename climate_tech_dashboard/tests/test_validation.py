@@ -0,0 +1,91 @@
+import json
+
+import pandas as pd
+
+from data.validation import DatasetValidator, load_validation_report, update_validation_report, validate_dataset
+
+def institution_frame(**overrides):
+    df = pd.DataFrame({
+        'year': [2020, 2020, 2021],
+        'field': ['감축', '적응', '감축'],
+        'scale': ['대기업', '중소기업', '대기업'],
+        'tech_type': ['태양광', '물관리', '태양광'],
+        'revenue': [100.0, 50.0, 120.0],
+        'employees': [10.0, 5.0, 12.0],
+        'researchers': [2.0, 1.0, 3.0],
+        'rd_cost': [7.0, 3.0, 8.0]
+    })
+    for col, values in overrides.items():
+        df[col] = values
+    return df
+
+def violations(result):
+    return {(v['check'], v['column']): v for v in result['violations']}
+
+def test_valid_dataset_passes():
+    result = validate_dataset(institution_frame(), 'institution_data')
+
+    assert result['status'] == 'passed'
+    assert result['rows'] == 3
+    assert result['violations'] == []
+
+def test_contract_violations_are_counted_with_examples():
+    df = institution_frame(
+        year=[1999, 2020, 2021],
+        field=['감축', '기타분야', '감축'],
+        tech_type=['태양광', '소계', '풍력'],
+        revenue=[-1.0, 50.0, None],
+        employees=['10', 'n/a', '12']
+    ).drop(columns='rd_cost')
+
+    found = violations(validate_dataset(df, 'institution_data'))
+
+    assert found[('missing_column', 'rd_cost')]['count'] == 1
+    assert found[('year_range', 'year')]['examples'] == ['1999']
+    assert found[('category', 'field')]['examples'] == ['기타분야']
+    assert found[('total_label', 'tech_type')]['examples'] == ['소계']
+    assert found[('negative', 'revenue')]['count'] == 1
+    assert found[('null', 'revenue')]['count'] == 1
+    assert found[('dtype', 'employees')]['examples'] == ['n/a']
+
+def test_integer_columns_reject_fractions_and_overflow():
+    df = pd.DataFrame({
+        'year': [2020, 2021, 2022], 'field': ['감축'] * 3, 'category': ['a'] * 3, 'tech_name': ['x', 'y', 'z'],
+        'patent_count': [1, 2.5, 2 ** 40], 'cumulative_patents': [1, 3, 5]
+    })
+
+    found = violations(validate_dataset(df, 'patent_data'))
+
+    assert found[('dtype', 'patent_count')]['count'] == 2
+
+def test_duplicate_keys_are_found_across_chunks():
+    validator = DatasetValidator('institution_data')
+    df = institution_frame()
+    validator.check(df.iloc[:2])
+    validator.check(df.iloc[2:])
+    validator.check(df.iloc[:1])
+
+    result = validator.result()
+
+    assert result['rows'] == 4
+    assert violations(result)[('duplicate_key', 'year,field,scale,tech_type')]['count'] == 1
+    assert result['status'] == 'failed'
+
+def test_unknown_dataset_is_not_checked():
+    result = validate_dataset(pd.DataFrame({'a': [1]}), 'unknown_data')
+
+    assert result['status'] == 'passed'
+    assert result['rows'] == 0
+
+def test_report_keeps_previous_entry_when_result_is_unchanged(tmp_path):
+    first = validate_dataset(institution_frame(), 'institution_data')
+    update_validation_report(tmp_path, {'institution_data': first})
+
+    second = dict(first, validated_at='2099-01-01T00:00:00')
+    report = update_validation_report(tmp_path, {'institution_data': second})
+
+    assert report['institution_data']['validated_at'] == first['validated_at']
+    assert load_validation_report(tmp_path) == json.loads(json.dumps(report))
+
+def test_missing_report_is_empty(tmp_path):
+    assert load_validation_report(tmp_path / 'missing') == {}
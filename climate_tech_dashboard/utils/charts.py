@@ -153,7 +153,8 @@ def create_heatmap(data, x_col, y_col, values_col, title=""):
         index=y_col,
         columns=x_col,
         aggfunc='sum',
-        fill_value=0
+        fill_value=0,
+        observed=True
     )
     
     fig = px.imshow(
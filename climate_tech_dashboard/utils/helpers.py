@@ -10,24 +10,21 @@ import os
 import json
 from datetime import datetime, timedelta
 
-def load_data_with_cache(file_path, cache_key, create_sample_func=None):
-    """캐싱된 데이터 로드"""
-    @st.cache_data
-    def _load_data():
-        try:
-            if Path(file_path).exists():
-                return pd.read_csv(file_path)
-            elif create_sample_func:
-                return create_sample_func()
-            else:
-                return pd.DataFrame()
-        except Exception as e:
-            st.error(f"데이터 로드 실패: {str(e)}")
-            if create_sample_func:
-                return create_sample_func()
-            return pd.DataFrame()
-    
-    return _load_data()
+from data.data_loader import get_data_repository
+
+def load_data_with_cache(file_path, cache_key=None, create_sample_func=None):
+    """공유 저장소로 데이터 로드 (파일 경로별로 저장, 파일이 바뀔 때만 다시 읽음)
+
+    cache_key는 이전 호출 방식 호환용 (경로로 구분하므로 사용하지 않음)
+    """
+    try:
+        df = get_data_repository().csv(file_path, default=create_sample_func)
+        return df if df is not None else pd.DataFrame()
+    except Exception as e:
+        st.error(f"데이터 로드 실패: {str(e)}")
+        if create_sample_func:
+            return create_sample_func()
+        return pd.DataFrame()
 
 def safe_divide(numerator, denominator):
     """안전한 나눗셈"""
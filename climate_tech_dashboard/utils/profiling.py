@@ -0,0 +1,263 @@
+"""
+요청 시 재실행 프로파일링
+
+느린 페이지의 재실행 한 번을 프로파일러로 감싸 결과를 profiles/에 저장하고 사이드바에서 내려받습니다.
+- 켜는 방법: 페이지 URL에 ?profile=1 (또는 ?profile=sample / ?profile=cprofile),
+  또는 데이터 관리 페이지 '⚙️ 시스템 정보'에서 다음 페이지 재실행 프로파일링 예약
+- 요청은 재실행 한 번에만 적용 (쿼리 파라미터는 캡처 후 제거)
+- 요청이 없으면 프로파일러를 만들지 않고 main()을 그대로 실행 (쿼리 파라미터/세션 상태 조회만 함)
+
+프로파일러:
+- sample: 스크립트 스레드의 호출 스택을 주기적으로 기록 → 호출 트리(.txt) + folded 스택(.folded,
+  flamegraph.pl · speedscope에서 플레임 그래프로 열기). 측정 대상을 거의 느리게 하지 않음
+- cprofile: 모든 함수 호출 기록 → pstats 파일(.prof, snakeviz로 열기) + 누적 시간 순 호출 관계(.txt)
+
+DASHBOARD_PROFILE_DIR로 저장 폴더를 바꿀 수 있습니다.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+import streamlit as st
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+PROFILE_DIR = Path(os.environ.get('DASHBOARD_PROFILE_DIR', PACKAGE_ROOT / 'profiles'))
+
+QUERY_PARAM = 'profile'
+DEFAULT_PROFILER = 'sample'
+
+# 샘플링 간격 (초)
+SAMPLE_INTERVAL = 0.005
+
+# 호출 트리에 표시할 최소 비율 (전체 샘플 대비)
+CALL_TREE_MIN_SHARE = 0.005
+
+# cProfile 요약에 표시할 함수 수
+PSTATS_LIMIT = 60
+
+# 세션 상태 키: 관리 페이지에서 예약한 프로파일러, 마지막 캡처 결과
+REQUEST_KEY = 'profile_request'
+LAST_CAPTURE_KEY = 'profile_last_capture'
+
+# 저장 파일 확장자 → 내려받기 MIME
+FILE_MIMES = {
+    '.txt': 'text/plain',
+    '.folded': 'text/plain',
+    '.prof': 'application/octet-stream'
+}
+
+def frame_label(code):
+    """folded 스택 프레임 이름 (함수 (파일:첫 줄))"""
+    path = Path(code.co_filename)
+    try:
+        filename = path.relative_to(PACKAGE_ROOT).as_posix()
+    except ValueError:
+        parts = path.parts
+        filename = '/'.join(parts[parts.index('site-packages') + 1:]) if 'site-packages' in parts else path.name
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(';', ',')
+
+def call_tree_lines(counts, total):
+    """folded 스택 → 들여쓴 호출 트리 (비율, 샘플 수)"""
+    tree = {}
+    for stack, count in counts.items():
+        node = tree
+        for frame in stack:
+            entry = node.setdefault(frame, [0, {}])
+            entry[0] += count
+            node = entry[1]
+
+    lines = []
+
+    def walk(node, depth):
+        for frame, (count, children) in sorted(node.items(), key=lambda item: -item[1][0]):
+            if count / total < CALL_TREE_MIN_SHARE:
+                continue
+            lines.append(f"{count / total * 100:6.1f}% {count:6d}  {'  ' * depth}{frame}")
+            walk(children, depth + 1)
+
+    walk(tree, 0)
+    return lines
+
+class SamplingProfiler:
+    """스크립트 스레드 호출 스택 샘플링 (sys._current_frames)
+
+    GIL을 오래 잡는 C 확장 호출 중에는 샘플링 스레드도 기다리므로 그 시간은 호출이 끝난 뒤의 샘플로 잡힘
+    """
+
+    label = '샘플링'
+
+    def __init__(self, interval=SAMPLE_INTERVAL):
+        self.interval = interval
+        self.counts = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+
+    def start(self):
+        self._thread_id = threading.get_ident()
+        # 호출한 쪽(capture) 프레임 위의 스택만 기록 (Streamlit 실행기 프레임 제외)
+        self._root = sys._getframe(1)
+        self._sampler = threading.Thread(target=self._run, name='profile-sampler', daemon=True)
+        self._sampler.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None and frame is not self._root:
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            if stack:
+                self.counts[tuple(reversed(stack))] += 1
+                self.samples += 1
+
+    def stop(self):
+        self._stop.set()
+        self._sampler.join()
+
+    def save(self, base_path, header):
+        """호출 트리(.txt)와 folded 스택(.folded) 저장 → 경로 목록"""
+        folded_path = base_path.with_suffix('.folded')
+        with open(folded_path, 'w', encoding='utf-8') as f:
+            for stack, count in self.counts.most_common():
+                f.write(f"{';'.join(stack)} {count}\n")
+
+        text_path = base_path.with_suffix('.txt')
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write(header)
+            f.write(f"샘플 {self.samples}개 (간격 {self.interval * 1000:g}ms)\n\n")
+            f.write("  비율   샘플  호출 트리\n")
+            if self.samples:
+                f.write('\n'.join(call_tree_lines(self.counts, self.samples)) + '\n')
+        return [text_path, folded_path]
+
+class DeterministicProfiler:
+    """cProfile 함수 호출 기록 (스크립트 스레드만)"""
+
+    label = '결정적 (cProfile)'
+
+    def start(self):
+        self._profile = cProfile.Profile()
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+
+    def save(self, base_path, header):
+        """pstats 파일(.prof)과 누적 시간 순 요약/호출 관계(.txt) 저장 → 경로 목록"""
+        prof_path = base_path.with_suffix('.prof')
+        self._profile.dump_stats(str(prof_path))
+
+        buffer = io.StringIO()
+        stats = pstats.Stats(self._profile, stream=buffer).sort_stats('cumulative')
+        stats.print_stats(PSTATS_LIMIT)
+        stats.print_callees(PSTATS_LIMIT // 2)
+
+        text_path = base_path.with_suffix('.txt')
+        with open(text_path, 'w', encoding='utf-8') as f:
+            f.write(header + '\n')
+            f.write(buffer.getvalue())
+        return [text_path, prof_path]
+
+# 프로파일러 이름 → 클래스
+PROFILERS = {
+    'sample': SamplingProfiler,
+    'cprofile': DeterministicProfiler
+}
+
+def request_profile(profiler=DEFAULT_PROFILER):
+    """다음 페이지 재실행 프로파일링 예약 (관리 페이지)"""
+    st.session_state[REQUEST_KEY] = profiler
+
+def requested_profiler():
+    """이번 재실행에 요청된 프로파일러 이름 (없으면 None, 요청은 한 번 쓰면 제거)"""
+    value = st.query_params.get(QUERY_PARAM)
+    if value is not None:
+        del st.query_params[QUERY_PARAM]
+        if value.lower() in ('0', 'false', 'off'):
+            return None
+        return value if value in PROFILERS else DEFAULT_PROFILER
+    return st.session_state.pop(REQUEST_KEY, None)
+
+def capture(page, profiler_name, func, *args, **kwargs):
+    """재실행 한 번을 프로파일러로 감싸 실행하고 결과 파일 저장 (st.stop() 등 예외도 저장 후 전달)"""
+    profiler = PROFILERS[profiler_name]()
+    started_at = datetime.now()
+    start = time.perf_counter()
+    profiler.start()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.stop()
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        # 같은 초에 여러 세션/프로세스가 캡처해도 겹치지 않게 마이크로초 + 임의 접미사
+        base_path = PROFILE_DIR / f'{page}-{started_at:%Y%m%d-%H%M%S-%f}-{uuid.uuid4().hex[:6]}-{profiler_name}'
+        header = (f"페이지: {page}\n프로파일러: {profiler.label}\n"
+                  f"시각: {started_at:%Y-%m-%d %H:%M:%S}\n재실행 시간: {elapsed_ms:,.1f}ms\n")
+        try:
+            PROFILE_DIR.mkdir(parents=True, exist_ok=True)
+            files = profiler.save(base_path, header)
+            st.session_state[LAST_CAPTURE_KEY] = {
+                'page': page,
+                'profiler': profiler_name,
+                'created_at': started_at.isoformat(),
+                'elapsed_ms': round(elapsed_ms, 1),
+                'files': [str(path) for path in files]
+            }
+        except OSError as e:
+            st.sidebar.error(f"프로파일 저장 실패: {str(e)}")
+
+def download_buttons(files, key_prefix):
+    """프로파일 파일 내려받기 버튼"""
+    for path in map(Path, files):
+        if path.exists():
+            st.download_button(f"📥 {path.name}", data=path.read_bytes(), file_name=path.name,
+                               mime=FILE_MIMES.get(path.suffix, 'application/octet-stream'),
+                               key=f'{key_prefix}_{path.name}')
+
+def show_last_capture(page):
+    """이 페이지에서 캡처한 프로파일이 있으면 사이드바에 내려받기 표시"""
+    last = st.session_state.get(LAST_CAPTURE_KEY)
+    if not last or last['page'] != page:
+        return
+    with st.sidebar.expander("🔬 프로파일", expanded=True):
+        st.caption(f"{PROFILERS[last['profiler']].label} · 재실행 {last['elapsed_ms']:,.0f}ms · "
+                   f"{last['created_at'][:19].replace('T', ' ')}")
+        download_buttons(last['files'], 'profile_download')
+        if st.button("닫기", key='profile_close'):
+            st.session_state.pop(LAST_CAPTURE_KEY, None)
+            st.rerun()
+
+def saved_profiles(limit=20):
+    """저장된 프로파일 {캡처 이름: 파일 목록} (최근 순)"""
+    if not PROFILE_DIR.exists():
+        return {}
+    groups = {}
+    for path in sorted(PROFILE_DIR.iterdir(), key=lambda p: p.stat().st_mtime, reverse=True):
+        if path.suffix in FILE_MIMES:
+            groups.setdefault(path.stem, []).append(path)
+    return dict(list(groups.items())[:limit])
+
+def profiled_page(page):
+    """요청이 있을 때만 페이지 main() 재실행을 프로파일링하는 데코레이터"""
+    def decorator(main):
+        @functools.wraps(main)
+        def wrapper(*args, **kwargs):
+            profiler_name = requested_profiler()
+            if profiler_name is None:
+                result = main(*args, **kwargs)
+            else:
+                result = capture(page, profiler_name, main, *args, **kwargs)
+            show_last_capture(page)
+            return result
+        return wrapper
+    return decorator
@@ -0,0 +1,266 @@
+"""
+재실행 구간 추적
+
+페이지 스크립트 한 번 실행(재실행) 동안 데이터 로드, 필터, 집계, 차트 생성, 차트 전송 구간의 시간을 기록합니다.
+- @traced_page(이름): 페이지 main()을 재실행 단위로 감싸 기록하고 logs/traces.jsonl에 재실행당 한 줄로 저장
+- @traced(종류) / trace_span(종류, 이름): 함수/코드 블록 구간 기록 (재실행 밖에서 호출하면 그대로 실행)
+- plotly_chart: st.plotly_chart 구간 기록 (대부분 Figure JSON 직렬화 시간)
+- 사이드바 '⏱️ 성능 패널'에서 이번 재실행의 느린 구간과 종류별 합계 확인
+
+기본은 꺼져 있고 DASHBOARD_TRACING=1로 켭니다 (꺼져 있으면 데코레이터가 함수를 그대로 반환).
+DASHBOARD_TRACE_FILE로 JSONL 경로를 바꿀 수 있고, 기록 파일은 크기 제한을 넘으면
+traces.jsonl.1 ~ .N으로 돌려 가며 최근 TRACE_BACKUPS개만 남깁니다.
+"""
+
+import functools
+import json
+import os
+import statistics
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+import streamlit as st
+
+PACKAGE_ROOT = Path(__file__).resolve().parent.parent
+
+TRACING = os.environ.get('DASHBOARD_TRACING', '0') == '1'
+TRACE_PATH = Path(os.environ.get('DASHBOARD_TRACE_FILE', PACKAGE_ROOT / 'logs' / 'traces.jsonl'))
+
+# 기록 파일이 이 크기를 넘으면 traces.jsonl.1로 넘기고 새로 시작
+TRACE_MAX_BYTES = 20 * 1024 ** 2
+
+# 남겨 둘 이전 기록 파일 수 (traces.jsonl.1 ~ .N, 디스크 사용량 최대 (N + 1) × TRACE_MAX_BYTES)
+TRACE_BACKUPS = 3
+
+# 세션별로 보관하는 최근 재실행 수 (성능 패널 추이)
+HISTORY_SIZE = 30
+
+# 성능 패널에 표시할 느린 구간 수
+PANEL_TOP_N = 10
+
+HISTORY_KEY = 'trace_history'
+
+# 구간 종류 → 표시 이름
+SPAN_KINDS = {
+    'load': '데이터 로드',
+    'filter': '필터',
+    'aggregate': '집계',
+    'figure': '차트 생성',
+    'render': '차트 전송 (직렬화)'
+}
+
+# 스크립트 스레드별 진행 중인 재실행 (Streamlit은 세션마다 스크립트를 별도 스레드에서 실행)
+_local = threading.local()
+_write_lock = threading.Lock()
+
+def result_rows(result):
+    """구간 결과 행 수 (DataFrame 또는 DataFrame 묶음, 아니면 None)"""
+    if isinstance(result, pd.DataFrame):
+        return len(result)
+    if isinstance(result, dict) and result and all(isinstance(v, pd.DataFrame) for v in result.values()):
+        return sum(len(v) for v in result.values())
+    return None
+
+class RerunTrace:
+    """재실행 한 번의 구간 기록"""
+
+    def __init__(self, page):
+        self.page = page
+        self.started_at = datetime.now()
+        self.start = time.perf_counter()
+        self.spans = []
+        self.total_ms = None
+        self.status = 'ok'
+        # 진행 중인 구간별 하위 구간 시간 합계 (자체 시간 계산용)
+        self._children_ms = []
+
+    def begin(self):
+        self._children_ms.append(0.0)
+        return time.perf_counter()
+
+    def end(self, kind, name, begin, rows=None):
+        elapsed = (time.perf_counter() - begin) * 1000
+        children_ms = self._children_ms.pop()
+        if self._children_ms:
+            self._children_ms[-1] += elapsed
+        self.spans.append({
+            'name': name,
+            'kind': kind,
+            'start_ms': round((begin - self.start) * 1000, 3),
+            'ms': round(elapsed, 3),
+            'self_ms': round(elapsed - children_ms, 3),
+            'depth': len(self._children_ms),
+            'rows': rows
+        })
+
+    def finish(self):
+        self.total_ms = (time.perf_counter() - self.start) * 1000
+
+    def kind_totals(self):
+        """종류별 자체 시간 합계 (ms, 하위 구간을 빼서 종류끼리 겹치지 않음)"""
+        totals = dict.fromkeys(SPAN_KINDS, 0.0)
+        for span in self.spans:
+            totals[span['kind']] = totals.get(span['kind'], 0.0) + span['self_ms']
+        return totals
+
+    def to_dict(self):
+        return {
+            'timestamp': self.started_at.isoformat(),
+            'page': self.page,
+            'session': session_id(),
+            'status': self.status,
+            'total_ms': round(self.total_ms, 3),
+            'kinds': {kind: round(ms, 3) for kind, ms in self.kind_totals().items()},
+            'spans': sorted(self.spans, key=lambda span: span['start_ms'])
+        }
+
+def current_trace():
+    """이 스레드에서 진행 중인 재실행 기록 (없으면 None)"""
+    return getattr(_local, 'trace', None)
+
+def session_id():
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        return ctx.session_id if ctx else None
+    except Exception:
+        return None
+
+@contextmanager
+def trace_span(kind, name):
+    """코드 블록 구간 기록"""
+    trace = current_trace()
+    if trace is None:
+        yield
+        return
+    begin = trace.begin()
+    try:
+        yield
+    finally:
+        trace.end(kind, name, begin)
+
+def traced(kind, name=None):
+    """함수 구간 기록 데코레이터 (결과가 DataFrame이면 행 수도 기록)"""
+    def decorator(func):
+        if not TRACING:
+            return func
+        span_name = name or func.__name__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            trace = current_trace()
+            if trace is None:
+                return func(*args, **kwargs)
+            begin = trace.begin()
+            result = None
+            try:
+                result = func(*args, **kwargs)
+                return result
+            finally:
+                trace.end(kind, span_name, begin, rows=result_rows(result))
+        return wrapper
+    return decorator
+
+def plotly_chart(figure, key, **kwargs):
+    """st.plotly_chart + 구간 기록 (구간 이름은 key)"""
+    with trace_span('render', key):
+        return st.plotly_chart(figure, key=key, **kwargs)
+
+def rotate_traces(path, backups):
+    """기록 파일 돌리기 (.N-1 → .N, ..., 현재 → .1, 가장 오래된 .N은 덮어써 삭제)"""
+    backup_paths = [path.with_name(f'{path.name}.{i}') for i in range(1, backups + 1)]
+    for older, newer in reversed(list(zip(backup_paths[1:], backup_paths))):
+        if newer.exists():
+            os.replace(newer, older)
+    if backup_paths:
+        os.replace(path, backup_paths[0])
+    else:
+        path.unlink()
+
+def write_trace(record):
+    """재실행 기록을 JSONL 한 줄로 추가 (기록 실패는 화면에 영향 없음)"""
+    line = json.dumps(record, ensure_ascii=False, default=str)
+    with _write_lock:
+        try:
+            TRACE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            if TRACE_PATH.exists() and TRACE_PATH.stat().st_size > TRACE_MAX_BYTES:
+                rotate_traces(TRACE_PATH, TRACE_BACKUPS)
+            with open(TRACE_PATH, 'a', encoding='utf-8') as f:
+                f.write(f"{line}\n")
+        except OSError:
+            pass
+
+def remember(record):
+    """세션의 최근 재실행 요약 보관 (성능 패널 추이)"""
+    history = st.session_state.setdefault(HISTORY_KEY, [])
+    history.append({'page': record['page'], 'total_ms': record['total_ms'], **record['kinds']})
+    del history[:-HISTORY_SIZE]
+
+def show_panel(trace):
+    """사이드바 성능 패널 (이번 재실행의 종류별 합계와 느린 구간, 최근 추이)"""
+    st.sidebar.markdown("---")
+    if not st.sidebar.checkbox("⏱️ 성능 패널", key='trace_panel'):
+        return
+
+    history = [h for h in st.session_state.get(HISTORY_KEY, []) if h['page'] == trace.page]
+    previous = history[-2]['total_ms'] if len(history) > 1 else None
+    st.sidebar.metric("이번 재실행", f"{trace.total_ms:,.0f}ms",
+                      delta=f"{trace.total_ms - previous:+,.0f}ms" if previous is not None else None,
+                      delta_color="inverse")
+
+    totals = trace.kind_totals()
+    rows = [(SPAN_KINDS.get(kind, kind), ms) for kind, ms in totals.items()]
+    rows.append(("기타 (Streamlit 요소 등)", max(trace.total_ms - sum(totals.values()), 0)))
+    kinds = pd.DataFrame(rows, columns=['구간', '시간(ms)'])
+    kinds['비율(%)'] = kinds['시간(ms)'] / trace.total_ms * 100 if trace.total_ms else 0
+    st.sidebar.dataframe(kinds.round(1), hide_index=True, use_container_width=True)
+
+    slowest = sorted(trace.spans, key=lambda span: span['ms'], reverse=True)[:PANEL_TOP_N]
+    if slowest:
+        st.sidebar.markdown("**🐢 느린 구간**")
+        spans = pd.DataFrame([{
+            '구간': span['name'],
+            '종류': SPAN_KINDS.get(span['kind'], span['kind']),
+            '시간(ms)': round(span['ms'], 1),
+            '자체(ms)': round(span['self_ms'], 1),
+            '행 수': span['rows']
+        } for span in slowest])
+        spans['행 수'] = spans['행 수'].astype('Int64')
+        st.sidebar.dataframe(spans, hide_index=True, use_container_width=True)
+
+    if len(history) > 1:
+        totals_ms = [h['total_ms'] for h in history]
+        st.sidebar.caption(f"최근 {len(totals_ms)}회 중앙값 {statistics.median(totals_ms):,.0f}ms · "
+                           f"최대 {max(totals_ms):,.0f}ms")
+    st.sidebar.caption(f"기록 파일: {TRACE_PATH}")
+
+def traced_page(page):
+    """페이지 main() 재실행 단위 기록 데코레이터 (끝나면 JSONL 저장, 성능 패널 표시)"""
+    def decorator(main):
+        if not TRACING:
+            return main
+
+        @functools.wraps(main)
+        def wrapper(*args, **kwargs):
+            trace = RerunTrace(page)
+            _local.trace = trace
+            try:
+                result = main(*args, **kwargs)
+            except BaseException as e:
+                # st.stop()/st.rerun()도 예외로 전달되므로 기록만 남기고 그대로 전달
+                trace.status = type(e).__name__
+                raise
+            finally:
+                _local.trace = None
+                trace.finish()
+                record = trace.to_dict()
+                write_trace(record)
+                remember(record)
+            show_panel(trace)
+            return result
+        return wrapper
+    return decorator